@@ -4,6 +4,7 @@ and citations information.
 """
 from typing import List, Union, Any
 import re
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
@@ -103,7 +104,7 @@ def duplicate_count(dataframe: pd.DataFrame) -> int:
 
 
 def missed_article_count(filter_sorted_citations_df: pd.DataFrame, downloaded_articles_path: str,
-                         title_column_name: str = "cleaned_title"):
+                         title_column_name: str = "cleaned_title", title_index: converter.TitleIndex = None):
     """return count of missed articles from downloading by checking original list of articles from
     filter_sorted_citations_df using downloaded articles path.
 
@@ -115,6 +116,8 @@ def missed_article_count(filter_sorted_citations_df: pd.DataFrame, downloaded_ar
         This dataframe contains records of selected articles including name of articles.
     downloaded_articles_path : str
         contains parent folder of all the downloaded articles files.
+    title_index : converter.TitleIndex
+        This is optional title index of citations. If given, files names are matched to titles by exact lookup first.
 
     Returns
     -------
@@ -126,6 +129,8 @@ def missed_article_count(filter_sorted_citations_df: pd.DataFrame, downloaded_ar
     validated_articles_list, invalidated_list, manual_list = validation.validating_pdfs_using_multiple_pdf_reader(
         downloaded_articles_path)
     articles_list = validation.getting_article_paths_from_validation_detail(validated_articles_list)
+    if title_index is not None:
+        return len(validation.finding_missed_articles_using_title_index(articles_list, original_list, title_index)[0])
     downloaded_list = [
         string_manipulation.preprocess_string(os_utils.get_filename_from_path(k))
         for k in articles_list]
@@ -706,6 +711,7 @@ class CitationAnalysis:
 
         """
         self.dataframe = dataframe
+        self.interned_authors = {}
 
     def publication_year_info(self, column_name: str = "year"):
         """shows how many articles are published each year.
@@ -761,14 +767,41 @@ class CitationAnalysis:
         else:
             print("Please provide text_manipulation_method_name value as 'seaborn' or 'pandas'.")
 
-    def authors_analysis(self, authors_column_name="authors"):
+    def get_interned_authors(self, authors_column_name: str = "authors", initials_only: bool = False) -> tuple:
+        """Provides author ids of all citations, numbers of authors of each citation and normalized author names. It is
+        calculated once for each column and reused by all authors analyses.
+
+        Parameters
+        ----------
+        authors_column_name : str
+            Name of column containing authors details.
+        initials_only : bool
+            If True, only first initial of given names is kept, check string_manipulation.normalize_author_name.
+
+        Returns
+        -------
+        tuple
+            flat array of author ids, array of number of authors of each citation and list of normalized author
+            names, check citation.intern_authors for more info.
+
+        """
+        interned_authors_key = (authors_column_name, initials_only)
+        if interned_authors_key not in self.interned_authors:
+            self.interned_authors[interned_authors_key] = citation.intern_authors(self.dataframe[authors_column_name],
+                                                                                  initials_only)
+        return self.interned_authors[interned_authors_key]
+
+    def authors_analysis(self, authors_column_name="authors", initials_only: bool = False):
         """generates the details based on pandas dataframe column of article authors. example- Number of authors,
-        Articles with single authors, Articles per authors, Authors per articles
+        Articles with single authors, Articles per authors, Authors per articles. Authors names are normalized so
+        'Smith, John' and 'John Smith' are counted as one author, and 'Smith, J.' too if initials_only is True.
 
         Parameters
         ----------
         authors_column_name : str
             Name of column containing authors details.
+        initials_only : bool
+            If True, only first initial of given names is kept, check string_manipulation.normalize_author_name.
 
         Returns
         -------
@@ -777,24 +810,44 @@ class CitationAnalysis:
 
         """
         number_of_articles = len(self.dataframe)
-        unique_author_names = set()
-        articles_with_single_authors = 0
-
-        for authors_list in self.dataframe[authors_column_name]:
-            if not isinstance(authors_list, list):
-                continue
+        author_ids, authors_counts, author_names = self.get_interned_authors(authors_column_name, initials_only)
+        articles_with_single_authors = int(np.count_nonzero(authors_counts == 1))
 
-            if len(authors_list) == 1:
-                articles_with_single_authors += 1
-            for authors in authors_list:
-                unique_author_names.add(authors)
-
-        number_of_authors = len(unique_author_names)
+        number_of_authors = len(author_names)
         articles_per_authors = number_of_articles / number_of_authors
         authors_per_articles = number_of_authors / number_of_articles
 
         return number_of_authors, articles_with_single_authors, articles_per_authors, authors_per_articles
 
+    def authors_articles_counts(self, authors_column_name: str = "authors", top_result: int = None,
+                                initials_only: bool = False) -> pd.Series:
+        """shows how many articles each author has written.
+
+        Parameters
+        ----------
+        authors_column_name : str
+            Name of column containing authors details.
+        top_result : int
+            This limits the number of authors to be shown
+        initials_only : bool
+            If True, only first initial of given names is kept, check string_manipulation.normalize_author_name.
+
+        Returns
+        -------
+        pd.Series
+            contains normalized author name and count of articles, sorted from most articles.
+
+        """
+        author_ids, authors_counts, author_names = self.get_interned_authors(authors_column_name, initials_only)
+        # same author written twice in one citation is counted once for the citation.
+        citation_positions = np.repeat(np.arange(len(authors_counts)), authors_counts)
+        pairs = np.sort(citation_positions * len(author_names) + author_ids)
+        citation_author_pairs = pairs[np.r_[True, pairs[1:] != pairs[:-1]]] if len(pairs) else pairs
+        articles_counts = np.bincount(citation_author_pairs % max(len(author_names), 1), minlength=len(author_names))
+        order = np.argsort(-articles_counts, kind="stable")[:top_result]
+        return pd.Series(articles_counts[order], index=[author_names[author_id] for author_id in order],
+                         name="articles")
+
     def authors_info(self):
         """prints the authors analysis details in nice format
 
@@ -3,12 +3,19 @@ This module contains functions which changes format or get details from citation
 typos.
 """
 
+import os
 import re
+import zlib
 from typing import Literal, List, Dict, Any, Union
 
+import numpy as np
 import pandas as pd
 from systematic_review import string_manipulation, search_count
-from systematic_review import converter
+from systematic_review import converter, os_utils
+
+minhash_prime = (1 << 31) - 1
+doi_prefix_pattern = re.compile(r"^(https?://)?(dx\.)?(doi\.org/)|^doi:\s*")
+pmid_prefix_pattern = re.compile(r"^pmid:?\s*", re.IGNORECASE)
 
 
 def citations_to_ris_converter(input_file_path: str, output_filename: str = "output_ris_file.ris",
@@ -32,7 +39,7 @@ def citations_to_ris_converter(input_file_path: str, output_filename: str = "out
     None
 
     """
-    df = getattr(pd, input_file_type)(input_file_path)
+    df = next(converter.iter_tabular_file_chunks(input_file_path, input_file_type, chunksize=5), pd.DataFrame())
 
     pd.set_option("display.max_columns", None)
     print(df.head())
@@ -47,27 +54,56 @@ def citations_to_ris_converter(input_file_path: str, output_filename: str = "out
     url = input("provide name of URL column")
     doi = input("provide name of Item DOI column")
 
-    number_of_records = len(df)
-    output_file = open(output_filename, "a")
-    for index in range(number_of_records):
-        output_file.write(f"TY  - {article_type}\n")
-        output_file.write("AU  - " + str(df.iloc[index][authors]) + "\n")
-        output_file.write("PY  - " + str(df.iloc[index][publication_year]) + "\n")
-        output_file.write("TI  - " + str(df.iloc[index][item_title]) + "\n")
-        output_file.write("JO  - " + str(df.iloc[index][publication_title]) + "\n")
-        output_file.write("VL  - " + str(df.iloc[index][journal_volume]) + "\n")
-        output_file.write("IS  - " + str(df.iloc[index][journal_issue]) + "\n")
-        output_file.write("UR  - " + str(df.iloc[index][url]) + "\n")
-        output_file.write("DO  - " + str(df.iloc[index][doi]) + "\n")
-        output_file.write("ER -" + "\n")
-        # \n is placed to indicate EOL (End of Line)
-    output_file.close()
+    ris_tags_columns_mapping = {"AU": authors, "PY": publication_year, "TI": item_title, "JO": publication_title,
+                                "VL": journal_volume, "IS": journal_issue, "UR": url, "DO": doi}
+    tabular_citations_to_ris_file(input_file_path, ris_tags_columns_mapping, output_filename, article_type,
+                                  input_file_type, permission="a")
     print("ris file has been generated")
 
 
+def tabular_citations_to_ris_file(input_file_path: str, ris_tags_columns_mapping: Dict[str, str],
+                                  output_filename: str = "output_ris_file.ris", article_type: str = "JOUR",
+                                  input_file_type: str = "read_csv", chunksize: int = 100000,
+                                  permission: str = "w") -> int:
+    """Convert tabular citations data to ris format chunk by chunk. Only mapped columns are read and records are
+    written as they are read, so memory use stays same for exports of any size.
+
+    Parameters
+    ----------
+    input_file_path : str
+        this is the path of input file
+    ris_tags_columns_mapping : Dict[str, str]
+        This contains ris tag as key and column name of input file as value, in the order tags are written. Empty
+        values are not written. Example - {"AU": "Authors", "PY": "Year", "TI": "Title", "DO": "DOI"}
+    output_filename : str
+        this is the name of the output ris file with extension. output file path is also valid choice.
+    article_type : str
+        This is value of TY tag for all citations. JOUR for journal articles.
+    input_file_type : str
+        this function default is csv but other formats are also supported by putting 'read_{file_type}'. such as
+        input_file_type = 'read_excel'. for more info visit-
+        https://pandas.pydata.org/pandas-docs/stable/user_guide/io.html
+    chunksize : int
+        number of rows read and written at once.
+    permission : str
+        These are the os permissions given for the output file. 'w' to overwrite and 'a' to append.
+
+    Returns
+    -------
+    int
+        This is the number of citations written.
+
+    """
+    usecols = list(dict.fromkeys(column_name for column_name in ris_tags_columns_mapping.values() if column_name))
+    with converter.RisFileWriter(output_filename, ris_tags_columns_mapping, article_type, permission) as ris_writer:
+        for chunk in converter.iter_tabular_file_chunks(input_file_path, input_file_type, chunksize, usecols, str):
+            ris_writer.write_dataframe(chunk, chunksize)
+        return ris_writer.number_of_records
+
+
 def edit_ris_citation_paste_values_after_regex_pattern(input_file_path: str, output_filename: str = "output_file.ris",
-                                                       edit_line_regex: str = r'^DO ', paste_value: str = "ER  - ") \
-        -> None:
+                                                       edit_line_regex: str = r'^DO ', paste_value: str = "ER  - ",
+                                                       permission: str = "w") -> None:
     """
     This is created to edit ris files which doesn't specify ER for 'end of citations' and paste ER after end point of
     citation, replace 'DO' with other ris classifiers such as TY, JO etc.
@@ -82,25 +118,63 @@ def edit_ris_citation_paste_values_after_regex_pattern(input_file_path: str, out
         this is the regex to find ris classifiers lines such as DO, TY, JO etc.
     paste_value : str
         this is value to be pasted, most helpful is ER ris classifier which signify citation end.
+    permission : str
+        These are the os permissions given for the output file. 'w' to overwrite and 'a' to append.
 
     Returns
     -------
     None
 
     """
-    input_file = open(input_file_path, "r")
-    output_file = open(output_filename, "a")
-    for line in input_file:
-        output_file.write(line)
-        if re.match(edit_line_regex, line):
-            output_file.write(f"{paste_value}\n")
+    edit_line_pattern = re.compile(edit_line_regex)
+    paste_line = f"{paste_value}\n"
+    with open(input_file_path, "r") as input_file, open(output_filename, permission,
+                                                         buffering=8 * 1024 * 1024) as output_file:
+        for lines in iter(lambda: input_file.readlines(8 * 1024 * 1024), []):
+            output_file.write("".join([line + paste_line if edit_line_pattern.match(line) else line
+                                       for line in lines]))
+
 
-    input_file.close()
-    output_file.close()
+def create_article_name_index_from_citations(sources_name_citations_path_list_of_dict: list,
+                                              title_column_name: str = "title") -> Dict[str, Dict[str, Any]]:
+    """Creates hash map from preprocessed citation title to its source name, doi and url. Each citation title is
+    preprocessed only once, so looking up any number of articles afterwards does not scan the citations again.
+
+    Parameters
+    ----------
+    sources_name_citations_path_list_of_dict : list
+        This is the list of all the sources names and it's citations at dir_path.
+        Examples - [['sources_name', [citation_dict, ...]], ...]
+    title_column_name : str
+        This is the name of column which contain citation title
+
+    Returns
+    -------
+    Dict[str, Dict[str, Any]]
+        This contains preprocessed title as key and dict of source_name and optional doi and url as value. If same
+        title is in many sources then first source is kept. Example - {'article name': {'source_name': 'scopus', 'doi':
+        '10.1000/xyz', 'url': 'https://...'}, ...}
+
+    """
+    article_name_index = {}
+    for source_name, citations in sources_name_citations_path_list_of_dict:
+        for citations_dict in citations:
+            if title_column_name not in citations_dict:
+                continue
+            article_name = string_manipulation.preprocess_string(citations_dict[title_column_name])
+            if article_name in article_name_index:
+                continue
+            article_details = {"source_name": source_name}
+            for column_name in ("doi", "url"):
+                if column_name in citations_dict:
+                    article_details[column_name] = citations_dict[column_name]
+            article_name_index[article_name] = article_details
+    return article_name_index
 
 
 def get_details_via_article_name_from_citations(article_name: str, sources_name_citations_path_list_of_dict: list,
-                                                doi_url: bool = False, title_column_name: str = "title") -> dict:
+                                                doi_url: bool = False, title_column_name: str = "title",
+                                                article_name_index: Dict[str, Dict[str, Any]] = None) -> dict:
     """Iterate through citations and find article_name and put source_name in column, with doi and url being optional
 
     Parameters
@@ -114,6 +188,9 @@ def get_details_via_article_name_from_citations(article_name: str, sources_name_
         This signify if we want to get the value of url and doi from citation
     title_column_name : str
         This is the name of column which contain citation title
+    article_name_index : Dict[str, Dict[str, Any]]
+        This is optional output of create_article_name_index_from_citations. If given, article is looked up in it
+        instead of iterating through citations.
 
     Returns
     -------
@@ -121,6 +198,19 @@ def get_details_via_article_name_from_citations(article_name: str, sources_name_
         This dict contains the article_name, source_name and optional url and doi
 
     """
+    if article_name_index is not None:
+        article_details = article_name_index.get(article_name)
+        if article_details is None:
+            return None
+        article_title_source_name_dict = {"article_name": article_name, "source_name": article_details["source_name"]}
+        if doi_url:
+            if ("doi" in article_details) and ("url" in article_details):
+                article_title_source_name_dict["doi"] = article_details["doi"]
+                article_title_source_name_dict["url"] = article_details["url"]
+            else:
+                print("doi or url not present")
+        return article_title_source_name_dict
+
     for citations in sources_name_citations_path_list_of_dict[1]:
         if article_name == string_manipulation.preprocess_string(citations[title_column_name]):
             article_title_source_name_dict = {"article_name": article_name,
@@ -147,8 +237,8 @@ def get_details_of_all_article_name_from_citations(filtered_list_of_dict: list,
     filtered_list_of_dict : list
         This is the list of article citations dict after filtering it using min_limit on grouped_keywords_count
     sources_name_citations_path_list_of_dict : list
-        This is the list of all the sources names and it's citations at dir_path.
-        Examples - {'sources_name': 'all source articles citations', ...}
+        This is the list of all the sources names and it's citations at dir_path, output of
+        os_utils.get_sources_name_citations_mapping. Examples - [['sources_name', [citation_dict, ...]], ...]
     doi_url : bool
         This signify if we want to get the value of url and doi from citation
     title_column_name : str
@@ -161,17 +251,66 @@ def get_details_of_all_article_name_from_citations(filtered_list_of_dict: list,
 
     """
     all_articles_title_source_name_list_of_dict = []
+    article_name_index = create_article_name_index_from_citations(sources_name_citations_path_list_of_dict,
+                                                                  title_column_name)
 
     for article_details in filtered_list_of_dict:
         article_name = article_details[title_column_name]
         print("article: ", article_name)
         articles_title_source_name_dict = get_details_via_article_name_from_citations(
-            article_name, sources_name_citations_path_list_of_dict, doi_url)
+            article_name, sources_name_citations_path_list_of_dict, doi_url, title_column_name, article_name_index)
         all_articles_title_source_name_list_of_dict.append(articles_title_source_name_dict)
 
     return all_articles_title_source_name_list_of_dict
 
 
+def get_details_of_all_article_name_from_citations_dataframe(filtered_list_of_dict: list,
+                                                             citations_dataframe: pd.DataFrame,
+                                                             title_index: converter.TitleIndex,
+                                                             doi_url: bool = False,
+                                                             title_column_name: str = "cleaned_title") -> list:
+    """This function finds source names, doi, and url for all articles in filtered_list_of_dict using title index of
+    deduplicated citations dataframe, so citations files are not loaded and titles are not normalized again.
+
+    Parameters
+    ----------
+    filtered_list_of_dict : list
+        This is the list of article citations dict after filtering it using min_limit on grouped_keywords_count
+    citations_dataframe : pd.DataFrame
+        This is the output of Citations.create_citations_dataframe which title_index refers to.
+    title_index : converter.TitleIndex
+        This is the output of Citations.create_title_index.
+    doi_url : bool
+        This signify if we want to get the value of url and doi from citation
+    title_column_name : str
+        This is the name of column which contain normalized citation title
+
+    Returns
+    -------
+    list
+        This list contains all article names with source names. (optional url and doi), None if article is not found.
+
+    """
+    all_articles_title_source_name_list_of_dict = []
+    for article_details in filtered_list_of_dict:
+        article_name = article_details[title_column_name]
+        record_id = title_index.get(article_name, normalized=True)
+        if record_id is None:
+            all_articles_title_source_name_list_of_dict.append(None)
+            continue
+        citation = citations_dataframe.iloc[record_id]
+        article_title_source_name_dict = {"article_name": article_name, "source_name": citation["source"]}
+        if doi_url:
+            if ("doi" in citation) and ("url" in citation):
+                article_title_source_name_dict["doi"] = citation["doi"]
+                article_title_source_name_dict["url"] = citation["url"]
+            else:
+                print("doi or url not present")
+        all_articles_title_source_name_list_of_dict.append(article_title_source_name_dict)
+
+    return all_articles_title_source_name_list_of_dict
+
+
 def get_missed_articles_source_names(missed_articles_list: list, all_articles_title_source_name_list_of_dict: list,
                                      article_column_name: str = "article_name",
                                      source_column_name: str = "source_name") -> list:
@@ -272,9 +411,66 @@ def add_multiple_sources_column(citation_dataframe: pd.DataFrame, group_by: list
     return citation_dataframe_with_multiple_sources_column
 
 
+def citation_value_to_text(value: Any) -> str:
+    """Convert value of citation field to text. List fields like keywords are joined with spaces instead of python
+    representation and missing values are empty. Example - ['deep learning', 'review'] -> 'deep learning review'
+
+    Parameters
+    ----------
+    value : Any
+        This is value of citation field like title, abstract or keywords.
+
+    Returns
+    -------
+    str
+        This is text of value.
+
+    """
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return " ".join(text for text in map(citation_value_to_text, value) if text)
+    if value is None or (isinstance(value, float) and value != value):
+        return ""
+    return str(value)
+
+
+def get_citation_texts(dataframe_object: pd.DataFrame, columns_name: list = ["title", "abstract", "keywords"],
+                       string_dtype: str = None) -> pd.Series:
+    """Create citation text by joining fields of each citation row with spaces. Each field is converted to text once
+    and fields are joined column by column on whole arrays, adding space only between non-empty texts.
+    Missing values like None and NaN are empty strings now, earlier they were joined as 'nan' text. So citation text
+    of citation without abstract does not contain 'nan' word and it is not counted for search word 'nan'.
+
+    Parameters
+    ----------
+    dataframe_object : pandas.DataFrame object
+        this is the object of famous python library pandas. for more lemma_info: https://pandas.pydata.org/docs/
+    columns_name : list
+        These are the name of columns joined in order. Missing columns are ignored.
+    string_dtype : str
+        This is pandas dtype of output. Default None gives python object strings. 'string[pyarrow]' gives Arrow string
+        array which needs pyarrow.
+
+    Returns
+    -------
+    pd.Series
+        This contains citation text of each row.
+
+    """
+    citation_texts = np.full(len(dataframe_object), "", dtype=object)
+    for column_name in columns_name:
+        if column_name not in dataframe_object.columns:
+            continue
+        column_texts = dataframe_object[column_name].map(citation_value_to_text).to_numpy(dtype=object)
+        separators = np.where((citation_texts != "") & (column_texts != ""), " ", "").astype(object)
+        citation_texts = citation_texts + separators + column_texts
+    return pd.Series(citation_texts, index=dataframe_object.index, dtype=string_dtype or object)
+
+
 def add_citation_text_column(dataframe_object: pd.DataFrame, title_column_name: str = "title",
                              abstract_column_name: str = "abstract",
-                             keyword_column_name: str = "keywords") -> pd.DataFrame:
+                             keyword_column_name: str = "keywords", string_dtype: str = None) -> pd.DataFrame:
     """This takes dataframe of citations and return the full text comprises of "title", "abstract",
     "search_words_object"
 
@@ -288,6 +484,8 @@ def add_citation_text_column(dataframe_object: pd.DataFrame, title_column_name:
         This is the name of column which contain citation abstract
     keyword_column_name : str
         This is the name of column which contain citation search_words_object
+    string_dtype : str
+        This is pandas dtype of citation text column. 'string[pyarrow]' gives Arrow strings.
 
     Returns
     -------
@@ -295,8 +493,8 @@ def add_citation_text_column(dataframe_object: pd.DataFrame, title_column_name:
         this is dataframe_object comprises of full text column.
 
     """
-    dataframe_object["citation_text"] = dataframe_object[title_column_name].astype(str) + " " + dataframe_object[
-        abstract_column_name].astype(str) + " " + dataframe_object[keyword_column_name].astype(str)
+    dataframe_object["citation_text"] = get_citation_texts(dataframe_object, [title_column_name, abstract_column_name,
+                                                                              keyword_column_name], string_dtype)
 
     return dataframe_object
 
@@ -333,9 +531,660 @@ def drop_duplicates_citations(citation_dataframe: pd.DataFrame, subset: list = [
     return clean_df
 
 
+def drop_duplicates_citations_add_sources_column(citation_dataframe: pd.DataFrame, subset: list = ['title', 'year'],
+                                                 source_column_name: str = "source",
+                                                 sources_column_name: str = "multiple_sources",
+                                                 sources_format: Literal["list", "categorical", "bitmask"] = "list",
+                                                 index_reset: bool = True) -> pd.DataFrame:
+    """Remove duplicate citations and add column of sources names of each citation in one hashing pass. It keeps same
+    rows as add_multiple_sources_column followed by drop_duplicates_citations with keep='first' but it does not merge
+    sources back to the full dataframe, so only deduplicated dataframe is created.
+
+    Sources column differs from add_multiple_sources_column, which repeats a source once per duplicate row. Here each
+    source is listed once per citation, in order of first appearance of sources in citation_dataframe. Example - three
+    duplicates from 'scopus', 'scopus' and 'wos' give ['scopus', 'wos'] instead of ['scopus', 'scopus', 'wos'].
+    Citations with missing values in subset are also grouped together instead of getting missing sources.
+
+    Parameters
+    ----------
+    citation_dataframe : pandas.DataFrame object
+        Input dataset which contains duplicate rows
+    subset : list
+        column label or sequence of labels to identify duplicates. Missing values are considered equal.
+    source_column_name : str
+        This is the name of column which contain source name of citation.
+    sources_column_name : str
+        This is the name of added column.
+    sources_format : str
+        options includes {'list', 'categorical', 'bitmask'}, default 'list'.
+        - ``list`` : list of sources names like ['scopus', 'wos'].
+        - ``categorical`` : sources names joined with ', ' as pandas categorical, as few combinations of sources exist.
+        - ``bitmask`` : integer with bit i set if citation is in i-th source of get_sources_names_of_citations(). Up
+          to 64 sources are supported.
+    index_reset : bool
+        It resets the index of output dataframe.
+
+    Returns
+    -------
+    pandas.DataFrame object
+        DataFrame with duplicates removed and additional column of sources names
+
+    """
+    group_codes = citation_dataframe.groupby(subset, sort=False, dropna=False).ngroup().to_numpy()
+    source_codes, sources_names = pd.factorize(citation_dataframe[source_column_name])
+    number_of_groups = group_codes.max() + 1 if len(group_codes) else 0
+
+    _, first_positions = np.unique(group_codes, return_index=True)
+    clean_df = citation_dataframe.iloc[first_positions]
+
+    if len(sources_names) <= 64:
+        sources_bitmasks = np.zeros(number_of_groups, dtype=np.uint64)
+        valid = source_codes >= 0
+        np.bitwise_or.at(sources_bitmasks, group_codes[valid],
+                         np.left_shift(np.uint64(1), source_codes[valid].astype(np.uint64)))
+        if sources_format == "bitmask":
+            sources_values = sources_bitmasks
+        else:
+            sources_values = sources_bitmask_to_list(pd.Series(sources_bitmasks), list(sources_names)).tolist()
+    elif sources_format == "bitmask":
+        raise ValueError(f"bitmask supports up to 64 sources, got {len(sources_names)}")
+    else:
+        group_sources = pd.DataFrame({"group": group_codes,
+                                      "source": citation_dataframe[source_column_name].to_numpy()})
+        group_sources = group_sources.dropna().drop_duplicates().groupby("group", sort=True)["source"].agg(list)
+        sources_values = [sources if isinstance(sources, list) else []
+                          for sources in group_sources.reindex(range(number_of_groups))]
+    if sources_format == "categorical":
+        sources_values = pd.Categorical([", ".join(sources) for sources in sources_values])
+
+    clean_df = clean_df.assign(**{sources_column_name: sources_values})
+    return clean_df.reset_index(drop=True) if index_reset else clean_df
+
+
+def get_sources_names_of_citations(citation_dataframe: pd.DataFrame, source_column_name: str = "source") -> list:
+    """Provides sources names in order used for bits of bitmask by drop_duplicates_citations_add_sources_column.
+
+    Parameters
+    ----------
+    citation_dataframe : pandas.DataFrame object
+        Input dataset before duplicates are removed.
+    source_column_name : str
+        This is the name of column which contain source name of citation.
+
+    Returns
+    -------
+    list
+        This is the list of sources names in order of first appearance.
+
+    """
+    return list(pd.unique(citation_dataframe[source_column_name].dropna()))
+
+
+def sources_bitmask_to_list(sources_bitmasks: pd.Series, sources_names: list) -> pd.Series:
+    """Convert sources bitmask column to lists of sources names. Each distinct bitmask is decoded only once.
+
+    Parameters
+    ----------
+    sources_bitmasks : pd.Series
+        This is the bitmask column created by drop_duplicates_citations_add_sources_column.
+    sources_names : list
+        This is the output of get_sources_names_of_citations.
+
+    Returns
+    -------
+    pd.Series
+        This contains list of sources names of each citation.
+
+    """
+    decoded_bitmasks = {bitmask: [name for bit, name in enumerate(sources_names) if int(bitmask) >> bit & 1]
+                        for bitmask in pd.unique(sources_bitmasks)}
+    return sources_bitmasks.map(decoded_bitmasks)
+
+
+def normalize_doi(doi: Any) -> str:
+    """Normalize DOI to compare it between sources. Example - 'https://doi.org/10.1000/ABC.1 ' -> '10.1000/abc.1'
+
+    Parameters
+    ----------
+    doi : Any
+        This is DOI string which can have resolver url or 'doi:' prefix.
+
+    Returns
+    -------
+    str
+        This is lowercase DOI starting with '10.', empty string if doi is not valid.
+
+    """
+    if not isinstance(doi, str):
+        return ""
+    doi = doi_prefix_pattern.sub("", doi.strip().lower()).strip()
+    return doi if doi.startswith("10.") and "/" in doi else ""
+
+
+def normalize_pmid(pmid: Any) -> str:
+    """Normalize PubMed identifier. Example - 'PMID: 12345678' -> '12345678'
+
+    Parameters
+    ----------
+    pmid : Any
+        This is PubMed identifier which can have 'PMID' prefix.
+
+    Returns
+    -------
+    str
+        This is PubMed identifier without leading zeros, empty string if pmid is not valid like other accession numbers.
+
+    """
+    if isinstance(pmid, (int, float)) and pmid == pmid:
+        pmid = str(int(pmid))
+    if not isinstance(pmid, str):
+        return ""
+    pmid = pmid_prefix_pattern.sub("", pmid.strip())
+    return pmid.lstrip("0") if pmid.isdigit() and len(pmid) <= 9 and pmid.strip("0") else ""
+
+
+def normalize_isbn(isbn: Any) -> str:
+    """Normalize ISBN to ISBN-13 digits so both ISBN formats of same book are equal. ISSN of journals are ignored as
+    they are shared by all articles of journal. Example - '0-306-40615-2' -> '9780306406157'
+
+    Parameters
+    ----------
+    isbn : Any
+        This is ISBN-10 or ISBN-13 string with or without hyphens.
+
+    Returns
+    -------
+    str
+        This is ISBN-13, empty string if isbn is not valid.
+
+    """
+    if not isinstance(isbn, str):
+        return ""
+    isbn = isbn.split()[0].replace("-", "").upper() if isbn.split() else ""
+    if len(isbn) == 10 and isbn[:9].isdigit() and (isbn[9].isdigit() or isbn[9] == "X"):
+        isbn = "978" + isbn[:9]
+        check_digit = (10 - sum(int(digit) * (3 if index % 2 else 1) for index, digit in enumerate(isbn)) % 10) % 10
+        return isbn + str(check_digit)
+    return isbn if len(isbn) == 13 and isbn.isdigit() and isbn[:3] in ("978", "979") else ""
+
+
+identifier_columns_normalizers = {"doi": normalize_doi, "accession_number": normalize_pmid, "issn": normalize_isbn}
+
+
+def get_normalized_title_year_keys(citation_dataframe: pd.DataFrame, title_column_name: str = "title",
+                                   year_column_name: str = "year") -> pd.Series:
+    """Create key of lowercase title words and year for each citation. Digits and non-latin letters are kept so
+    numbered titles stay different. Example - ('Web 2.0: Deep Nets!', '2020') -> 'web 2 0 deep nets|2020'
+
+    Parameters
+    ----------
+    citation_dataframe : pandas.DataFrame object
+        Input dataset of citations.
+    title_column_name : str
+        This is the name of column which contain citation title
+    year_column_name : str
+        This is the name of column which contain citation year
+
+    Returns
+    -------
+    pd.Series
+        This contains title and year key of each citation, empty string if citation has no title.
+
+    """
+    titles = citation_dataframe[title_column_name].astype("string").str.lower()
+    titles = titles.str.replace(r"[\W_]+", " ", regex=True).str.strip().fillna("")
+    if year_column_name in citation_dataframe.columns:
+        years = citation_dataframe[year_column_name].astype("string").str.extract(r"(\d{4})", expand=False).fillna("")
+    else:
+        years = pd.Series("", index=citation_dataframe.index)
+    return (titles + "|" + years).where(titles != "", "")
+
+
+def get_normalized_identifiers(citation_dataframe: pd.DataFrame,
+                               identifier_columns_normalizers_dict: dict = None) -> pd.DataFrame:
+    """Normalize identifier columns of citations like DOI, PMID and ISBN.
+
+    Parameters
+    ----------
+    citation_dataframe : pandas.DataFrame object
+        Input dataset of citations.
+    identifier_columns_normalizers_dict : dict
+        This maps identifier column name to its normalizer function. Missing columns are ignored. Default is
+        identifier_columns_normalizers which uses 'doi', 'accession_number'(PMID) and 'issn'(ISBN) columns of rispy.
+
+    Returns
+    -------
+    pd.DataFrame
+        This contains normalized identifier columns available in citation_dataframe, empty string for missing values.
+
+    """
+    if identifier_columns_normalizers_dict is None:
+        identifier_columns_normalizers_dict = identifier_columns_normalizers
+    return pd.DataFrame({column_name: citation_dataframe[column_name].map(normalizer)
+                         for column_name, normalizer in identifier_columns_normalizers_dict.items()
+                         if column_name in citation_dataframe.columns}, index=citation_dataframe.index)
+
+
+def get_identifier_duplicate_keys(citation_dataframe: pd.DataFrame, identifier_columns_normalizers_dict: dict = None,
+                                  title_column_name: str = "title", year_column_name: str = "year") -> np.ndarray:
+    """Block citations on normalized DOI, PMID and ISBN. Citations sharing any identifier get same key, even if they
+    share different identifiers with different citations. Citations without any identifier fall back to normalized
+    title and year, and they join citation with identifier if it has same title and year. Each identifier is grouped
+    with hashing so this is linear time.
+
+    Parameters
+    ----------
+    citation_dataframe : pandas.DataFrame object
+        Input dataset which contains duplicate rows
+    identifier_columns_normalizers_dict : dict
+        This maps identifier column name to its normalizer function. Missing columns are ignored. Default is
+        identifier_columns_normalizers which uses 'doi', 'accession_number'(PMID) and 'issn'(ISBN) columns of rispy.
+    title_column_name : str
+        This is the name of column which contain citation title
+    year_column_name : str
+        This is the name of column which contain citation year
+
+    Returns
+    -------
+    np.ndarray
+        This contains duplicate key of each citation which is the position of first citation with same key.
+
+    """
+    number_of_citations = len(citation_dataframe)
+    keys = np.arange(number_of_citations)
+    has_identifier = np.zeros(number_of_citations, dtype=bool)
+
+    identifiers_codes = []
+    normalized_identifiers_df = get_normalized_identifiers(citation_dataframe, identifier_columns_normalizers_dict)
+    for column_name, normalized_identifiers in normalized_identifiers_df.items():
+        codes, _ = pd.factorize(normalized_identifiers.where(normalized_identifiers != ""))
+        identifiers_codes.append(codes)
+        has_identifier |= codes >= 0
+
+    # records can share different identifiers so keys are propagated until every identifier group has one key.
+    changed = bool(identifiers_codes)
+    while changed:
+        changed = False
+        for codes in identifiers_codes:
+            valid = codes >= 0
+            group_min_keys = np.full(codes.max() + 1 if valid.any() else 0, number_of_citations)
+            np.minimum.at(group_min_keys, codes[valid], keys[valid])
+            new_keys = keys.copy()
+            new_keys[valid] = np.minimum(keys[valid], group_min_keys[codes[valid]])
+            new_keys = new_keys[new_keys]
+            if not np.array_equal(new_keys, keys):
+                keys, changed = new_keys, True
+
+    title_year_keys = get_normalized_title_year_keys(citation_dataframe, title_column_name, year_column_name)
+    codes, _ = pd.factorize(title_year_keys.where(title_year_keys != ""))
+    with_title = codes >= 0
+    group_keys = np.full(codes.max() + 1 if with_title.any() else 0, number_of_citations)
+    # citations with identifier come first so title and year group key is of citation with identifier if exists.
+    for candidates in (with_title & has_identifier, with_title & ~has_identifier):
+        unassigned = candidates & (group_keys[np.maximum(codes, 0)] == number_of_citations)
+        np.minimum.at(group_keys, codes[unassigned], keys[unassigned])
+    fallback = with_title & ~has_identifier
+    keys[fallback] = group_keys[codes[fallback]]
+    return keys
+
+
+def drop_duplicates_citations_on_identifiers(citation_dataframe: pd.DataFrame,
+                                             identifier_columns_normalizers_dict: dict = None,
+                                             title_column_name: str = "title", year_column_name: str = "year",
+                                             index_reset: bool = True) -> pd.DataFrame:
+    """Return DataFrame with duplicate citations removed using DOI, PMID and ISBN and title with year for citations
+    without identifiers. First citation of duplicates is kept.
+
+    Parameters
+    ----------
+    citation_dataframe : pandas.DataFrame object
+        Input dataset which contains duplicate rows
+    identifier_columns_normalizers_dict : dict
+        This maps identifier column name to its normalizer function.
+    title_column_name : str
+        This is the name of column which contain citation title
+    year_column_name : str
+        This is the name of column which contain citation year
+    index_reset : bool
+        It resets the index of output dataframe.
+
+    Returns
+    -------
+    pandas.DataFrame object
+        DataFrame with duplicates removed
+
+    """
+    keys = get_identifier_duplicate_keys(citation_dataframe, identifier_columns_normalizers_dict, title_column_name,
+                                         year_column_name)
+    clean_df = citation_dataframe[keys == np.arange(len(keys))]
+    return clean_df.reset_index(drop=True) if index_reset else clean_df
+
+
+def intern_authors(authors_series: pd.Series, initials_only: bool = False) -> tuple:
+    """Assign integer id to each normalized author name. Each distinct raw name is normalized only once and authors of
+    all citations are stored in one flat array of ids, so author statistics can be calculated with numpy.
+
+    Parameters
+    ----------
+    authors_series : pd.Series
+        This contains list of authors names of each citation, like 'authors' column of citations loaded by rispy.
+        Values which are not list are considered as no authors, and entries which are not string are removed.
+    initials_only : bool
+        If True, only first initial of given names is kept, check string_manipulation.normalize_author_name.
+
+    Returns
+    -------
+    tuple
+        flat array of author ids of all citations in order, array of number of author ids of each citation and list of
+        normalized author names where author id is the position. Authors of citation i are
+        author_ids[offsets[i]:offsets[i + 1]] where offsets is cumulative sum of numbers of authors starting at 0.
+
+    """
+    # None or NaN inside authors list would get factorize code -1, so only strings are kept.
+    authors_lists = [[author for author in authors if isinstance(author, str)] if isinstance(authors, list) else []
+                     for authors in authors_series]
+    raw_names = [author for authors in authors_lists for author in authors]
+    raw_codes, unique_raw_names = pd.factorize(pd.Series(raw_names, dtype=object))
+    normalized_unique_names = [string_manipulation.normalize_author_name(author, initials_only)
+                               for author in unique_raw_names]
+    unique_author_ids, author_names = pd.factorize(pd.Series(normalized_unique_names, dtype=object))
+    author_ids = unique_author_ids[raw_codes] if len(raw_codes) else np.empty(0, dtype=np.int64)
+
+    # names without letters get id -1 and are removed from their citations.
+    empty_name_ids = np.flatnonzero(author_names == "")
+    authors_counts = np.fromiter(map(len, authors_lists), dtype=np.int64, count=len(authors_lists))
+    if len(empty_name_ids):
+        is_empty_name = author_ids == empty_name_ids[0]
+        citation_positions = np.repeat(np.arange(len(authors_lists)), authors_counts)
+        authors_counts = authors_counts - np.bincount(citation_positions[is_empty_name],
+                                                      minlength=len(authors_lists))
+        author_ids = author_ids[~is_empty_name]
+        author_ids = author_ids - (author_ids > empty_name_ids[0])
+        author_names = author_names.delete(empty_name_ids[0])
+    return author_ids, authors_counts, list(author_names)
+
+
+def add_author_ids_column(citation_dataframe: pd.DataFrame, authors_column_name: str = "authors",
+                          author_ids_column_name: str = "author_ids", initials_only: bool = False) -> tuple:
+    """Add column with array of author ids of each citation. Same author written differently like 'Smith, John' and
+    'John Smith' gets same id, and 'Smith, J.' too if initials_only is True.
+
+    Parameters
+    ----------
+    citation_dataframe : pandas.DataFrame object
+        Input dataset of citations.
+    authors_column_name : str
+        This is the name of column which contain list of authors names.
+    author_ids_column_name : str
+        This is the name of added column.
+    initials_only : bool
+        If True, only first initial of given names is kept, check string_manipulation.normalize_author_name.
+
+    Returns
+    -------
+    tuple
+        DataFrame with additional column and list of normalized author names where author id is the position.
+
+    """
+    author_ids, authors_counts, author_names = intern_authors(citation_dataframe[authors_column_name], initials_only)
+    authors_offsets = np.concatenate([[0], np.cumsum(authors_counts)])
+    citations_author_ids = [author_ids[start:end] for start, end in zip(authors_offsets[:-1], authors_offsets[1:])]
+    return citation_dataframe.assign(**{author_ids_column_name: citations_author_ids}), author_names
+
+
+def get_text_shingles_hashes(text: str, shingle_size: int = 5) -> np.ndarray:
+    """Preprocess text and return the hashes of its unique character shingles (substrings of length shingle_size).
+    Shingles make small changes in punctuation, spacing or single words change only a few elements of the set.
+
+    Parameters
+    ----------
+    text : str
+        This is the citation text like title with abstract.
+    shingle_size : int
+        This is the number of characters in one shingle.
+
+    Returns
+    -------
+    np.ndarray
+        This is the array of unique 32 bit hashes of shingles. It is empty if text has no words.
+
+    """
+    text = string_manipulation.preprocess_string_to_space_separated_words(text).strip()
+    if not text:
+        return np.empty(0, dtype=np.uint64)
+    if len(text) <= shingle_size:
+        shingles = {text}
+    else:
+        shingles = {text[index:index + shingle_size] for index in range(len(text) - shingle_size + 1)}
+    return np.fromiter((zlib.crc32(shingle.encode("utf-8")) for shingle in shingles), dtype=np.uint64,
+                       count=len(shingles))
+
+
+def minhash_signatures(texts: List[str], num_perm: int = 128, shingle_size: int = 5, seed: int = 1) -> np.ndarray:
+    """Calculate MinHash signature of each text. Fraction of equal values in two signatures estimates Jaccard similarity
+    of their shingles sets. for more info visit- https://en.wikipedia.org/wiki/MinHash
+
+    Parameters
+    ----------
+    texts : List[str]
+        This is the list of citation texts.
+    num_perm : int
+        This is the number of hash functions, it is the length of each signature.
+    shingle_size : int
+        This is the number of characters in one shingle.
+    seed : int
+        This is the seed of random hash functions. Signatures are only comparable if created with same seed.
+
+    Returns
+    -------
+    np.ndarray
+        This is the signature matrix of shape (number of texts, num_perm). Texts without words have signature of
+        maximum values.
+
+    """
+    random_state = np.random.RandomState(seed)
+    multipliers = random_state.randint(1, minhash_prime, size=num_perm, dtype=np.uint64)
+    increments = random_state.randint(0, minhash_prime, size=num_perm, dtype=np.uint64)
+
+    signatures = np.full((len(texts), num_perm), minhash_prime, dtype=np.uint64)
+    for text_index, text in enumerate(texts):
+        shingles_hashes = get_text_shingles_hashes(text, shingle_size) % minhash_prime
+        if len(shingles_hashes):
+            permuted_hashes = (np.outer(shingles_hashes, multipliers) + increments) % minhash_prime
+            signatures[text_index] = permuted_hashes.min(axis=0)
+    return signatures.astype(np.uint32)
+
+
+def lsh_bands_and_rows(num_perm: int, threshold: float) -> tuple:
+    """Choose locality-sensitive hashing bands and rows per band for similarity threshold. Signatures sharing all rows
+    of any band become candidates, and similarity where this has 50% probability is about (1 / bands) ** (1 / rows).
+
+    Parameters
+    ----------
+    num_perm : int
+        This is the length of each signature.
+    threshold : float
+        This is the Jaccard similarity above which texts are near duplicates. between 0 and 1.
+
+    Returns
+    -------
+    tuple
+        number of bands and number of rows per band.
+
+    """
+    bands_and_rows = [(num_perm // rows, rows) for rows in range(1, num_perm + 1)]
+    return min(bands_and_rows, key=lambda band_rows: abs((1 / band_rows[0]) ** (1 / band_rows[1]) - threshold))
+
+
+def lsh_near_duplicate_clusters(signatures: np.ndarray, threshold: float = 0.8) -> np.ndarray:
+    """Group near duplicate signatures using locality-sensitive hashing. Each band of signatures is bucketed with
+    hashing so only signatures in same bucket are compared, which avoids comparing all pairs. All pairs within a bucket
+    are compared and every pair above threshold is joined, so clusters do not depend on order of rows.
+
+    Parameters
+    ----------
+    signatures : np.ndarray
+        This is the output of minhash_signatures.
+    threshold : float
+        This is the estimated Jaccard similarity above which two signatures are near duplicates. between 0 and 1.
+
+    Returns
+    -------
+    np.ndarray
+        This contains cluster label of each signature which is the index of first signature of its cluster.
+
+    """
+    number_of_signatures, num_perm = signatures.shape
+    bands, rows = lsh_bands_and_rows(num_perm, threshold)
+    parents = np.arange(number_of_signatures)
+
+    def find_root(index: int) -> int:
+        while parents[index] != index:
+            parents[index] = parents[parents[index]]
+            index = parents[index]
+        return index
+
+    has_words = (signatures != np.uint32(minhash_prime)).any(axis=1)
+    for band in range(bands):
+        band_values = np.ascontiguousarray(signatures[:, band * rows:(band + 1) * rows])
+        band_keys = band_values.view(np.dtype((np.void, band_values.dtype.itemsize * rows))).ravel()
+        _, bucket_ids = np.unique(band_keys, return_inverse=True)
+        bucket_ids = bucket_ids.ravel()
+        order = np.argsort(bucket_ids, kind="stable")
+        sorted_bucket_ids = bucket_ids[order]
+        bucket_starts = np.flatnonzero(np.r_[True, sorted_bucket_ids[1:] != sorted_bucket_ids[:-1]])
+        bucket_ends = np.r_[bucket_starts[1:], len(order)]
+
+        for start, end in zip(bucket_starts, bucket_ends):
+            if end - start < 2:
+                continue
+            members = order[start:end]
+            members = members[has_words[members]]
+            if len(members) < 2:
+                continue
+            members_signatures = signatures[members]
+            for member_position, member in enumerate(members[:-1]):
+                similarities = (members_signatures[member_position + 1:] == members_signatures[member_position]).mean(
+                    axis=1)
+                for other_member in members[member_position + 1:][similarities >= threshold]:
+                    member_root, other_member_root = find_root(member), find_root(other_member)
+                    if member_root != other_member_root:
+                        parents[max(member_root, other_member_root)] = min(member_root, other_member_root)
+
+    return np.array([find_root(index) for index in range(number_of_signatures)])
+
+
+def add_near_duplicate_cluster_column(citation_dataframe: pd.DataFrame, columns: list = ['title', 'abstract'],
+                                      threshold: float = 0.8, num_perm: int = 128, shingle_size: int = 5,
+                                      cluster_column_name: str = "duplicate_cluster") -> pd.DataFrame:
+    """Find near duplicate citations whose titles and abstracts differ slightly, like in punctuation, typos or a few
+    words, using MinHash and locality-sensitive hashing. Year is not compared as sources often disagree on it.
+
+    Parameters
+    ----------
+    citation_dataframe : pandas.DataFrame object
+        Input dataset which contains near duplicate rows
+    columns : list
+        These are the columns joined to create text of each citation. Missing columns and values are ignored.
+    threshold : float
+        This is the Jaccard similarity of text shingles above which citations are near duplicates. between 0 and 1.
+    num_perm : int
+        This is the length of MinHash signatures. More is more accurate but slower.
+    shingle_size : int
+        This is the number of characters in one shingle.
+    cluster_column_name : str
+        This is the name of the added column.
+
+    Returns
+    -------
+    pandas.DataFrame object
+        DataFrame with additional column containing cluster number of each citation. Citations with same cluster
+        number are near duplicates. cluster number is position of first row of cluster.
+
+    """
+    available_columns = [column for column in columns if column in citation_dataframe.columns]
+    citation_texts = [" ".join(str(value) for value in row if isinstance(value, str))
+                      for row in citation_dataframe[available_columns].itertuples(index=False)]
+    signatures = minhash_signatures(citation_texts, num_perm, shingle_size)
+    output_dataframe = citation_dataframe.copy()
+    output_dataframe[cluster_column_name] = lsh_near_duplicate_clusters(signatures, threshold)
+    return output_dataframe
+
+
+def get_near_duplicate_clusters(citation_dataframe: pd.DataFrame, columns: list = ['title', 'abstract'],
+                                threshold: float = 0.8, num_perm: int = 128, shingle_size: int = 5) -> List[list]:
+    """Provides the clusters of near duplicate citations which have more than one citation.
+
+    Parameters
+    ----------
+    citation_dataframe : pandas.DataFrame object
+        Input dataset which contains near duplicate rows
+    columns : list
+        These are the columns joined to create text of each citation.
+    threshold : float
+        This is the Jaccard similarity of text shingles above which citations are near duplicates. between 0 and 1.
+    num_perm : int
+        This is the length of MinHash signatures.
+    shingle_size : int
+        This is the number of characters in one shingle.
+
+    Returns
+    -------
+    List[list]
+        This list contains list of dataframe index labels of each near duplicate cluster.
+
+    """
+    clustered_dataframe = add_near_duplicate_cluster_column(citation_dataframe, columns, threshold, num_perm,
+                                                            shingle_size)
+    clusters = clustered_dataframe.groupby("duplicate_cluster", sort=True).groups
+    return [list(index_labels) for index_labels in clusters.values() if len(index_labels) > 1]
+
+
+def drop_near_duplicates_citations(citation_dataframe: pd.DataFrame, columns: list = ['title', 'abstract'],
+                                   threshold: float = 0.8, num_perm: int = 128, shingle_size: int = 5,
+                                   index_reset: bool = True) -> pd.DataFrame:
+    """Return DataFrame with near duplicate citations removed. Canonical citation of each cluster is the one with most
+    non-empty columns, first citation if there is tie.
+
+    Parameters
+    ----------
+    citation_dataframe : pandas.DataFrame object
+        Input dataset which contains near duplicate rows
+    columns : list
+        These are the columns joined to create text of each citation.
+    threshold : float
+        This is the Jaccard similarity of text shingles above which citations are near duplicates. between 0 and 1.
+    num_perm : int
+        This is the length of MinHash signatures.
+    shingle_size : int
+        This is the number of characters in one shingle.
+    index_reset : bool
+        It resets the index of output dataframe.
+
+    Returns
+    -------
+    pandas.DataFrame object
+        DataFrame with near duplicates removed and 'duplicate_cluster' column added.
+
+    """
+    clustered_dataframe = add_near_duplicate_cluster_column(citation_dataframe, columns, threshold, num_perm,
+                                                            shingle_size)
+    completeness = citation_dataframe.notna().sum(axis=1).to_numpy()
+    clusters = clustered_dataframe["duplicate_cluster"].to_numpy()
+    order = np.lexsort((np.arange(len(clusters)), -completeness, clusters))
+    first_of_cluster = np.r_[True, clusters[order][1:] != clusters[order][:-1]]
+    canonical_positions = np.sort(order[first_of_cluster])
+    clean_df = clustered_dataframe.iloc[canonical_positions]
+    return clean_df.reset_index(drop=True) if index_reset else clean_df
+
+
 class Citations:
+    state_version = 2
+    state_manifest_file_name = "manifest.pkl"
+
     def __init__(self, citations_files_parent_folder_path, title_column_name: str = "title",
-                 text_manipulation_method_name: str = "preprocess_string_to_space_separated_words"):
+                 text_manipulation_method_name: str = "preprocess_string_to_space_separated_words",
+                 state_directory_path: str = None, identifier_columns_names: List[str] = None):
         """
 
         Parameters
@@ -344,14 +1193,81 @@ class Citations:
             this is the path of parent folder of where citations files exists.
         title_column_name
         text_manipulation_method_name
+        state_directory_path : str
+            This is the path of directory to save deduplicated citations and their keys. If it is given then only new
+            or changed ris files are loaded and their citations are deduplicated against saved citations. Each run
+            saves only its new citations and changes of saved citations as a new part file.
+        identifier_columns_names : List[str]
+            These are the identifier columns used to find duplicates, from 'doi', 'accession_number'(PMID) and
+            'issn'(ISBN). Default is all of them. Empty list finds duplicates only on normalized title and year.
         """
+        identifier_columns_names = list(identifier_columns_normalizers) if identifier_columns_names is None \
+            else list(identifier_columns_names)
+        unknown_columns_names = [column_name for column_name in identifier_columns_names
+                                 if column_name not in identifier_columns_normalizers]
+        if unknown_columns_names:
+            raise ValueError(f"identifier columns {unknown_columns_names} are not supported, use "
+                             f"{list(identifier_columns_normalizers)}.")
+        self.identifier_columns_normalizers_dict = {column_name: identifier_columns_normalizers[column_name]
+                                                    for column_name in identifier_columns_names}
         self.text_manipulation_method_name = text_manipulation_method_name
         self.title_column_name = title_column_name
         self.citations_files_parent_folder_path = citations_files_parent_folder_path
+        self.state_directory_path = state_directory_path
+
+    def add_text_columns(self, citations_dataframe: pd.DataFrame) -> pd.DataFrame:
+        """Add citation text and cleaned title columns needed for next steps of systematic review.
+
+        Parameters
+        ----------
+        citations_dataframe : pd.DataFrame
+            This is the dataframe of deduplicated citations.
+
+        Returns
+        -------
+        pd.DataFrame
+            This is the dataframe with 'citation_text' and 'cleaned_title' columns.
+
+        """
+        complete_df = add_citation_text_column(citations_dataframe)
+        new_column_name = "cleaned_" + self.title_column_name
+        complete_df = converter.apply_custom_function_on_dataframe_column(complete_df,
+                                                                          self.title_column_name,
+                                                                          string_manipulation.text_manipulation_methods,
+                                                                          new_column_name,
+                                                                          self.text_manipulation_method_name)
+        return complete_df
+
+    def deduplicate_citations(self, full_list_df: pd.DataFrame) -> tuple:
+        """Remove duplicates from citations and add required columns for next steps.
+
+        Parameters
+        ----------
+        full_list_df : pd.DataFrame
+            This is the dataframe of all citations loaded from ris files.
+
+        Returns
+        -------
+        tuple
+            deduplicated citations dataframe and array of row number of each input citation in deduplicated dataframe.
+
+        """
+        duplicate_keys = get_identifier_duplicate_keys(full_list_df, self.identifier_columns_normalizers_dict,
+                                                       self.title_column_name)
+        complete_df = drop_duplicates_citations_add_sources_column(full_list_df.assign(duplicate_key=duplicate_keys),
+                                                                   subset=["duplicate_key"])
+        complete_df = self.add_text_columns(complete_df.drop(columns="duplicate_key"))
+        # rows are in order of first appearance of duplicate keys, same as codes of factorize.
+        return complete_df, pd.factorize(duplicate_keys)[0]
 
     def create_citations_dataframe(self) -> pd.DataFrame:
         """Executes citation step.
         This function load all the citations from path, add required columns for next steps, and remove duplicates.
+        Duplicates are found using DOI, PMID and ISBN, and normalized title with year for citations without
+        identifiers, check get_identifier_duplicate_keys. Earlier only citations with exactly same title and year were
+        duplicates, so now citations with same identifier but different title, or title differing only in case and
+        punctuation, are also merged. Use identifier_columns_names of Citations to choose identifiers, empty list
+        uses only normalized title and year.
 
         Returns
         -------
@@ -359,18 +1275,286 @@ class Citations:
             DataFrame with additional columns needed for next steps of systematic review and duplicates are removed
 
         """
+        if self.state_directory_path:
+            return self.update_citations_dataframe()
         full_list = converter.load_multiple_ris_citations_files(self.citations_files_parent_folder_path)
         full_list_df = converter.records_list_to_dataframe(full_list)
-        complete_df = add_multiple_sources_column(full_list_df)
-        complete_df = add_citation_text_column(complete_df)
-        new_column_name = "cleaned_" + self.title_column_name
-        complete_df = converter.apply_custom_function_on_dataframe_column(complete_df,
-                                                                          self.title_column_name,
-                                                                          string_manipulation.text_manipulation_methods,
-                                                                          new_column_name,
-                                                                          self.text_manipulation_method_name)
-        complete_citations_df = drop_duplicates_citations(complete_df)
-        return complete_citations_df
+        return self.deduplicate_citations(full_list_df)[0]
+
+    def get_citations_lookup_keys(self, citations_dataframe: pd.DataFrame) -> tuple:
+        """Provides keys used to find saved duplicates of citations. Identifier keys are prefixed with their column
+        name like 'doi:10.1000/xyz' and title keys are prefixed with 'title:'.
+
+        Parameters
+        ----------
+        citations_dataframe : pd.DataFrame
+            This is the dataframe of citations loaded from ris files.
+
+        Returns
+        -------
+        tuple
+            list of identifier keys of each citation and list of title with year key of each citation.
+
+        """
+        normalized_identifiers_df = get_normalized_identifiers(citations_dataframe,
+                                                               self.identifier_columns_normalizers_dict)
+        identifiers_keys = [[f"{column_name}:{identifier}" for column_name, identifier in
+                             zip(normalized_identifiers_df.columns, identifiers) if identifier]
+                            for identifiers in normalized_identifiers_df.itertuples(index=False)]
+        title_keys = ["title:" + key if key else "" for key in
+                      get_normalized_title_year_keys(citations_dataframe, self.title_column_name)]
+        return identifiers_keys, title_keys
+
+    def create_key_index(self, full_list_df: pd.DataFrame, row_numbers: np.ndarray, number_of_rows: int) -> tuple:
+        """Creates hash map from lookup keys of all citations to row number of their deduplicated citation.
+
+        Parameters
+        ----------
+        full_list_df : pd.DataFrame
+            This is the dataframe of all citations loaded from ris files.
+        row_numbers : np.ndarray
+            This is row number of each citation in deduplicated dataframe.
+        number_of_rows : int
+            This is the number of rows in deduplicated dataframe.
+
+        Returns
+        -------
+        tuple
+            dict of key to row number and list of flags if deduplicated citation has any identifier.
+
+        """
+        identifiers_keys, title_keys = self.get_citations_lookup_keys(full_list_df)
+        key_index = {}
+        has_identifier = [False] * number_of_rows
+        for citation_identifiers_keys, row_number in zip(identifiers_keys, row_numbers.tolist()):
+            for key in citation_identifiers_keys:
+                key_index.setdefault(key, row_number)
+            if citation_identifiers_keys:
+                has_identifier[row_number] = True
+        for title_key, row_number in zip(title_keys, row_numbers.tolist()):
+            if title_key:
+                key_index.setdefault(title_key, row_number)
+        return key_index, has_identifier
+
+    def get_ris_files_signatures(self) -> Dict[str, list]:
+        """Provides size and modification time of each ris file to find new or changed files.
+
+        Returns
+        -------
+        Dict[str, list]
+            This contains ris file path as key and list of file size and modification time in nanoseconds as value.
+
+        """
+        ris_files_signatures = {}
+        for path in os_utils.extract_files_path_from_directories_or_subdirectories(
+                self.citations_files_parent_folder_path):
+            if path.endswith(".ris"):
+                file_stat = os.stat(path)
+                ris_files_signatures[os.path.abspath(path)] = [file_stat.st_size, file_stat.st_mtime_ns]
+        return ris_files_signatures
+
+    def get_state_settings(self) -> dict:
+        """Settings which change saved citations. Saved state is not used if they are changed."""
+        return {"version": self.state_version, "title_column_name": self.title_column_name,
+                "text_manipulation_method_name": self.text_manipulation_method_name,
+                "identifier_columns_names": list(self.identifier_columns_normalizers_dict)}
+
+    def write_state_file(self, file_name: str, value: Any) -> None:
+        """Save value to pickle file in state_directory_path. It is written to temporary file first so crash while
+        saving does not corrupt existing file.
+
+        Parameters
+        ----------
+        file_name : str
+            This is the name of file in state_directory_path.
+        value : Any
+            This is the value to pickle.
+
+        """
+        file_path = os.path.join(self.state_directory_path, file_name)
+        temporary_file_path = f"{file_path}.tmp"
+        pd.to_pickle(value, temporary_file_path)
+        os.replace(temporary_file_path, file_path)
+
+    def load_state(self) -> Union[dict, None]:
+        """Load saved citations state from state_directory_path. Manifest lists part files in order they are saved,
+        each part contains citations added by one run, their keys and changes of citations of earlier parts.
+
+        Returns
+        -------
+        Union[dict, None]
+            This contains 'settings', 'files', 'parts', 'key_index', 'has_identifier' and 'dataframe'. None if state
+            does not exist, is unreadable or created with different settings.
+
+        """
+        manifest_file_path = os.path.join(self.state_directory_path, self.state_manifest_file_name)
+        if not os.path.isfile(manifest_file_path):
+            return None
+        try:
+            manifest = pd.read_pickle(manifest_file_path)
+            if not isinstance(manifest, dict) or manifest.get("settings") != self.get_state_settings():
+                return None
+            parts = [pd.read_pickle(os.path.join(self.state_directory_path, part_file_name))
+                     for part_file_name in manifest["parts"]]
+        except Exception as error:
+            print(f"citations state is not used. It is unreadable: {error}")
+            return None
+
+        complete_df = pd.concat([part["dataframe"] for part in parts if part["dataframe"] is not None],
+                                ignore_index=True)
+        multiple_sources = complete_df["multiple_sources"].to_numpy(dtype=object, copy=True)
+        key_index, has_identifier = {}, []
+        for part in parts:
+            for key, row_number in part["key_index"].items():
+                key_index.setdefault(key, row_number)
+            has_identifier += part["has_identifier"]
+            for row_number in part["identifier_rows"]:
+                has_identifier[row_number] = True
+            for row_number, sources in part["sources_updates"].items():
+                multiple_sources[row_number] = sources
+        return dict(manifest, key_index=key_index, has_identifier=has_identifier,
+                    dataframe=complete_df.assign(multiple_sources=multiple_sources))
+
+    def save_state_part(self, manifest: dict, part: dict) -> None:
+        """Save part of citations state and add it to manifest. Part is saved before manifest, so part of interrupted
+        run is never loaded.
+
+        Parameters
+        ----------
+        manifest : dict
+            This contains 'settings', 'files' and 'parts'. Name of part file is appended to 'parts'.
+        part : dict
+            This contains 'dataframe' of new citations or None, 'key_index' of new keys, 'has_identifier' flags of new
+            citations, 'identifier_rows' of earlier citations which got an identifier and 'sources_updates' of earlier
+            citations.
+
+        """
+        os.makedirs(self.state_directory_path, exist_ok=True)
+        part_file_name = f"part_{len(manifest['parts']):05d}.pkl"
+        self.write_state_file(part_file_name, part)
+        manifest = {"settings": manifest["settings"], "files": manifest["files"],
+                    "parts": manifest["parts"] + [part_file_name]}
+        self.write_state_file(self.state_manifest_file_name, manifest)
+
+    def update_citations_dataframe(self) -> pd.DataFrame:
+        """Executes citation step incrementally. Only ris files which are new or changed since last run are loaded.
+        Their citations are deduplicated among themselves, then matched to saved citations through saved key index.
+        Matched citations add their source to 'multiple_sources' of saved citation and rest are appended. Only new
+        citations and changed sources are saved, so saved citations are not written again. Citations of removed files
+        or removed from changed files are not deleted, delete the state directory to rebuild it.
+
+        Returns
+        -------
+        pandas.DataFrame object
+            DataFrame with additional columns needed for next steps of systematic review and duplicates are removed
+
+        """
+        ris_files_signatures = self.get_ris_files_signatures()
+        state = self.load_state()
+        if state is None:
+            full_list = []
+            for path in ris_files_signatures:
+                full_list += converter.ris_file_to_records_list(path)
+            full_list_df = converter.records_list_to_dataframe(full_list)
+            complete_df, row_numbers = self.deduplicate_citations(full_list_df)
+            key_index, has_identifier = self.create_key_index(full_list_df, row_numbers, len(complete_df))
+            self.save_state_part({"settings": self.get_state_settings(), "files": ris_files_signatures, "parts": []},
+                                 {"dataframe": complete_df, "key_index": key_index, "has_identifier": has_identifier,
+                                  "identifier_rows": [], "sources_updates": {}})
+            return complete_df
+
+        changed_files_path = [path for path, signature in ris_files_signatures.items()
+                              if state["files"].get(path) != signature]
+        if not changed_files_path:
+            return state["dataframe"]
+
+        new_list = []
+        for path in changed_files_path:
+            new_list += converter.ris_file_to_records_list(path)
+        new_list_df = converter.records_list_to_dataframe(new_list).reset_index(drop=True)
+        complete_df, key_index, has_identifier = state["dataframe"], state["key_index"], state["has_identifier"]
+        number_of_saved_rows = len(complete_df)
+        new_key_index, identifier_rows, sources_updates = {}, set(), {}
+
+        identifiers_keys, title_keys = self.get_citations_lookup_keys(new_list_df)
+        duplicate_keys = get_identifier_duplicate_keys(new_list_df, self.identifier_columns_normalizers_dict,
+                                                       self.title_column_name)
+        sources = new_list_df["source"].tolist() if "source" in new_list_df.columns else [None] * len(new_list_df)
+        multiple_sources = complete_df["multiple_sources"].to_numpy(dtype=object, copy=True)
+        new_rows_positions, new_rows_sources = [], []
+        for positions in pd.Series(duplicate_keys).groupby(duplicate_keys, sort=True).indices.values():
+            group_identifiers_keys = [key for position in positions for key in identifiers_keys[position]]
+            group_title_keys = [title_keys[position] for position in positions if title_keys[position]]
+            row_number = next((key_index[key] for key in group_identifiers_keys if key in key_index), None)
+            if row_number is None:
+                # same rule as get_identifier_duplicate_keys, title only joins citations without identifiers.
+                row_number = next((key_index[key] for key in group_title_keys if key in key_index and not (
+                    group_identifiers_keys and has_identifier[key_index[key]])), None)
+            group_sources = [source for source in dict.fromkeys(sources[position] for position in positions)
+                             if isinstance(source, str)]
+
+            if row_number is None:
+                row_number = number_of_saved_rows + len(new_rows_positions)
+                new_rows_positions.append(positions[0])
+                new_rows_sources.append(group_sources)
+                has_identifier.append(False)
+            elif row_number < number_of_saved_rows:
+                saved_sources = multiple_sources[row_number] if isinstance(multiple_sources[row_number], list) else []
+                added_sources = [source for source in group_sources if source not in saved_sources]
+                if added_sources:
+                    multiple_sources[row_number] = saved_sources + added_sources
+                    sources_updates[row_number] = multiple_sources[row_number]
+            else:
+                saved_sources = new_rows_sources[row_number - number_of_saved_rows]
+                saved_sources += [source for source in group_sources if source not in saved_sources]
+
+            if group_identifiers_keys and not has_identifier[row_number]:
+                has_identifier[row_number] = True
+                if row_number < number_of_saved_rows:
+                    identifier_rows.add(row_number)
+            for key in group_identifiers_keys + group_title_keys:
+                if key not in key_index:
+                    key_index[key] = new_key_index[key] = row_number
+
+        complete_df = complete_df.assign(multiple_sources=multiple_sources)
+        new_rows_df = None
+        if new_rows_positions:
+            new_rows_df = new_list_df.iloc[new_rows_positions].assign(multiple_sources=new_rows_sources)
+            new_rows_df = self.add_text_columns(new_rows_df.reset_index(drop=True))
+            complete_df = pd.concat([complete_df, new_rows_df], ignore_index=True)
+
+        self.save_state_part({"settings": state["settings"], "files": ris_files_signatures, "parts": state["parts"]},
+                             {"dataframe": new_rows_df, "key_index": new_key_index,
+                              "has_identifier": has_identifier[number_of_saved_rows:],
+                              "identifier_rows": sorted(identifier_rows), "sources_updates": sources_updates})
+        print(f"{len(new_list_df)} citations loaded from {len(changed_files_path)} new or changed ris files, "
+              f"{len(new_rows_positions)} new citations added.")
+        return complete_df
+
+    def create_title_index(self, index_directory_path: str,
+                           citations_dataframe: pd.DataFrame = None) -> converter.TitleIndex:
+        """Save title index of citations which maps cleaned title to row number of citations dataframe. Validation,
+        analysis and citation details lookups can load it instead of normalizing titles again.
+
+        Parameters
+        ----------
+        index_directory_path : str
+            This is the path of directory to save title index files.
+        citations_dataframe : pd.DataFrame
+            This is the output of create_citations_dataframe. It is created if not given.
+
+        Returns
+        -------
+        converter.TitleIndex
+            This is the saved title index.
+
+        """
+        if citations_dataframe is None:
+            citations_dataframe = self.create_citations_dataframe()
+        return converter.TitleIndex.build(citations_dataframe["cleaned_" + self.title_column_name],
+                                          index_directory_path,
+                                          text_manipulation_method_name=self.text_manipulation_method_name,
+                                          normalized=True)
 
     def get_records_list(self) -> List[Dict[str, Any]]:
         """Executes citation step.
@@ -427,3 +1611,19 @@ class Citations:
 
         """
         converter.dataframe_to_excel_file(self.get_dataframe(), output_filename, index)
+
+    def to_ris(self, output_filename: str = "output.ris", ris_tags_columns_mapping: Dict[str, str] = None):
+        """This function saves citations to ris file using converter.RisFileWriter.
+
+        Parameters
+        ----------
+        output_filename : str
+            This is the name of output file which should contains .ris extension
+        ris_tags_columns_mapping : Dict[str, str]
+            This contains ris tag as key and column name as value. Default matches citations loaded by rispy.
+
+        Returns
+        -------
+
+        """
+        converter.dataframe_to_ris_file(self.get_dataframe(), output_filename, ris_tags_columns_mapping)
@@ -2,10 +2,27 @@
 This module contains functions related to files and data type conversion. such as list to txt file, pandas df to list of
 dicts and many more.
 """
+import asyncio
+import collections
+import concurrent.futures
+import gzip
+import hashlib
+import importlib.util
+import io
+import itertools
 import json
+import mmap
+import multiprocessing
+import multiprocessing.connection
+import os
+import re
+import shutil
+import tempfile
+import time
 from collections import defaultdict
-from typing import Union, List, Dict, Any
+from typing import Union, List, Dict, Any, Callable, Iterable, Iterator
 
+import numpy as np
 import pandas as pd
 import rispy
 
@@ -340,6 +357,239 @@ def ris_file_to_pandas_dataframe(ris_file_path: str) -> pd.DataFrame:
         return df
 
 
+def get_default_ris_tags_columns_mapping() -> Dict[str, str]:
+    """Provides mapping of ris tags to column names used by rispy when ris files are loaded, so loaded citations can
+    be written back to ris without specifying columns.
+
+    Returns
+    -------
+    Dict[str, str]
+        This contains ris tag as key and column name as value. Example - {"TY": "type_of_reference", "AU": "authors"}
+
+    """
+    ris_tags_columns_mapping = {}
+    for ris_tag, column_name in rispy.TAG_KEY_MAPPING.items():
+        if ris_tag != "ER" and column_name not in ris_tags_columns_mapping.values():
+            ris_tags_columns_mapping[ris_tag] = column_name
+    return ris_tags_columns_mapping
+
+
+def format_ris_value(value: Any) -> List[str]:
+    """Convert citation value to list of ris values. List values give one ris value for each element and missing
+    values give none, including pd.NA of nullable pandas dtypes. New lines are replaced with spaces as each ris value
+    must be on single line.
+
+    Parameters
+    ----------
+    value : Any
+        This is the value of citation column.
+
+    Returns
+    -------
+    List[str]
+        This is the list of ris values.
+
+    """
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [text for element in value for text in format_ris_value(element)]
+    if pd.isna(value) or (isinstance(value, str) and value == ""):
+        return []
+    text = str(value)
+    return [" ".join(text.splitlines())] if ("\n" in text or "\r" in text) else [text]
+
+
+class RisFileWriter:
+    """Buffered streaming writer of citations in ris format. Mapping of ris tags to columns is compiled once for each
+    set of columns and records are formatted in blocks which are written in large writes, so citations of any size
+    can be exported without loading them again with rispy.
+
+    Examples
+    --------
+    >>> with RisFileWriter("selected.ris") as ris_writer:
+    ...     ris_writer.write_dataframe(citations_dataframe)
+
+    """
+    type_of_reference_tag = "TY"
+    end_of_reference_line = "ER  - \n"
+
+    def __init__(self, output_file_path: str, ris_tags_columns_mapping: Dict[str, str] = None,
+                 type_of_reference: str = "JOUR", permission: str = "w", buffer_size: int = 8 * 1024 * 1024):
+        """
+
+        Parameters
+        ----------
+        output_file_path : str
+            this is the path of output ris file.
+        ris_tags_columns_mapping : Dict[str, str]
+            This contains ris tag as key and column name as value, in the order tags are written. Columns missing in
+            data are skipped. Default is get_default_ris_tags_columns_mapping() which matches citations loaded by
+            rispy. Example - {"TY": "type", "AU": "Authors", "PY": "Year", "TI": "Title", "DO": "DOI"}
+        type_of_reference : str
+            This is value of TY tag for citations which do not have it. JOUR for journal articles.
+        permission : str
+            These are the os permissions given for the output file. 'w' to overwrite and 'a' to append.
+        buffer_size : int
+            This is the number of bytes collected before writing to disk.
+        """
+        self.ris_tags_columns_mapping = ris_tags_columns_mapping if ris_tags_columns_mapping is not None else \
+            get_default_ris_tags_columns_mapping()
+        self.type_of_reference = type_of_reference
+        self.output_file_path = output_file_path
+        self.output_file = open(output_file_path, permission, buffering=buffer_size, encoding="utf-8")
+        self.compiled_tag_maps = {}
+        self.number_of_records = 0
+
+    def compile_tag_map(self, columns_name: Iterable[str]) -> tuple:
+        """Provides column of TY tag, list of columns and list of line prefixes of other tags available in
+        columns_name.
+
+        Parameters
+        ----------
+        columns_name : Iterable[str]
+            These are the columns of citations data.
+
+        Returns
+        -------
+        tuple
+            column name of TY tag or None, list of columns names and list of line prefixes like 'AU  - '.
+
+        """
+        columns_name = tuple(columns_name)
+        if columns_name not in self.compiled_tag_maps:
+            available_columns = set(columns_name)
+            type_column_name = self.ris_tags_columns_mapping.get(self.type_of_reference_tag)
+            tags_columns = [(column_name, f"{ris_tag}  - ") for ris_tag, column_name in
+                            self.ris_tags_columns_mapping.items()
+                            if ris_tag != self.type_of_reference_tag and column_name in available_columns]
+            self.compiled_tag_maps[columns_name] = (type_column_name if type_column_name in available_columns else
+                                                    None, [column_name for column_name, _ in tags_columns],
+                                                    [line_prefix for _, line_prefix in tags_columns])
+        return self.compiled_tag_maps[columns_name]
+
+    def format_record(self, type_of_reference: Any, values: Iterable[Any], line_prefixes: List[str]) -> str:
+        """Format one citation in ris format.
+
+        Parameters
+        ----------
+        type_of_reference : Any
+            This is value of TY tag, default type_of_reference is used if it is missing.
+        values : Iterable[Any]
+            These are the values of citation in order of line_prefixes.
+        line_prefixes : List[str]
+            These are the tags line prefixes like 'AU  - '.
+
+        Returns
+        -------
+        str
+            This is the citation in ris format ending with ER tag.
+
+        """
+        type_of_reference = format_ris_value(type_of_reference) or [self.type_of_reference]
+        lines = [f"{self.type_of_reference_tag}  - {type_of_reference[0]}\n"]
+        for line_prefix, value in zip(line_prefixes, values):
+            for text in format_ris_value(value):
+                lines.append(f"{line_prefix}{text}\n")
+        lines.append(self.end_of_reference_line)
+        return "".join(lines)
+
+    def write_dataframe(self, dataframe: pd.DataFrame, chunksize: int = 100000) -> int:
+        """Write citations of dataframe in ris format.
+
+        Parameters
+        ----------
+        dataframe : pd.DataFrame
+            This contains citations to write.
+        chunksize : int
+            number of citations formatted and written at once.
+
+        Returns
+        -------
+        int
+            This is the number of citations written.
+
+        """
+        type_column_name, columns_names, line_prefixes = self.compile_tag_map(dataframe.columns)
+        for start in range(0, len(dataframe), chunksize):
+            chunk = dataframe.iloc[start:start + chunksize]
+            columns_values = [chunk[column_name].to_numpy(dtype=object) for column_name in columns_names]
+            type_values = chunk[type_column_name].to_numpy(dtype=object) if type_column_name else [None] * len(chunk)
+            rows_values = zip(*columns_values) if columns_values else ([] for _ in range(len(chunk)))
+            self.output_file.write("".join(self.format_record(type_value, row_values, line_prefixes)
+                                           for type_value, row_values in zip(type_values, rows_values)))
+            self.number_of_records += len(chunk)
+        return len(dataframe)
+
+    def write_records(self, records_list: Iterable[Dict[str, Any]], block_size: int = 10000) -> int:
+        """Write citations records in ris format. Tag map is compiled again only when keys differ from previous record.
+
+        Parameters
+        ----------
+        records_list : Iterable[Dict[str, Any]]
+            These are the citations dicts to write. Example - [{'title': "this is the title", ...}, ...]
+        block_size : int
+            number of citations formatted and written at once.
+
+        Returns
+        -------
+        int
+            This is the number of citations written.
+
+        """
+        number_of_records = 0
+        records_iterator = iter(records_list)
+        previous_keys, type_column_name, columns_names, line_prefixes = None, None, [], []
+        while True:
+            block = list(itertools.islice(records_iterator, block_size))
+            if not block:
+                return number_of_records
+            formatted_records = []
+            for record in block:
+                if record.keys() != previous_keys:
+                    previous_keys = record.keys()
+                    type_column_name, columns_names, line_prefixes = self.compile_tag_map(previous_keys)
+                formatted_records.append(self.format_record(
+                    record.get(type_column_name), [record[column_name] for column_name in columns_names],
+                    line_prefixes))
+            self.output_file.write("".join(formatted_records))
+            number_of_records += len(block)
+            self.number_of_records += len(block)
+
+    def close(self) -> None:
+        """Flush buffered citations and close output file."""
+        self.output_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def dataframe_to_ris_file(dataframe_object: pd.DataFrame, output_filename: str = "output.ris",
+                          ris_tags_columns_mapping: Dict[str, str] = None, type_of_reference: str = "JOUR") -> int:
+    """This function saves citations in pandas.DataFrame to ris file using RisFileWriter.
+
+    Parameters
+    ----------
+    dataframe_object : pandas.DataFrame object
+        this is the object of python library pandas. for more lemma_info: https://pandas.pydata.org/docs/
+    output_filename : str
+        This is the name of output file which should contains .ris extension
+    ris_tags_columns_mapping : Dict[str, str]
+        This contains ris tag as key and column name as value. Default matches citations loaded by rispy.
+    type_of_reference : str
+        This is value of TY tag for citations which do not have it.
+
+    Returns
+    -------
+    int
+        This is the number of citations written.
+
+    """
+    with RisFileWriter(output_filename, ris_tags_columns_mapping, type_of_reference) as ris_writer:
+        return ris_writer.write_dataframe(dataframe_object)
+
+
 def load_multiple_ris_citations_files(citations_files_parent_folder_path: str) -> List[dict]:
     """This function loads all ris citations files from folder
 
@@ -495,7 +745,8 @@ def load_text_file(file_path: str, permission: str = "r"):
 
 def remove_empty_lines(input_file_path: str, output_filename: str = "output_file.ris") -> None:
     """
-    This function removes the blank lines from the input file and output new file.
+    This function removes the blank lines from the input file and output new file. Output file is overwritten, for
+    more info check repair_ris_file.
 
     Parameters
     ----------
@@ -509,13 +760,138 @@ def remove_empty_lines(input_file_path: str, output_filename: str = "output_file
     None
 
     """
-    input_file = open(input_file_path, "r")
-    output_file = open(output_filename, "a")
-    for line in input_file:
-        if line != "\n":
-            output_file.write(line)
-    input_file.close()
-    output_file.close()
+    repair_ris_file(input_file_path, output_filename, fixes=["drop_blank_lines"])
+
+
+ris_repair_fixes = ("normalize_tag_spacing", "drop_blank_lines", "insert_missing_er")
+# only tags known to rispy are normalized, so continuation lines like 'US - based' are kept as text.
+ris_known_tags_pattern = b"|".join(re.escape(ris_tag.encode()) for ris_tag in sorted(rispy.TAG_KEY_MAPPING))
+ris_loose_tag_pattern = re.compile(
+    rb"(?m)^(?![A-Z][A-Z0-9]  - )[ \t]*(" + ris_known_tags_pattern +
+    rb")(?:[ \t]+-[ \t]*|[ \t]*-[ \t]+|[ \t]*-(?=\r?$))")
+ris_blank_line_pattern = re.compile(rb"(?m)^[ \t\r]*\n")
+ris_record_boundary_pattern = re.compile(rb"(?m)^(TY|ER)[ \t]*-")
+
+
+def get_ris_repair_blocks(file_map: mmap.mmap, block_size: int) -> Iterator[bytes]:
+    """Split memory mapped file into blocks of about block_size bytes which end at end of line.
+
+    Parameters
+    ----------
+    file_map : mmap.mmap
+        This is the memory mapped input file.
+    block_size : int
+        This is the minimum number of bytes in each block except last.
+
+    Returns
+    -------
+    Iterator[bytes]
+        This yields blocks of whole lines.
+
+    """
+    start = 0
+    while start < len(file_map):
+        end = file_map.find(b"\n", min(start + block_size, len(file_map)) - 1)
+        end = len(file_map) if end == -1 else end + 1
+        yield file_map[start:end]
+        start = end
+
+
+def insert_missing_er_tags(block: bytes, record_open: bool, end_line: bytes = b"ER  - \n") -> tuple:
+    """Insert ER tag before each TY tag of citation whose previous citation is not ended.
+
+    Parameters
+    ----------
+    block : bytes
+        This is block of whole lines of ris file with normalized tags.
+    record_open : bool
+        True if citation started before this block is not ended yet.
+    end_line : bytes
+        This is the ER line inserted.
+
+    Returns
+    -------
+    tuple
+        repaired block, if last citation of block is not ended and number of inserted ER tags.
+
+    """
+    pieces = []
+    previous_end = 0
+    inserted_count = 0
+    for match in ris_record_boundary_pattern.finditer(block):
+        if match.group(1) == b"TY":
+            if record_open:
+                pieces.append(block[previous_end:match.start()])
+                pieces.append(end_line)
+                previous_end = match.start()
+                inserted_count += 1
+            record_open = True
+        else:
+            record_open = False
+    pieces.append(block[previous_end:])
+    return b"".join(pieces), record_open, inserted_count
+
+
+def repair_ris_file(input_file_path: str, output_filename: str = "output_file.ris",
+                    fixes: Iterable[str] = ris_repair_fixes, block_size: int = 64 * 1024 * 1024) -> Dict[str, int]:
+    """Repair ris file in one pass and write the result to new file. Input file is memory mapped and fixes are
+    applied by compiled regular expressions on large blocks of lines, so big exports are repaired at disk speed.
+    Output is written to temporary file which replaces output_filename at the end, so re-runs overwrite it and a
+    failed run does not leave partial file. output_filename can be same as input_file_path.
+
+    Parameters
+    ----------
+    input_file_path : str
+        this is the path of input file
+    output_filename : str
+        this is the name of the output ris file with extension.
+    fixes : Iterable[str]
+        These are the names of fixes applied in this order.
+        - ``normalize_tag_spacing`` : tags lines like 'TY - JOUR' or 'TY-  JOUR' are written as 'TY  - JOUR'. Only
+          tags of rispy.TAG_KEY_MAPPING are normalized, so text lines like 'US - based' are not changed.
+        - ``drop_blank_lines`` : empty lines and lines with only spaces are removed.
+        - ``insert_missing_er`` : ER tag is inserted before TY tag of next citation and at end of file if citation
+          is not ended.
+    block_size : int
+        This is the number of bytes processed at once.
+
+    Returns
+    -------
+    Dict[str, int]
+        This contains number of changes made by each fix.
+
+    """
+    unknown_fixes = set(fixes) - set(ris_repair_fixes)
+    if unknown_fixes:
+        raise ValueError(f"unknown ris repair fixes {unknown_fixes}, available fixes are {ris_repair_fixes}")
+    changes_count = {fix_name: 0 for fix_name in fixes}
+    output_directory_path = os.path.dirname(os.path.abspath(output_filename))
+    temporary_file_descriptor, temporary_file_path = tempfile.mkstemp(dir=output_directory_path, suffix=".tmp")
+    try:
+        with open(input_file_path, "rb") as input_file, os.fdopen(temporary_file_descriptor, "wb") as output_file:
+            record_open = False
+            block = b""
+            if os.fstat(input_file.fileno()).st_size:
+                with mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ) as file_map:
+                    for block in get_ris_repair_blocks(file_map, block_size):
+                        for fix_name in fixes:
+                            if fix_name == "normalize_tag_spacing":
+                                block, count = ris_loose_tag_pattern.subn(rb"\1  - ", block)
+                            elif fix_name == "drop_blank_lines":
+                                block, count = ris_blank_line_pattern.subn(b"", block)
+                            else:
+                                block, record_open, count = insert_missing_er_tags(block, record_open)
+                            changes_count[fix_name] += count
+                        output_file.write(block)
+            if record_open:
+                output_file.write(b"ER  - \n" if block.endswith(b"\n") else b"\nER  - \n")
+                changes_count["insert_missing_er"] += 1
+        shutil.copymode(input_file_path, temporary_file_path)
+        os.replace(temporary_file_path, output_filename)
+    except BaseException:
+        os.remove(temporary_file_path)
+        raise
+    return changes_count
 
 
 def write_json_file_with_dict(output_file_path: str, input_dict: dict) -> None:
@@ -578,9 +954,7 @@ def get_text_from_pdf_pdftotext(pdf_file_path: str, pages: str = "all") -> str:
     if pages == "first":
         text = pdf_object[0]
     elif pages == "all":
-        text = ""
-        for pages in pdf_object:
-            text += pages
+        text = "".join(pdf_object)
     else:
         text = pdf_object[pages]
     return text
@@ -642,178 +1016,1464 @@ def get_text_from_pdf_pymupdf(pdf_file_path: str, pages: str = 'all') -> str:
     str
         This is the required text from pdf file.
 
+    """
+    return join_pages_text(iter_pages_from_pdf_pymupdf(pdf_file_path), pages)
+
+
+def iter_pages_from_pdf_pdftotext(pdf_file_path: str) -> Iterator[str]:
+    """Lazily yield the text of pdf file page by page via pdftotext. Pages after the one where caller stops are never
+    converted to text. for more lemma_info, visit: https://pypi.org/project/pdftotext/
+
+    Parameters
+    ----------
+    pdf_file_path : str
+        This is the path of the pdf file.
+
+    Returns
+    -------
+    Iterator[str]
+        This yields text of each page of pdf file. Nothing is yielded if pdftotext is not installed.
+
+    """
+    pdf_object = get_pdf_object_from_pdf_path(pdf_file_path)
+    for page_index in range(len(pdf_object)):
+        yield pdf_object[page_index]
+
+
+def iter_pages_from_pdf_pymupdf(pdf_file_path: str) -> Iterator[str]:
+    """Lazily yield the text of pdf file page by page via fitz(PyMuPDF). Pdf file is closed when caller stops. for
+    more lemma_info, visit: https://pypi.org/project/PyMuPDF/
+
+    Parameters
+    ----------
+    pdf_file_path : str
+        This is the path of pdf file.
+
+    Returns
+    -------
+    Iterator[str]
+        This yields text of each page of pdf file. Nothing is yielded if pymupdf is not installed.
+
     """
     try:
         import fitz
     except ImportError:
         print("""This function requires pymupdf library to read pdfs.
 
-        Install pymupdf using: 
+        Install pymupdf using:
         python -m pip install --upgrade pip
         python -m pip install --upgrade pymupdf
 
         for more info, please visit https://pypi.org/project/PyMuPDF/""")
-        return ""
+        return
 
     with fitz.open(pdf_file_path) as doc:
-        text = ""
-        if pages == "first":
-            for page in doc:
-                text += page.get_text()
-                return text
-        elif pages == "all":
-            for page in doc:
-                text += page.get_text()
-    return text
+        for page in doc:
+            yield page.get_text()
 
 
-def get_text_from_pdf(pdf_file_path: str, pages: str = 'all', pdf_reader: str = 'pdftotext') -> Union[str, bool]:
-    """This Function get text from pdf files using either pdftotext or pymupdf.
+def join_pages_text(pages_iterable: Iterable[str], pages: Union[str, int] = 'all', max_chars: int = None,
+                    stop_when: Callable[[str], bool] = None) -> str:
+    """Join the text of pages while reading only as many pages as needed.
 
     Parameters
     ----------
-    pdf_reader : str
-        This is python pdf reader package which convert pdf to text.
-    pdf_file_path : str
-        This is the path of pdf file.
-    pages : str
-        This could be 'all' to get full text of pdf and 'first' for first page of pdf.
+    pages_iterable : Iterable[str]
+        This yields text of each page, preferably lazily like iter_pages_from_pdf_pymupdf.
+    pages : Union[str, int]
+        This could be 'all' to get full text of pdf, 'first' for first page of pdf or index of page.
+    max_chars : int
+        This is optional limit on length of text. Reading stops as soon as this many characters are read.
+    stop_when : Callable[[str], bool]
+        This is optional function which takes text of one page. Reading stops after the first page it returns True.
 
     Returns
     -------
     str
-        This is the required text from pdf file.
+        This is the joined text of the pages read.
 
     """
-    try:
-        if pdf_reader == 'pdftotext':
-            pdf_text = get_text_from_pdf_pdftotext(pdf_file_path, pages)
-            return pdf_text
-        elif pdf_reader == 'pymupdf':
-            pdf_text = get_text_from_pdf_pymupdf(pdf_file_path, pages)
-            return pdf_text
-        else:
-            print("Not Implemented")
-    except Exception:
-        return ""
+    if pages == "first":
+        pages_iterable = itertools.islice(pages_iterable, 1)
+    elif pages != "all":
+        pages_iterable = itertools.islice(pages_iterable, pages, pages + 1)
 
+    pages_text_list = []
+    total_chars = 0
+    for page_text in pages_iterable:
+        pages_text_list.append(page_text)
+        total_chars += len(page_text)
+        if max_chars is not None and total_chars >= max_chars:
+            break
+        if stop_when is not None and stop_when(page_text):
+            break
+
+    text = "".join(pages_text_list)
+    return text if max_chars is None else text[:max_chars]
 
-def get_text_from_multiple_pdf_reader(pdf_file_path: str, pages: str = 'all') -> Union[str, bool]:
-    """This Function get text from pdf files using pdftotext. if failed then text comes from pymupdf.
+
+def get_pages_from_pdf_pdftotext(pdf_file_path: str) -> List[str]:
+    """Extract the text of every page from pdf file via pdftotext. for more lemma_info, visit:
+    https://pypi.org/project/pdftotext/
+
+    Parameters
+    ----------
+    pdf_file_path : str
+        This is the path of the pdf file.
+
+    Returns
+    -------
+    List[str]
+        This list contains text of each page of pdf file. It is empty if pdftotext is not installed.
+
+    """
+    return list(iter_pages_from_pdf_pdftotext(pdf_file_path))
+
+
+def get_pages_from_pdf_pymupdf(pdf_file_path: str) -> List[str]:
+    """Extract the text of every page from pdf file via fitz(PyMuPDF). for more lemma_info, visit:
+    https://pypi.org/project/PyMuPDF/
 
     Parameters
     ----------
     pdf_file_path : str
         This is the path of pdf file.
-    pages : str
-        This could be 'all' to get full text of pdf and 'first' for first page of pdf.
 
     Returns
     -------
-    str
-        This is the required text from pdf file.
+    List[str]
+        This list contains text of each page of pdf file. It is empty if pymupdf is not installed.
 
     """
-    pdf_text = ""
-    try:
-        pdf_text = get_text_from_pdf_pdftotext(pdf_file_path, pages)
-    except Exception:
-        pass
-    if pdf_text == "":
-        try:
-            pdf_text = get_text_from_pdf_pymupdf(pdf_file_path, pages)
-        except Exception:
-            pass
-    return pdf_text
+    return list(iter_pages_from_pdf_pymupdf(pdf_file_path))
 
 
-class ASReview:
-    def __init__(self, data: Union[List[dict], pd.DataFrame]):
-        """This class export citation files using dataframe or records list in csv file format.
+def get_text_from_pages_list(pages_list: List[str], pages: Union[str, int] = 'all') -> str:
+    """Select the required pages from the list of pages text and join them, same as pdf readers of this module.
 
-        Parameters
-        ----------
-        data :
-            data could be List[dict] and pd.DataFrame
+    Parameters
+    ----------
+    pages_list : List[str]
+        This list contains text of each page of pdf file.
+    pages : Union[str, int]
+        This could be 'all' to get full text of pdf, 'first' for first page of pdf or index of page.
 
-        """
-        self.data = data
+    Returns
+    -------
+    str
+        This is the required text from pages list.
 
-    def get_file(self, output_filename: str = "output.csv", index: bool = True):
-        """Outputs the file needed to start project in ASReview.
+    """
+    if not pages_list:
+        return ""
+    if pages == "first":
+        return pages_list[0]
+    elif pages == "all":
+        return "".join(pages_list)
+    elif -len(pages_list) <= pages < len(pages_list):
+        return pages_list[pages]
+    else:
+        # same as join_pages_text, page index out of range gives no text.
+        return ""
 
-        Parameters
-        ----------
-        output_filename : str
-            name or path of your needed file.
-        index : bool
-            asks if you need index column in output file.
 
-        Returns
-        -------
+def get_file_content_hash(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    """Calculate the sha256 hash of file content. Same file at different path or with different name gives same hash.
 
-        """
-        if type(self.data) == pd.DataFrame:
-            dataframe = self.data.copy()
-            dataframe['label_included'] = ""
-            dataframe_to_csv_file(dataframe, output_filename, index)
-        elif type(self.data) == list:
-            df = records_list_to_dataframe(self.data)
-            dataframe = df.copy()
-            dataframe['label_included'] = ""
-            dataframe_to_csv_file(dataframe, output_filename, index)
-        else:
-            raise NotImplementedError(f"data type {type(self.data)} not Implemented, Use List[dict] and pd.DataFrame.")
+    Parameters
+    ----------
+    file_path : str
+        This is the path of file.
+    chunk_size : int
+        This is the number of bytes read from file at once.
+
+    Returns
+    -------
+    str
+        This is hexadecimal sha256 hash of file content.
 
+    """
+    file_hash = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
 
-class Reader:
-    """Contains functionality to read files.
+
+class PdfTextCache:
+    """This stores text of every pdf page on disk so pdf files are extracted only once across validation and search
+    count steps.
 
     """
+    pdf_readers_functions = {"pdftotext": get_pages_from_pdf_pdftotext, "pymupdf": get_pages_from_pdf_pymupdf}
+    pdf_readers_iter_functions = {"pdftotext": iter_pages_from_pdf_pdftotext, "pymupdf": iter_pages_from_pdf_pymupdf}
+    pdf_readers_modules = {"pdftotext": "pdftotext", "pymupdf": "fitz"}
+    cache_file_extension = ".json.gz"
 
-    def __init__(self, file_path: str):
-        """Needs file path to read a file.
+    def __init__(self, cache_directory_path: str = ".systematic_review_cache"):
+        """Cache entries are gzip compressed json files named by sha256 hash of pdf content. Each entry contains
+        pages text per pdf reader, example - {"pdftotext": ["page 1 text", ...], "pymupdf": []}. Empty list means
+        pdf reader found no text in pdf file, like scanned pdf files, so it is not extracted again.
 
         Parameters
         ----------
-        file_path : str
-            path of the file.
+        cache_directory_path : str
+            This is the path of directory where cached text is saved.
         """
-        self.file_path = file_path
-        self.file_extension = os_utils.get_file_extension_from_path(self.file_path)
+        self.cache_directory_path = cache_directory_path
+        self.file_hash_mapping = {}
+        os.makedirs(self.cache_directory_path, exist_ok=True)
 
-    def get_text(self, pages: str = 'all'):
-        """It understand the type of file and output the content of file.
+    def get_file_hash(self, pdf_file_path: str) -> str:
+        """Provides content hash of pdf file, hash is reused until file size or modification time changes.
 
         Parameters
         ----------
-        pages : str
-            contain option to read 'first' or 'all' pages.
+        pdf_file_path : str
+            This is the path of pdf file.
 
         Returns
         -------
         str
-            This is text in readable file.
+            This is hexadecimal sha256 hash of pdf file content.
 
         """
-        if self.file_extension == "pdf":
-            return get_text_from_multiple_pdf_reader(self.file_path, pages)
-        elif self.file_extension == "csv":
-            return self.pandas_reader("read_csv")
-        elif self.file_extension[0] == "x":
-            return self.pandas_reader("read_excel")
-        elif self.file_extension == "json":
-            return json_file_to_dict(self.file_path)
-        else:
-            return load_text_file(self.file_path)
+        file_stat = os.stat(pdf_file_path)
+        file_key = (os.path.abspath(pdf_file_path), file_stat.st_size, file_stat.st_mtime_ns)
+        if file_key not in self.file_hash_mapping:
+            self.file_hash_mapping[file_key] = get_file_content_hash(pdf_file_path)
+        return self.file_hash_mapping[file_key]
 
-    def pdf_pdftotext_reader(self, pages: str = 'all'):
-        """Extract the text from pdf file via pdftotext. for more lemma_info, visit: https://pypi.org/project/pdftotext/
+    def get_cache_file_path(self, file_hash: str) -> str:
+        """Provides path of cache entry. Entries are spread over sub directories named by first two hash characters.
+
+        Parameters
+        ----------
+        file_hash : str
+            This is hexadecimal sha256 hash of pdf file content.
+
+        Returns
+        -------
+        str
+            This is the path of cache entry file.
+
+        """
+        return os.path.join(self.cache_directory_path, file_hash[:2], file_hash + self.cache_file_extension)
+
+    def load_entry(self, file_hash: str) -> Dict[str, List[str]]:
+        """Load cache entry of pdf file content hash.
+
+        Parameters
+        ----------
+        file_hash : str
+            This is hexadecimal sha256 hash of pdf file content.
+
+        Returns
+        -------
+        Dict[str, List[str]]
+            This contains pdf reader name as key and pages text list as value. It is empty if nothing is cached.
+
+        """
+        cache_file_path = self.get_cache_file_path(file_hash)
+        if not os.path.exists(cache_file_path):
+            return {}
+        try:
+            with gzip.open(cache_file_path, "rt", encoding="utf-8") as cache_file:
+                return json.load(cache_file)
+        except (OSError, ValueError):
+            print(f"cache entry {cache_file_path} is corrupted, pdf text will be extracted again.")
+            return {}
+
+    def save_entry(self, file_hash: str, entry: Dict[str, List[str]]) -> None:
+        """Save cache entry of pdf file content hash. It writes temporary file first so partial entries are never read.
+
+        Parameters
+        ----------
+        file_hash : str
+            This is hexadecimal sha256 hash of pdf file content.
+        entry : Dict[str, List[str]]
+            This contains pdf reader name as key and pages text list as value.
+
+        Returns
+        -------
+        None
+
+        """
+        cache_file_path = self.get_cache_file_path(file_hash)
+        os.makedirs(os.path.dirname(cache_file_path), exist_ok=True)
+        temporary_file_path = f"{cache_file_path}.{os.getpid()}.tmp"
+        with gzip.open(temporary_file_path, "wt", encoding="utf-8") as cache_file:
+            json.dump(entry, cache_file)
+        os.replace(temporary_file_path, cache_file_path)
+
+    def get_pages(self, pdf_file_path: str, pdf_reader: str = "pdftotext") -> Union[List[str], None]:
+        """Get cached pages text of pdf file extracted by pdf_reader.
+
+        Parameters
+        ----------
+        pdf_file_path : str
+            This is the path of pdf file.
+        pdf_reader : str
+            This is python pdf reader package name which converted pdf to text. 'pdftotext' or 'pymupdf'.
+
+        Returns
+        -------
+        Union[List[str], None]
+            This list contains text of each page of pdf file. None if it is not cached.
+
+        """
+        return self.load_entry(self.get_file_hash(pdf_file_path)).get(pdf_reader)
+
+    def set_pages(self, pdf_file_path: str, pages_list: List[str], pdf_reader: str = "pdftotext") -> None:
+        """Add pages text of pdf file extracted by pdf_reader into cache, keeping text of other pdf readers.
+
+        Parameters
+        ----------
+        pdf_file_path : str
+            This is the path of pdf file.
+        pages_list : List[str]
+            This list contains text of each page of pdf file.
+        pdf_reader : str
+            This is python pdf reader package name which converted pdf to text. 'pdftotext' or 'pymupdf'.
+
+        Returns
+        -------
+        None
+
+        """
+        file_hash = self.get_file_hash(pdf_file_path)
+        entry = self.load_entry(file_hash)
+        entry[pdf_reader] = pages_list
+        self.save_entry(file_hash, entry)
+
+    def is_pdf_reader_available(self, pdf_reader: str) -> bool:
+        """Check if library of pdf_reader is installed. pdf readers functions give empty pages list without it, which
+        must not be cached as pdf file without text.
+
+        Parameters
+        ----------
+        pdf_reader : str
+            This is python pdf reader package name. 'pdftotext' or 'pymupdf'.
+
+        Returns
+        -------
+        bool
+            True if library of pdf_reader can be imported.
+
+        """
+        return importlib.util.find_spec(self.pdf_readers_modules[pdf_reader]) is not None
+
+    def get_or_extract_pages(self, pdf_file_path: str, pdf_reader: str = "pdftotext",
+                             cache_empty_pages: bool = True) -> List[str]:
+        """Get pages text from cache, if not cached then extract pages text using pdf_reader and cache it. Pdf readers
+        errors are not caught here. Empty result of missing pdf reader library is never cached.
+
+        Parameters
+        ----------
+        pdf_file_path : str
+            This is the path of pdf file.
+        pdf_reader : str
+            This is python pdf reader package name which converts pdf to text. 'pdftotext' or 'pymupdf'.
+        cache_empty_pages : bool
+            If True, pdf files without text like scanned pdf files are cached with empty pages list so they are not
+            extracted again in next runs.
+
+        Returns
+        -------
+        List[str]
+            This list contains text of each page of pdf file.
+
+        """
+        if pdf_reader not in self.pdf_readers_functions:
+            raise NotImplementedError(f"pdf_reader {pdf_reader} not Implemented, Use 'pdftotext' or 'pymupdf'.")
+
+        pages_list = self.get_pages(pdf_file_path, pdf_reader)
+        if pages_list is None:
+            pages_list = self.pdf_readers_functions[pdf_reader](pdf_file_path)
+            if "".join(pages_list) or (cache_empty_pages and self.is_pdf_reader_available(pdf_reader)):
+                self.set_pages(pdf_file_path, pages_list, pdf_reader)
+        return pages_list
+
+    def iter_or_extract_pages(self, pdf_file_path: str, pdf_reader: str = "pdftotext",
+                              cache_empty_pages: bool = True) -> Iterator[str]:
+        """Lazily yield pages text from cache, if not cached then pages are extracted one by one using pdf_reader. Pages
+        are cached only when caller reads all of them, so callers stopping early never extract the remaining pages.
+
+        Parameters
+        ----------
+        pdf_file_path : str
+            This is the path of pdf file.
+        pdf_reader : str
+            This is python pdf reader package name which converts pdf to text. 'pdftotext' or 'pymupdf'.
+        cache_empty_pages : bool
+            If True, pdf files without text are cached with empty pages list, check get_or_extract_pages.
+
+        Returns
+        -------
+        Iterator[str]
+            This yields text of each page of pdf file.
+
+        """
+        if pdf_reader not in self.pdf_readers_iter_functions:
+            raise NotImplementedError(f"pdf_reader {pdf_reader} not Implemented, Use 'pdftotext' or 'pymupdf'.")
+
+        pages_list = self.get_pages(pdf_file_path, pdf_reader)
+        if pages_list is not None:
+            yield from pages_list
+            return
+        pages_list = []
+        for page_text in self.pdf_readers_iter_functions[pdf_reader](pdf_file_path):
+            pages_list.append(page_text)
+            yield page_text
+        # this is reached only if caller read all pages.
+        if "".join(pages_list) or (cache_empty_pages and self.is_pdf_reader_available(pdf_reader)):
+            self.set_pages(pdf_file_path, pages_list, pdf_reader)
+
+    def get_text(self, pdf_file_path: str, pages: Union[str, int] = "all", pdf_reader: str = "pdftotext") -> str:
+        """Get text of pdf file from cache, if not cached then extract it using pdf_reader and cache it.
+
+        Parameters
+        ----------
+        pdf_file_path : str
+            This is the path of pdf file.
+        pages : Union[str, int]
+            This could be 'all' to get full text of pdf, 'first' for first page of pdf or index of page.
+        pdf_reader : str
+            This is python pdf reader package name which converts pdf to text. 'pdftotext' or 'pymupdf'.
+
+        Returns
+        -------
+        str
+            This is the required text from pdf file.
+
+        """
+        return get_text_from_pages_list(self.get_or_extract_pages(pdf_file_path, pdf_reader), pages)
+
+
+def iter_pages_from_pdf(pdf_file_path: str, pdf_reader: str = 'pdftotext',
+                        pdf_text_cache: PdfTextCache = None) -> Iterator[str]:
+    """Lazily yield the text of pdf file page by page using either pdftotext or pymupdf.
+
+    Parameters
+    ----------
+    pdf_file_path : str
+        This is the path of pdf file.
+    pdf_reader : str
+        This is python pdf reader package which convert pdf to text.
+    pdf_text_cache : PdfTextCache
+        This is optional cache of pdf pages text. If given, pages come from cache, else they are extracted lazily and
+        cached only when all pages are read, check PdfTextCache.iter_or_extract_pages.
+
+    Returns
+    -------
+    Iterator[str]
+        This yields text of each page of pdf file.
+
+    """
+    if pdf_text_cache is not None:
+        yield from pdf_text_cache.iter_or_extract_pages(pdf_file_path, pdf_reader)
+    elif pdf_reader == 'pdftotext':
+        yield from iter_pages_from_pdf_pdftotext(pdf_file_path)
+    elif pdf_reader == 'pymupdf':
+        yield from iter_pages_from_pdf_pymupdf(pdf_file_path)
+    else:
+        raise NotImplementedError(f"pdf_reader {pdf_reader} not Implemented, Use 'pdftotext' or 'pymupdf'.")
+
+
+def iter_pages_from_multiple_pdf_reader(pdf_file_path: str, pdf_text_cache: PdfTextCache = None) -> Iterator[str]:
+    """Lazily yield the text of pdf file page by page using pdftotext. if it fails or finds no text then pages come
+    from pymupdf. Leading empty pages are held back until some text is found so readers are never mixed.
+
+    Parameters
+    ----------
+    pdf_file_path : str
+        This is the path of pdf file.
+    pdf_text_cache : PdfTextCache
+        This is optional cache of pdf pages text.
+
+    Returns
+    -------
+    Iterator[str]
+        This yields text of each page of pdf file.
+
+    """
+    for pdf_reader in ('pdftotext', 'pymupdf'):
+        empty_pages_count = 0
+        text_found = False
+        try:
+            for page_text in iter_pages_from_pdf(pdf_file_path, pdf_reader, pdf_text_cache):
+                if not text_found:
+                    if not page_text:
+                        empty_pages_count += 1
+                        continue
+                    text_found = True
+                    for _ in range(empty_pages_count):
+                        yield ""
+                yield page_text
+        except Exception:
+            if not text_found:
+                continue
+        if text_found:
+            return
+
+
+def get_text_from_pdf(pdf_file_path: str, pages: str = 'all', pdf_reader: str = 'pdftotext',
+                      pdf_text_cache: PdfTextCache = None) -> Union[str, bool]:
+    """This Function get text from pdf files using either pdftotext or pymupdf.
+
+    Parameters
+    ----------
+    pdf_reader : str
+        This is python pdf reader package which convert pdf to text.
+    pdf_file_path : str
+        This is the path of pdf file.
+    pages : str
+        This could be 'all' to get full text of pdf and 'first' for first page of pdf.
+    pdf_text_cache : PdfTextCache
+        This is optional cache of pdf pages text. If given, text is extracted only when it is not cached.
+
+    Returns
+    -------
+    str
+        This is the required text from pdf file.
+
+    """
+    try:
+        if pdf_text_cache is not None:
+            return pdf_text_cache.get_text(pdf_file_path, pages, pdf_reader)
+        if pdf_reader == 'pdftotext':
+            pdf_text = get_text_from_pdf_pdftotext(pdf_file_path, pages)
+            return pdf_text
+        elif pdf_reader == 'pymupdf':
+            pdf_text = get_text_from_pdf_pymupdf(pdf_file_path, pages)
+            return pdf_text
+        else:
+            print("Not Implemented")
+    except Exception:
+        return ""
+
+
+def get_text_from_multiple_pdf_reader(pdf_file_path: str, pages: str = 'all',
+                                      pdf_text_cache: PdfTextCache = None) -> Union[str, bool]:
+    """This Function get text from pdf files using pdftotext. if failed then text comes from pymupdf.
+
+    Parameters
+    ----------
+    pdf_file_path : str
+        This is the path of pdf file.
+    pages : str
+        This could be 'all' to get full text of pdf and 'first' for first page of pdf.
+    pdf_text_cache : PdfTextCache
+        This is optional cache of pdf pages text. If given, text is extracted only when it is not cached.
+
+    Returns
+    -------
+    str
+        This is the required text from pdf file.
+
+    """
+    pdf_text = get_text_from_pdf(pdf_file_path, pages, 'pdftotext', pdf_text_cache)
+    if pdf_text == "":
+        pdf_text = get_text_from_pdf(pdf_file_path, pages, 'pymupdf', pdf_text_cache)
+    return pdf_text
+
+
+def extract_pdf_pages_with_multiple_pdf_reader(pdf_file_path: str,
+                                               pdf_readers: List[str] = None) -> Dict[str, Dict[str, Any]]:
+    """Extract pages text of pdf file using pdftotext. if it fails or finds no text then pymupdf is used. Errors of each
+    pdf reader are reported instead of being ignored.
+
+    Parameters
+    ----------
+    pdf_file_path : str
+        This is the path of pdf file.
+    pdf_readers : List[str]
+        optional list of pdf readers to run, all of them are run even if one finds text. By default pdf readers are
+        tried in order until one finds text.
+
+    Returns
+    -------
+    Dict[str, Dict[str, Any]]
+        This contains pdf reader name as key and its outcome as value, either {"pages": [page text, ...]} or
+        {"error": "error type: error message"}. Example - {"pdftotext": {"error": "Error: poppler error creating
+        document"}, "pymupdf": {"pages": ["page 1 text", ...]}}
+
+    """
+    pdf_readers_outcomes = {}
+    for pdf_reader, get_pages_function in PdfTextCache.pdf_readers_functions.items():
+        if pdf_readers is not None and pdf_reader not in pdf_readers:
+            continue
+        try:
+            pages_list = get_pages_function(pdf_file_path)
+        except MemoryError:
+            pdf_readers_outcomes[pdf_reader] = {"error": "MemoryError: memory limit exceeded"}
+            continue
+        except Exception as error:
+            pdf_readers_outcomes[pdf_reader] = {"error": f"{type(error).__name__}: {error}"}
+            continue
+        pdf_readers_outcomes[pdf_reader] = {"pages": pages_list}
+        if pdf_readers is None and "".join(pages_list):
+            break
+    return pdf_readers_outcomes
+
+
+def pdf_extraction_worker(connection, memory_limit_mb: int = None) -> None:
+    """This runs inside worker process of PdfExtractionPool. It receives pdf file path and pdf readers from connection
+    and sends back pdf readers outcomes until it receives None.
+
+    Parameters
+    ----------
+    connection : multiprocessing.connection.Connection
+        This is the worker side of pipe connected to PdfExtractionPool.
+    memory_limit_mb : int
+        This is optional limit on address space of worker process in megabytes. It works on unix like systems only.
+        It includes python interpreter and imported libraries of worker process, not only the pdf reader.
+
+    Returns
+    -------
+    None
+
+    """
+    if memory_limit_mb:
+        try:
+            import resource
+            memory_limit_bytes = memory_limit_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (memory_limit_bytes, memory_limit_bytes))
+        except (ImportError, ValueError, OSError):
+            print("memory limit on pdf extraction is not supported on this platform.")
+
+    while True:
+        task = connection.recv()
+        if task is None:
+            break
+        connection.send(extract_pdf_pages_with_multiple_pdf_reader(*task))
+    connection.close()
+
+
+class PdfExtractionWorker:
+    """This is one worker process of PdfExtractionPool with the pdf file it is currently extracting. Workers are
+    started with spawn method, so they do not inherit address space of parent process and memory limit applies to the
+    worker only.
+
+    """
+    multiprocessing_context = multiprocessing.get_context("spawn")
+
+    def __init__(self, memory_limit_mb: int = None):
+        """Starts the worker process.
+
+        Parameters
+        ----------
+        memory_limit_mb : int
+            This is optional limit on address space of worker process in megabytes.
+        """
+        self.connection, worker_connection = self.multiprocessing_context.Pipe()
+        self.process = self.multiprocessing_context.Process(target=pdf_extraction_worker,
+                                                            args=(worker_connection, memory_limit_mb), daemon=True)
+        self.process.start()
+        worker_connection.close()
+        self.task = None
+        self.task_start_time = None
+        self.tasks_done = 0
+
+    def submit(self, task_index: int, pdf_file_path: str, pdf_readers: List[str] = None) -> None:
+        """Send pdf file path to worker process for extraction.
+
+        Parameters
+        ----------
+        task_index : int
+            This is the position of pdf file path in input list.
+        pdf_file_path : str
+            This is the path of pdf file.
+        pdf_readers : List[str]
+            optional list of pdf readers to run, check extract_pdf_pages_with_multiple_pdf_reader.
+
+        Returns
+        -------
+        None
+
+        """
+        self.connection.send((pdf_file_path, pdf_readers))
+        self.task = (task_index, pdf_file_path)
+        self.task_start_time = time.monotonic()
+
+    def stop(self, kill: bool = False) -> None:
+        """Stop the worker process. Busy or hung workers are killed.
+
+        Parameters
+        ----------
+        kill : bool
+            kill worker process instead of asking it to exit.
+
+        Returns
+        -------
+        None
+
+        """
+        if not kill and self.task is None:
+            try:
+                self.connection.send(None)
+                self.process.join(timeout=5)
+            except (OSError, EOFError):
+                pass
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.connection.close()
+
+
+class PdfExtractionPool:
+    """This extracts pdf text in separate worker processes so a malformed pdf that hangs pdf readers or uses too much
+    memory can not stall the validation or search count step. Extracted pages are saved in PdfTextCache.
+
+    """
+    file_path_key = "file_path"
+    status_key = "status"
+    pdf_reader_key = "pdf_reader"
+    pages_key = "pages"
+    errors_key = "errors"
+
+    status_ok = "ok"
+    status_empty = "empty"
+    status_error = "error"
+    status_timeout = "timeout"
+    status_crashed = "crashed"
+
+    def __init__(self, cache_directory_path: str = ".systematic_review_cache", processes: int = None,
+                 timeout: float = 120, memory_limit_mb: int = 2048, max_tasks_per_worker: int = 100):
+        """
+
+        Parameters
+        ----------
+        cache_directory_path : str
+            This is the path of directory where extracted pages text is cached.
+        processes : int
+            This is the number of worker processes. default to number of cpus.
+        timeout : float
+            This is wall-clock seconds allowed for one pdf file. Worker is killed and replaced after this time.
+        memory_limit_mb : int
+            This is the limit on address space of each worker process in megabytes. None for no limit. Workers are
+            spawned fresh processes, so limit covers python interpreter, imported libraries and the pdf reader.
+        max_tasks_per_worker : int
+            Worker process is replaced by new one after extracting this many pdf files to release leaked memory.
+        """
+        self.pdf_text_cache = PdfTextCache(cache_directory_path)
+        self.processes = processes or os.cpu_count() or 1
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.max_tasks_per_worker = max_tasks_per_worker
+
+    def create_result(self, pdf_file_path: str, status: str, pdf_reader: str = None, pages_list: List[str] = None,
+                      errors: Dict[str, str] = None) -> Dict[str, Any]:
+        """Creates the result record of one pdf file.
+
+        Parameters
+        ----------
+        pdf_file_path : str
+            This is the path of pdf file.
+        status : str
+            This is one of status_ok, status_empty, status_error, status_timeout, status_crashed.
+        pdf_reader : str
+            This is the name of pdf reader which extracted the text.
+        pages_list : List[str]
+            This list contains text of each page of pdf file.
+        errors : Dict[str, str]
+            This contains pdf reader name as key and error as value.
+
+        Returns
+        -------
+        Dict[str, Any]
+            This is the result record.
+
+        """
+        return {self.file_path_key: pdf_file_path, self.status_key: status, self.pdf_reader_key: pdf_reader,
+                self.pages_key: pages_list if pages_list is not None else [], self.errors_key: errors or {}}
+
+    def get_cached_result(self, pdf_file_path: str, pdf_readers: List[str] = None) -> Union[Dict[str, Any], None]:
+        """Provides result from cache if any pdf reader has already extracted text of pdf file, or if all pdf readers
+        are cached without text.
+
+        Parameters
+        ----------
+        pdf_file_path : str
+            This is the path of pdf file.
+        pdf_readers : List[str]
+            optional list of pdf readers which all must be cached. By default one pdf reader with text is enough.
+
+        Returns
+        -------
+        Union[Dict[str, Any], None]
+            This is the result record or None if text is not cached.
+
+        """
+        entry = self.pdf_text_cache.load_entry(self.pdf_text_cache.get_file_hash(pdf_file_path))
+        if pdf_readers is not None and any(pdf_reader not in entry for pdf_reader in pdf_readers):
+            return None
+        for pdf_reader in pdf_readers or self.pdf_text_cache.pdf_readers_functions:
+            if "".join(entry.get(pdf_reader, [])):
+                return self.create_result(pdf_file_path, self.status_ok, pdf_reader, entry[pdf_reader])
+        if all(pdf_reader in entry for pdf_reader in pdf_readers or self.pdf_text_cache.pdf_readers_functions):
+            return self.create_result(pdf_file_path, self.status_empty)
+        return None
+
+    def result_from_pdf_readers_outcomes(self, pdf_file_path: str,
+                                         pdf_readers_outcomes: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """Saves pdf readers outcomes into cache and creates result record. Errors of pdf readers are not cached, same
+        as timeouts and crashes, so failed pdf readers are tried again in next runs instead of giving empty text.
+
+        Parameters
+        ----------
+        pdf_file_path : str
+            This is the path of pdf file.
+        pdf_readers_outcomes : Dict[str, Dict[str, Any]]
+            This is output of extract_pdf_pages_with_multiple_pdf_reader.
+
+        Returns
+        -------
+        Dict[str, Any]
+            This is the result record.
+
+        """
+        errors = {}
+        result = None
+        for pdf_reader, outcome in pdf_readers_outcomes.items():
+            if "error" in outcome:
+                errors[pdf_reader] = outcome["error"]
+                continue
+            pages_list = outcome[self.pages_key]
+            if pages_list or self.pdf_text_cache.is_pdf_reader_available(pdf_reader):
+                self.pdf_text_cache.set_pages(pdf_file_path, pages_list, pdf_reader)
+            if result is None and "".join(pages_list):
+                result = self.create_result(pdf_file_path, self.status_ok, pdf_reader, pages_list)
+
+        if result is not None:
+            result[self.errors_key] = errors
+            return result
+        status = self.status_error if errors else self.status_empty
+        return self.create_result(pdf_file_path, status, errors=errors)
+
+    def extract_many(self, pdf_files_path_list: List[str], pdf_readers: List[str] = None) -> List[Dict[str, Any]]:
+        """Extract text of all pdf files in worker processes. Cached pdf files are not extracted again.
+
+        Parameters
+        ----------
+        pdf_files_path_list : List[str]
+            This list contains path of pdf files.
+        pdf_readers : List[str]
+            optional list of pdf readers to run for each pdf file, example - ['pymupdf'] when text of pdftotext is not
+            enough. By default pdf readers are tried in order until one finds text.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            This list contains result record of each pdf file in the same order as input. Example - [{'file_path':
+            'article.pdf', 'status': 'ok', 'pdf_reader': 'pdftotext', 'pages': ['page 1 text', ...], 'errors': {}}]
+
+        """
+        results = [None] * len(pdf_files_path_list)
+        pending_tasks = collections.deque()
+        for task_index, pdf_file_path in enumerate(pdf_files_path_list):
+            try:
+                results[task_index] = self.get_cached_result(pdf_file_path, pdf_readers)
+            except OSError as error:
+                results[task_index] = self.create_result(pdf_file_path, self.status_error,
+                                                         errors={"file": f"{type(error).__name__}: {error}"})
+            if results[task_index] is None:
+                pending_tasks.append((task_index, pdf_file_path))
+
+        workers = [PdfExtractionWorker(self.memory_limit_mb) for _ in range(min(self.processes, len(pending_tasks)))]
+        try:
+            while True:
+                for worker in workers:
+                    if worker.task is None and pending_tasks:
+                        worker.submit(*pending_tasks.popleft(), pdf_readers)
+                busy_workers = [worker for worker in workers if worker.task is not None]
+                if not busy_workers:
+                    break
+
+                wait_time = min(worker.task_start_time for worker in busy_workers) + self.timeout - time.monotonic()
+                ready_connections = multiprocessing.connection.wait([worker.connection for worker in busy_workers],
+                                                                    max(wait_time, 0))
+                for worker in busy_workers:
+                    task_index, pdf_file_path = worker.task
+                    if worker.connection in ready_connections:
+                        try:
+                            pdf_readers_outcomes = worker.connection.recv()
+                        except (EOFError, OSError):
+                            results[task_index] = self.create_result(pdf_file_path, self.status_crashed)
+                            replace_worker = True
+                        else:
+                            results[task_index] = self.result_from_pdf_readers_outcomes(pdf_file_path,
+                                                                                        pdf_readers_outcomes)
+                            worker.tasks_done += 1
+                            replace_worker = worker.tasks_done >= self.max_tasks_per_worker
+                            worker.task = None
+                    elif time.monotonic() - worker.task_start_time >= self.timeout:
+                        results[task_index] = self.create_result(pdf_file_path, self.status_timeout)
+                        replace_worker = True
+                    else:
+                        continue
+
+                    if replace_worker:
+                        worker.stop(kill=worker.task is not None)
+                        workers[workers.index(worker)] = PdfExtractionWorker(self.memory_limit_mb)
+        finally:
+            for worker in workers:
+                worker.stop(kill=worker.task is not None)
+
+        return results
+
+    def extract(self, pdf_file_path: str, pdf_readers: List[str] = None) -> Dict[str, Any]:
+        """Extract text of one pdf file in worker process.
+
+        Parameters
+        ----------
+        pdf_file_path : str
+            This is the path of pdf file.
+        pdf_readers : List[str]
+            optional list of pdf readers to run, check extract_many.
+
+        Returns
+        -------
+        Dict[str, Any]
+            This is the result record. Example - {'file_path': 'article.pdf', 'status': 'ok', 'pdf_reader': 'pdftotext',
+            'pages': ['page 1 text', ...], 'errors': {}}
+
+        """
+        return self.extract_many([pdf_file_path], pdf_readers)[0]
+
+    def get_failed_files_path(self, pdf_files_path_list: List[str], pdf_readers: List[str] = None) -> set:
+        """Extract text of all pdf files and provides paths of pdf files without any text.
+
+        Parameters
+        ----------
+        pdf_files_path_list : List[str]
+            This list contains path of pdf files.
+        pdf_readers : List[str]
+            optional list of pdf readers to run, check extract_many.
+
+        Returns
+        -------
+        set
+            This set contains paths of pdf files which failed, timed out, crashed worker or have no text.
+
+        """
+        return {result[self.file_path_key] for result in self.extract_many(pdf_files_path_list, pdf_readers)
+                if result[self.status_key] != self.status_ok}
+
+
+def iter_excel_file_chunks(file_path: str, chunksize: int = 100000, usecols: list = None, dtype=None,
+                           sheet_name: Union[str, int] = 0, **kwargs) -> Iterator[pd.DataFrame]:
+    """Read excel file chunk by chunk. xlsx files are streamed row by row with openpyxl read only mode, other excel
+    formats or calls with other pandas.read_excel arguments are read whole by pandas and then split into chunks.
+
+    Parameters
+    ----------
+    file_path : str
+        This is the path of excel file.
+    chunksize : int
+        number of rows per chunk.
+    usecols : list
+        optional list of columns names to read.
+    dtype : Union[str, dict]
+        optional data type of columns, example - str or {'year': 'Int64'}. Empty cells are kept as missing values.
+    sheet_name : Union[str, int]
+        name or index of sheet to read.
+    kwargs : Dict[str, Any]
+        These are other arguments of pandas.read_excel like header or skiprows.
+
+    Returns
+    -------
+    Iterator[pd.DataFrame]
+        This yields dataframe of at most chunksize rows.
+
+    """
+    if kwargs or os_utils.get_file_extension_from_path(file_path) not in ("xlsx", "xlsm"):
+        dataframe = pd.read_excel(file_path, sheet_name=sheet_name, usecols=usecols, dtype=dtype, **kwargs)
+        for start in range(0, len(dataframe), chunksize):
+            yield dataframe.iloc[start:start + chunksize]
+        return
+
+    try:
+        import openpyxl
+    except ImportError:
+        raise ImportError("""This function requires openpyxl library to read excel files.
+
+        Install openpyxl using:
+        python -m pip install --upgrade openpyxl
+
+        for more info, please visit https://pypi.org/project/openpyxl/""")
+
+    workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        worksheet = workbook.worksheets[sheet_name] if isinstance(sheet_name, int) else workbook[sheet_name]
+        rows = worksheet.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        columns_index = [index for index, column in enumerate(header) if usecols is None or column in usecols]
+        columns_name = [header[index] for index in columns_index]
+
+        while True:
+            rows_chunk = [[row[index] if index < len(row) else None for index in columns_index]
+                          for row in itertools.islice(rows, chunksize)]
+            if not rows_chunk:
+                break
+            dataframe = pd.DataFrame(rows_chunk, columns=columns_name, dtype=object if dtype is not None else None)
+            if dtype is not None:
+                dataframe = dataframe.astype(dtype).mask(dataframe.isna())
+            yield dataframe
+    finally:
+        workbook.close()
+
+
+def get_parquet_file(file_path: str):
+    """Open parquet file with pyarrow without reading its rows. ImportError is raised if pyarrow is not installed, so
+    parquet files are never read as empty.
+
+    Parameters
+    ----------
+    file_path : str
+        This is the path of parquet file.
+
+    Returns
+    -------
+    pyarrow.parquet.ParquetFile
+        This is the parquet file object giving schema and record batches.
+
+    """
+    try:
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("""This function requires pyarrow library to read parquet files.
+
+        Install pyarrow using:
+        python -m pip install --upgrade pyarrow
+
+        for more info, please visit https://pypi.org/project/pyarrow/""")
+    return pyarrow.parquet.ParquetFile(file_path)
+
+
+def iter_parquet_file_chunks(file_path: str, chunksize: int = 100000, usecols: list = None) -> Iterator[pd.DataFrame]:
+    """Read parquet file batch by batch using pyarrow, only chunksize rows of usecols are in memory at once.
+
+    Parameters
+    ----------
+    file_path : str
+        This is the path of parquet file.
+    chunksize : int
+        number of rows per chunk.
+    usecols : list
+        optional list of columns names to read.
+
+    Returns
+    -------
+    Iterator[pd.DataFrame]
+        This yields dataframe of at most chunksize rows.
+
+    """
+    parquet_file = get_parquet_file(file_path)
+    for record_batch in parquet_file.iter_batches(batch_size=chunksize, columns=usecols):
+        yield record_batch.to_pandas()
+
+
+def get_tabular_file_columns(file_path: str, input_file_type: str = "read_csv", **kwargs) -> list:
+    """Names of columns of tabular file without reading its rows. Parquet schema is read using pyarrow.
+
+    Parameters
+    ----------
+    file_path : str
+        This is the path of tabular file.
+    input_file_type : str
+        check pandas IO for examples like read_csv, read_parquet etc.
+    kwargs : Dict[str, Any]
+        These are other arguments of pandas IO method.
+
+    Returns
+    -------
+    list
+        This is list of columns names.
+
+    """
+    if input_file_type == "read_parquet":
+        return list(get_parquet_file(file_path).schema_arrow.names)
+    if input_file_type in ("read_csv", "read_table"):
+        kwargs["nrows"] = 0
+    return list(getattr(pd, input_file_type)(file_path, **kwargs).columns)
+
+
+def iter_tabular_file_chunks(file_path: str, input_file_type: str = "read_csv", chunksize: int = 100000,
+                             usecols: list = None, dtype=None, **kwargs) -> Iterator[pd.DataFrame]:
+    """Read tabular file chunk by chunk using pandas IO, so memory use stays same for files of any size.
+
+    Parameters
+    ----------
+    file_path : str
+        This is the path of tabular file.
+    input_file_type : str
+        check pandas IO for examples like read_csv, read_excel etc. read_csv and read_table are read in chunks by
+        pandas, read_excel by iter_excel_file_chunks and read_parquet by iter_parquet_file_chunks. Other methods like
+        read_json read whole file, select usecols and then split it into chunks.
+    chunksize : int
+        number of rows per chunk.
+    usecols : list
+        optional list of columns to read, other columns are never loaded into memory.
+    dtype : Union[str, dict]
+        optional data type of columns, example - str or {'year': 'Int64'}. It avoids type inference.
+    kwargs : Dict[str, Any]
+        These are other arguments of pandas IO method.
+
+    Returns
+    -------
+    Iterator[pd.DataFrame]
+        This yields dataframe of at most chunksize rows.
+
+    """
+    if input_file_type == "read_excel":
+        yield from iter_excel_file_chunks(file_path, chunksize, usecols, dtype, **kwargs)
+        return
+    if input_file_type == "read_parquet":
+        for dataframe in iter_parquet_file_chunks(file_path, chunksize, usecols):
+            yield dataframe if dtype is None else dataframe.astype(dtype)
+        return
+
+    if input_file_type in ("read_csv", "read_table"):
+        if usecols is not None:
+            kwargs["usecols"] = usecols
+        if dtype is not None:
+            kwargs["dtype"] = dtype
+        with getattr(pd, input_file_type)(file_path, chunksize=chunksize, **kwargs) as chunks_reader:
+            yield from chunks_reader
+    else:
+        dataframe = getattr(pd, input_file_type)(file_path, **kwargs)
+        if usecols is not None:
+            dataframe = dataframe[usecols]
+        if dtype is not None:
+            dataframe = dataframe.astype(dtype).mask(dataframe.isna())
+        for start in range(0, len(dataframe), chunksize):
+            yield dataframe.iloc[start:start + chunksize]
+
+
+def get_title_hash(normalized_title: str) -> int:
+    """Provides 64 bit hash of normalized title which is same in every python process.
+
+    Parameters
+    ----------
+    normalized_title : str
+        This is the title after text manipulation.
+
+    Returns
+    -------
+    int
+        This is unsigned 64 bit hash of title.
+
+    """
+    return int.from_bytes(hashlib.blake2b(normalized_title.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class TitleIndex:
+    """On disk mapping from normalized title to record id, which is row number in citations dataframe. Titles are
+    normalized once when the index is built and arrays are memory mapped when loaded, so every step of systematic review
+    can look up titles without loading or normalizing all the citations again.
+
+    Index directory contains sorted 64 bit title hashes, record ids and utf-8 titles as numpy .npy files. Lookups use
+    binary search on hashes and compare stored titles so hash collisions do not give wrong records.
+
+    """
+    metadata_file_name = "title_index.json"
+    arrays_names = ["hashes", "record_ids", "titles_offsets", "titles_bytes"]
+
+    def __init__(self, index_directory_path: str, mmap_mode: Union[str, None] = "r"):
+        """Loads title index from directory created by TitleIndex.build.
+
+        Parameters
+        ----------
+        index_directory_path : str
+            This is the path of directory containing title index files.
+        mmap_mode : Union[str, None]
+            This is numpy memory map mode. 'r' reads only looked up parts of files and None loads arrays in memory.
+
+        """
+        self.index_directory_path = index_directory_path
+        metadata = json_file_to_dict(os.path.join(index_directory_path, self.metadata_file_name))
+        self.text_manipulation_method_name = metadata["text_manipulation_method_name"]
+        self.hashes, self.record_ids, self.titles_offsets, self.titles_bytes = [
+            np.load(os.path.join(index_directory_path, f"{array_name}.npy"), mmap_mode=mmap_mode)
+            for array_name in self.arrays_names]
+
+    @classmethod
+    def build(cls, titles: Iterable[str], index_directory_path: str, record_ids: Iterable[int] = None,
+              text_manipulation_method_name: str = "preprocess_string_to_space_separated_words",
+              normalized: bool = False) -> "TitleIndex":
+        """Normalize titles and save title index to index_directory_path. If same normalized title has many records
+        then first record id is kept.
+
+        Parameters
+        ----------
+        titles : Iterable[str]
+            These are the titles of citations. Missing titles are ignored.
+        index_directory_path : str
+            This is the path of directory to save title index files. It is created if it does not exist.
+        record_ids : Iterable[int]
+            These are the record id of each title. Default is position of title.
+        text_manipulation_method_name : str
+            This is the name of string_manipulation.text_manipulation_methods option used to normalize titles. Same
+            normalization is applied to titles looked up later.
+        normalized : bool
+            True if titles are already normalized with text_manipulation_method_name like 'cleaned_title' column of
+            citations dataframe.
+
+        Returns
+        -------
+        TitleIndex
+            This is the loaded title index.
+
+        """
+        titles = titles.reset_index(drop=True) if isinstance(titles, pd.Series) else pd.Series(list(titles),
+                                                                                            dtype=object)
+        record_ids = np.arange(len(titles), dtype=np.int64) if record_ids is None else np.fromiter(
+            record_ids, dtype=np.int64, count=len(titles))
+        is_title = np.fromiter((isinstance(title, str) for title in titles), dtype=bool, count=len(titles))
+        normalized_titles = titles[is_title] if normalized else titles[is_title].map(
+            lambda title: string_manipulation.text_manipulation_methods(title, text_manipulation_method_name))
+        # first record id of each normalized title is kept.
+        is_first_title = ~normalized_titles.duplicated(keep="first").to_numpy()
+        normalized_titles = normalized_titles[is_first_title]
+        record_ids = record_ids[is_title][is_first_title]
+
+        hashes = np.fromiter(map(get_title_hash, normalized_titles), dtype=np.uint64, count=len(normalized_titles))
+        order = np.argsort(hashes, kind="stable")
+        hashes = hashes[order]
+        record_ids = record_ids[order]
+        titles_encoded = normalized_titles.iloc[order].str.encode("utf-8")
+        titles_offsets = np.zeros(len(titles_encoded) + 1, dtype=np.int64)
+        np.cumsum(titles_encoded.str.len().to_numpy(dtype=np.int64), out=titles_offsets[1:])
+        titles_bytes = np.frombuffer(b"".join(titles_encoded), dtype=np.uint8)
+
+        os.makedirs(index_directory_path, exist_ok=True)
+        for array_name, array in zip(cls.arrays_names, [hashes, record_ids, titles_offsets, titles_bytes]):
+            np.save(os.path.join(index_directory_path, f"{array_name}.npy"), array)
+        write_json_file_with_dict(os.path.join(index_directory_path, cls.metadata_file_name),
+                                  {"text_manipulation_method_name": text_manipulation_method_name,
+                                   "number_of_titles": len(titles_encoded)})
+        return cls(index_directory_path)
+
+    @classmethod
+    def exists(cls, index_directory_path: str) -> bool:
+        """Check if title index is saved in index_directory_path."""
+        return os.path.isfile(os.path.join(index_directory_path, cls.metadata_file_name))
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    def __contains__(self, title: str) -> bool:
+        return self.get(title) is not None
+
+    def normalize_title(self, title: str) -> str:
+        """Normalize title with the text manipulation method used to build the index.
+
+        Parameters
+        ----------
+        title : str
+            This is the title or file name of article.
+
+        Returns
+        -------
+        str
+            This is the normalized title.
+
+        """
+        return string_manipulation.text_manipulation_methods(title, self.text_manipulation_method_name)
+
+    def get_title(self, position: int) -> str:
+        """Provides normalized title at position of sorted index."""
+        return bytes(self.titles_bytes[self.titles_offsets[position]:self.titles_offsets[position + 1]]).decode(
+            "utf-8")
+
+    def get(self, title: str, default: Any = None, normalized: bool = False) -> Any:
+        """Provides record id of title.
+
+        Parameters
+        ----------
+        title : str
+            This is the title or file name of article.
+        default : Any
+            This is returned if title is not in index.
+        normalized : bool
+            True if title is already normalized with text manipulation method of index.
+
+        Returns
+        -------
+        Any
+            This is the record id of title or default.
+
+        """
+        if not isinstance(title, str):
+            return default
+        normalized_title = title if normalized else self.normalize_title(title)
+        title_hash = get_title_hash(normalized_title)
+        position = int(self.hashes.searchsorted(title_hash))
+        while position < len(self.hashes) and self.hashes[position] == title_hash:
+            if self.get_title(position) == normalized_title:
+                return int(self.record_ids[position])
+            position += 1
+        return default
+
+    def get_many(self, titles: Iterable[str], normalized: bool = False):
+        """Provides record ids of many titles.
+
+        Parameters
+        ----------
+        titles : Iterable[str]
+            These are the titles or file names of articles.
+        normalized : bool
+            True if titles are already normalized with text manipulation method of index.
+
+        Returns
+        -------
+        np.ndarray
+            This contains record id of each title, -1 if title is not in index.
+
+        """
+        normalized_titles = [(title if normalized else self.normalize_title(title)) if isinstance(title, str) else None
+                             for title in titles]
+        record_ids = np.full(len(normalized_titles), -1, dtype=np.int64)
+        titles_positions = np.flatnonzero([title is not None for title in normalized_titles])
+        if not len(titles_positions) or not len(self.hashes):
+            return record_ids
+        titles_hashes = np.fromiter((get_title_hash(normalized_titles[position]) for position in titles_positions),
+                                    dtype=np.uint64, count=len(titles_positions))
+        index_positions = np.minimum(self.hashes.searchsorted(titles_hashes), len(self.hashes) - 1)
+        is_hash_found = self.hashes[index_positions] == titles_hashes
+        # only titles whose hash is in index are compared with stored title, in rare hash collision get searches.
+        for title_position, index_position in zip(titles_positions[is_hash_found], index_positions[is_hash_found]):
+            normalized_title = normalized_titles[title_position]
+            record_ids[title_position] = self.record_ids[index_position] if self.get_title(
+                index_position) == normalized_title else self.get(normalized_title, -1, normalized=True)
+        return record_ids
+
+
+class ASReview:
+    def __init__(self, data: Union[List[dict], pd.DataFrame]):
+        """This class export citation files using dataframe or records list in csv file format.
+
+        Parameters
+        ----------
+        data :
+            data could be List[dict] and pd.DataFrame
+
+        """
+        self.data = data
+
+    def get_file(self, output_filename: str = "output.csv", index: bool = True):
+        """Outputs the file needed to start project in ASReview.
+
+        Parameters
+        ----------
+        output_filename : str
+            name or path of your needed file.
+        index : bool
+            asks if you need index column in output file.
+
+        Returns
+        -------
+
+        """
+        if type(self.data) == pd.DataFrame:
+            dataframe = self.data.copy()
+            dataframe['label_included'] = ""
+            dataframe_to_csv_file(dataframe, output_filename, index)
+        elif type(self.data) == list:
+            df = records_list_to_dataframe(self.data)
+            dataframe = df.copy()
+            dataframe['label_included'] = ""
+            dataframe_to_csv_file(dataframe, output_filename, index)
+        else:
+            raise NotImplementedError(f"data type {type(self.data)} not Implemented, Use List[dict] and pd.DataFrame.")
+
+
+class Reader:
+    """Contains functionality to read files.
+
+    """
+
+    def __init__(self, file_path: str, pdf_text_cache: PdfTextCache = None):
+        """Needs file path to read a file.
+
+        Parameters
+        ----------
+        file_path : str
+            path of the file.
+        pdf_text_cache : PdfTextCache
+            optional cache of pdf pages text, pdf files are extracted only when text is not cached.
+        """
+        self.file_path = file_path
+        self.pdf_text_cache = pdf_text_cache
+        self.file_extension = os_utils.get_file_extension_from_path(self.file_path)
+
+    def iter_pages(self, pdf_reader: str = None) -> Iterator:
+        """Lazily yield text of pdf file page by page, so callers needing only the beginning of the text never extract
+        the rest. Other files are yielded as single page.
+
+        Parameters
+        ----------
+        pdf_reader : str
+            optional 'pdftotext' or 'pymupdf'. By default pdftotext is used and pymupdf if pdftotext finds no text.
+
+        Returns
+        -------
+        Iterator
+            This yields text of each page.
+
+        """
+        if self.file_extension != "pdf":
+            yield self.get_text()
+        elif pdf_reader is None:
+            yield from iter_pages_from_multiple_pdf_reader(self.file_path, self.pdf_text_cache)
+        else:
+            yield from iter_pages_from_pdf(self.file_path, pdf_reader, self.pdf_text_cache)
+
+    def get_text(self, pages: str = 'all', max_chars: int = None, stop_when: Callable[[str], bool] = None):
+        """It understand the type of file and output the content of file.
+
+        Parameters
+        ----------
+        pages : str
+            contain option to read 'first' or 'all' pages.
+        max_chars : int
+            optional limit on length of pdf text, pdf pages after this limit are not read.
+        stop_when : Callable[[str], bool]
+            optional function taking text of one pdf page, pdf pages after the page it returns True are not read.
+
+        Returns
+        -------
+        str
+            This is text in readable file.
+
+        """
+        if self.file_extension == "pdf":
+            if max_chars is None and stop_when is None:
+                return get_text_from_multiple_pdf_reader(self.file_path, pages, self.pdf_text_cache)
+            return join_pages_text(self.iter_pages(), pages, max_chars, stop_when)
+        elif self.file_extension == "csv":
+            return self.pandas_reader("read_csv")
+        elif self.file_extension[0] == "x":
+            return self.pandas_reader("read_excel")
+        elif self.file_extension == "json":
+            return json_file_to_dict(self.file_path)
+        else:
+            return load_text_file(self.file_path)
+
+    def pdf_pdftotext_reader(self, pages: str = 'all', max_chars: int = None, stop_when: Callable[[str], bool] = None):
+        """Extract the text from pdf file via pdftotext. for more lemma_info, visit: https://pypi.org/project/pdftotext/
 
         Parameters
         ----------
         pages : str
             This could be 'all' to get full text of pdf and 'first' for first page of pdf.
+        max_chars : int
+            optional limit on length of text, pages after this limit are not read.
+        stop_when : Callable[[str], bool]
+            optional function taking text of one page, pages after the page it returns True are not read.
 
         Returns
         -------
@@ -821,20 +2481,24 @@ class Reader:
             This is the required text from pdf file.
 
         """
+        if max_chars is None and stop_when is None:
+            return get_text_from_pdf(self.file_path, pages, 'pdftotext', self.pdf_text_cache)
         try:
-            pdf_text = get_text_from_pdf_pdftotext(self.file_path, pages)
+            return join_pages_text(self.iter_pages('pdftotext'), pages, max_chars, stop_when)
         except Exception:
-            pdf_text = ""
-
-        return pdf_text
+            return ""
 
-    def pdf_pymupdf_reader(self, pages: str = 'all'):
+    def pdf_pymupdf_reader(self, pages: str = 'all', max_chars: int = None, stop_when: Callable[[str], bool] = None):
         """Extract the text from pdf file via fitz(PyMuPDF). for more lemma_info, visit: https://pypi.org/project/PyMuPDF/
 
         Parameters
         ----------
         pages : str
             This could be 'all' to get full text of pdf and 'first' for first page of pdf.
+        max_chars : int
+            optional limit on length of text, pages after this limit are not read.
+        stop_when : Callable[[str], bool]
+            optional function taking text of one page, pages after the page it returns True are not read.
 
         Returns
         -------
@@ -842,26 +2506,300 @@ class Reader:
             This is the required text from pdf file.
 
         """
+        if max_chars is None and stop_when is None:
+            return get_text_from_pdf(self.file_path, pages, 'pymupdf', self.pdf_text_cache)
         try:
-            pdf_text = get_text_from_pdf_pymupdf(self.file_path, pages)
+            return join_pages_text(self.iter_pages('pymupdf'), pages, max_chars, stop_when)
         except Exception:
-            pdf_text = ""
+            return ""
 
-        return pdf_text
-
-    def pandas_reader(self, input_file_type):
+    def pandas_reader(self, input_file_type, chunksize: int = None, usecols: list = None, dtype=None, **kwargs):
         """Read file using pandas IO https://pandas.pydata.org/pandas-docs/stable/user_guide/io.html
 
         Parameters
         ----------
         input_file_type : str
             check pandas IO for examples like read_csv, read_excel etc.
+        chunksize : int
+            optional number of rows per chunk. If given, iterator of dataframes is returned instead of one dataframe.
+        usecols : list
+            optional list of columns to read, other columns are never loaded into memory.
+        dtype : Union[str, dict]
+            optional data type of columns, example - str or {'year': 'Int64'}. It avoids type inference.
+        kwargs : Dict[str, Any]
+            These are other arguments of pandas IO method.
 
         Returns
         -------
-        str
-            This is the required text from pandas IO.
+        Union[pd.DataFrame, Iterator[pd.DataFrame]]
+            This is the required dataframe from pandas IO or iterator of dataframes if chunksize is given.
 
         """
-        dataframe = getattr(pd, input_file_type)(self.file_path)
+        if chunksize:
+            return iter_tabular_file_chunks(self.file_path, input_file_type, chunksize, usecols, dtype, **kwargs)
+        if usecols is not None:
+            kwargs["usecols"] = usecols
+        if dtype is not None:
+            kwargs["dtype"] = dtype
+        dataframe = getattr(pd, input_file_type)(self.file_path, **kwargs)
         return dataframe
+
+    def iter_chunks(self, chunksize: int = 100000, usecols: list = None, dtype=None,
+                    **kwargs) -> Iterator[pd.DataFrame]:
+        """Read csv or excel file chunk by chunk, so memory use stays same for files of any size.
+
+        Parameters
+        ----------
+        chunksize : int
+            number of rows per chunk.
+        usecols : list
+            optional list of columns to read, other columns are never loaded into memory.
+        dtype : Union[str, dict]
+            optional data type of columns, example - str or {'year': 'Int64'}.
+        kwargs : Dict[str, Any]
+            These are other arguments of pandas IO method.
+
+        Returns
+        -------
+        Iterator[pd.DataFrame]
+            This yields dataframe of at most chunksize rows.
+
+        """
+        if self.file_extension == "csv":
+            return self.pandas_reader("read_csv", chunksize, usecols, dtype, **kwargs)
+        elif self.file_extension[0] == "x":
+            return self.pandas_reader("read_excel", chunksize, usecols, dtype, **kwargs)
+        else:
+            raise NotImplementedError(f"file extension {self.file_extension} not Implemented, Use csv or excel files.")
+
+
+def read_file_bytes(file_path: str) -> bytes:
+    """Read whole file as bytes.
+
+    Parameters
+    ----------
+    file_path : str
+        path of the file.
+
+    Returns
+    -------
+    bytes
+        This is the content of file.
+
+    """
+    with open(file_path, "rb") as file:
+        return file.read()
+
+
+def get_pages_from_pdf_bytes(pdf_bytes: bytes, pdf_reader: str = 'pdftotext') -> List[str]:
+    """Extract the text of every page from pdf content already read into memory using either pdftotext or pymupdf.
+
+    Parameters
+    ----------
+    pdf_bytes : bytes
+        This is the content of pdf file.
+    pdf_reader : str
+        This is python pdf reader package which convert pdf to text.
+
+    Returns
+    -------
+    List[str]
+        This list contains text of each page of pdf file. It is empty if pdf reader is not installed.
+
+    """
+    if pdf_reader == 'pdftotext':
+        try:
+            import pdftotext
+        except ImportError:
+            print("This function requires pdftotext library to read pdfs. for more info, please visit "
+                  "https://pypi.org/project/pdftotext/")
+            return []
+        pdf_object = pdftotext.PDF(io.BytesIO(pdf_bytes))
+        return [pdf_object[page_index] for page_index in range(len(pdf_object))]
+    elif pdf_reader == 'pymupdf':
+        try:
+            import fitz
+        except ImportError:
+            print("This function requires pymupdf library to read pdfs. for more info, please visit "
+                  "https://pypi.org/project/PyMuPDF/")
+            return []
+        with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+            return [page.get_text() for page in doc]
+    else:
+        raise NotImplementedError(f"pdf_reader {pdf_reader} not Implemented, Use 'pdftotext' or 'pymupdf'.")
+
+
+def parse_file_bytes(file_bytes: bytes, file_extension: str, pages: str = 'all', encoding: str = "utf-8",
+                     errors: str = "replace"):
+    """It understand the type of file and output the content of file, same as Reader.get_text but from the content
+    already read into memory. This is module level function so it can run in process pool executor.
+
+    Parameters
+    ----------
+    file_bytes : bytes
+        This is the content of file.
+    file_extension : str
+        This is the extension of file like pdf, csv, xlsx, json, txt.
+    pages : str
+        contain option to read 'first' or 'all' pages of pdf.
+    encoding : str
+        This is the encoding of text files, it does not depend on locale.
+    errors : str
+        This is how undecodable bytes of text files are handled, check errors argument of bytes.decode. default
+        'replace' puts replacement character in place of them.
+
+    Returns
+    -------
+    Union[str, pd.DataFrame, dict]
+        This is text of pdf and text files, dataframe of csv and excel files and dict of json files.
+
+    """
+    if file_extension == "pdf":
+        pdf_text = ""
+        for pdf_reader in ('pdftotext', 'pymupdf'):
+            try:
+                pdf_text = get_text_from_pages_list(get_pages_from_pdf_bytes(file_bytes, pdf_reader), pages)
+            except Exception:
+                pdf_text = ""
+            if pdf_text:
+                break
+        return pdf_text
+    elif file_extension == "csv":
+        return pd.read_csv(io.BytesIO(file_bytes))
+    elif file_extension[0] == "x":
+        return pd.read_excel(io.BytesIO(file_bytes))
+    elif file_extension == "json":
+        return json.loads(file_bytes)
+    else:
+        return io.TextIOWrapper(io.BytesIO(file_bytes), encoding=encoding, errors=errors).read()
+
+
+class AsyncReader:
+    """Contains functionality to read files with asyncio. Reading file from disk runs in thread so many files can be
+    read at once from slow or network storage, and parsing runs in given executor.
+
+    """
+
+    def __init__(self, file_path: str, executor: concurrent.futures.Executor = None,
+                 pdf_text_cache: PdfTextCache = None):
+        """Needs file path to read a file.
+
+        Parameters
+        ----------
+        file_path : str
+            path of the file.
+        executor : concurrent.futures.Executor
+            optional executor for parsing pdf, csv, excel and json content. concurrent.futures.ProcessPoolExecutor is
+            recommended for pdf files. default to asyncio default thread pool.
+        pdf_text_cache : PdfTextCache
+            optional cache of pdf pages text, pdf files are read and extracted only when text is not cached.
+        """
+        self.file_path = file_path
+        self.executor = executor
+        self.pdf_text_cache = pdf_text_cache
+        self.file_extension = os_utils.get_file_extension_from_path(self.file_path)
+
+    async def read_bytes(self) -> bytes:
+        """Read the file content without blocking event loop.
+
+        Returns
+        -------
+        bytes
+            This is the content of file.
+
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, read_file_bytes, self.file_path)
+
+    async def get_text(self, pages: str = 'all'):
+        """It understand the type of file and output the content of file, same as Reader.get_text.
+
+        Parameters
+        ----------
+        pages : str
+            contain option to read 'first' or 'all' pages.
+
+        Returns
+        -------
+        Union[str, pd.DataFrame, dict]
+            This is text of pdf and text files, dataframe of csv and excel files and dict of json files.
+
+        """
+        if self.file_extension == "pdf" and self.pdf_text_cache is not None:
+            return await self.get_pdf_text_from_cache(pages)
+        file_bytes = await self.read_bytes()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, parse_file_bytes, file_bytes, self.file_extension, pages)
+
+    async def get_pdf_text_from_cache(self, pages: str = 'all') -> str:
+        """Get text of pdf file from pdf_text_cache, same as parse_file_bytes pdftotext text is used and pymupdf if
+        pdftotext finds no text. Pages not cached are extracted in executor and cached, pdf readers which are not
+        installed are skipped and pdf readers errors are not cached so they are tried again next time.
+
+        Parameters
+        ----------
+        pages : str
+            contain option to read 'first' or 'all' pages.
+
+        Returns
+        -------
+        str
+            This is the required text from pdf file.
+
+        """
+        loop = asyncio.get_running_loop()
+        file_bytes = None
+        for pdf_reader in ('pdftotext', 'pymupdf'):
+            pages_list = await loop.run_in_executor(None, self.pdf_text_cache.get_pages, self.file_path, pdf_reader)
+            if pages_list is None:
+                if not self.pdf_text_cache.is_pdf_reader_available(pdf_reader):
+                    continue
+                if file_bytes is None:
+                    file_bytes = await self.read_bytes()
+                try:
+                    pages_list = await loop.run_in_executor(self.executor, get_pages_from_pdf_bytes, file_bytes,
+                                                            pdf_reader)
+                except Exception:
+                    continue
+                await loop.run_in_executor(None, self.pdf_text_cache.set_pages, self.file_path, pages_list, pdf_reader)
+            pdf_text = get_text_from_pages_list(pages_list, pages)
+            if pdf_text:
+                return pdf_text
+        return ""
+
+
+async def read_many(files_path_list: List[str], pages: str = 'all', max_concurrency: int = 16,
+                    executor: concurrent.futures.Executor = None, return_exceptions: bool = False,
+                    pdf_text_cache: PdfTextCache = None) -> list:
+    """Read many files at once using AsyncReader. At most max_concurrency files are read or held in memory at a time.
+    Use it as ``await converter.read_many(paths)`` in notebooks or ``asyncio.run(converter.read_many(paths))``.
+
+    Parameters
+    ----------
+    files_path_list : List[str]
+        This list contains path of files to read.
+    pages : str
+        contain option to read 'first' or 'all' pages of pdf files.
+    max_concurrency : int
+        This is maximum number of files being read at the same time.
+    executor : concurrent.futures.Executor
+        optional executor for parsing files content. default to asyncio default thread pool.
+    return_exceptions : bool
+        If True then errors like FileNotFoundError are returned in place of file content else first error is raised.
+    pdf_text_cache : PdfTextCache
+        optional cache of pdf pages text, check AsyncReader.
+
+    Returns
+    -------
+    list
+        This list contains content of each file in the same order as files_path_list.
+
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def read_file(file_path: str):
+        async with semaphore:
+            return await AsyncReader(file_path, executor, pdf_text_cache).get_text(pages)
+
+    return await asyncio.gather(*[read_file(file_path) for file_path in files_path_list],
+                                return_exceptions=return_exceptions)
@@ -6,10 +6,16 @@ manually read and filter.
 Description for sort: This converts the data into sorted manner so it is easier for humans to understand.
 """
 
+import itertools
+import os
+import re
+import numpy as np
 import pandas as pd
-from typing import List, Union
+from typing import List, Union, Dict, Iterator
 
-from systematic_review import converter, search_count
+from systematic_review import converter, os_utils, search_count, string_manipulation
+
+boolean_query_token_pattern = re.compile(r'\(|\)|NEAR/\d+|"[^"]*"|[^\s()"]+')
 
 
 def sort_dataframe_based_on_column(dataframe, column_name, ascending=True):
@@ -65,6 +71,82 @@ def get_pd_df_columns_names_with_prefix_suffix(input_pandas_dataframe: pd.DataFr
     return columns_name_list
 
 
+def get_count_values(counts: pd.Series) -> np.ndarray:
+    """Values of count column for numpy kernels. Integer and boolean columns, like output of downcast_count_columns,
+    are returned without copy. Other columns are converted to float with missing values taken as 0 count.
+
+    Parameters
+    ----------
+    counts : pd.Series
+        This is the count column of search words.
+
+    Returns
+    -------
+    np.ndarray
+        This contains count of each row.
+
+    """
+    if isinstance(counts.dtype, np.dtype) and counts.dtype.kind in "uib":
+        return counts.to_numpy()
+    return np.nan_to_num(pd.to_numeric(counts, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan), nan=0.0)
+
+
+def get_keywords_group_name_min_counts(citations_grouped_keywords_counts_df: pd.DataFrame,
+                                       common_word: str = "_count", method: str = "suffix") -> np.ndarray:
+    """This function gets columns name from pandas dataframe which contains given prefix or suffix and calculates
+    minimum of these columns values in each row. Citation passes min_limit filter if its minimum is at least min_limit.
+
+    Parameters
+    ----------
+    citations_grouped_keywords_counts_df : pd.DataFrame
+        This is input dataframe which contains some columns which have prefix or suffix in names.
+    common_word : str
+        This is the similar word string in many column names.
+    method : str
+        This is to specify if we are looking for prefix or suffix in column names.
+
+    Returns
+    -------
+    np.ndarray
+        This contains minimum of grouped keywords counts of each row. Missing counts are taken as 0 count, same as
+        FilterSort. It is empty for each row if there are no such columns.
+
+    """
+    keyword_group_name_list = get_pd_df_columns_names_with_prefix_suffix(citations_grouped_keywords_counts_df,
+                                                                         common_word, method)
+    if not keyword_group_name_list:
+        return np.full(len(citations_grouped_keywords_counts_df), np.nan)
+    min_counts = get_count_values(citations_grouped_keywords_counts_df[keyword_group_name_list[0]])
+    for keyword_group_name in keyword_group_name_list[1:]:
+        min_counts = np.minimum(min_counts, get_count_values(citations_grouped_keywords_counts_df[keyword_group_name]))
+    return min_counts
+
+
+def get_keywords_group_name_count_mask(citations_grouped_keywords_counts_df: pd.DataFrame, min_limit: int,
+                                       common_word: str = "_count", method: str = "suffix") -> np.ndarray:
+    """Provides boolean mask of rows where all prefix and suffix column name have values more than min_limit.
+
+    Parameters
+    ----------
+    citations_grouped_keywords_counts_df : pd.DataFrame
+        This is input dataframe which contains some columns which have prefix or suffix in names.
+    min_limit : int
+        This is the least value we want in all search_words_object group names.
+    common_word : str
+        This is the similar word string in many column names.
+    method : str
+        This is to specify if we are looking for prefix or suffix in column names.
+
+    Returns
+    -------
+    np.ndarray
+        This is True for rows which pass the filter. All rows are False if there are no such columns.
+
+    """
+    min_counts = get_keywords_group_name_min_counts(citations_grouped_keywords_counts_df, common_word, method)
+    return min_counts >= min_limit
+
+
 def filter_dataframe_on_keywords_group_name_count(citations_grouped_keywords_counts_df: pd.DataFrame, min_limit: int,
                                                   common_word: str = "_count", method: str = "suffix") -> List[dict]:
     """This function gets  columns name from pandas dataframe which contains given prefix or suffix. It then filter
@@ -84,30 +166,137 @@ def filter_dataframe_on_keywords_group_name_count(citations_grouped_keywords_cou
     Returns
     -------
     List[dict]
-        This is the filtered citations list based on min_limit of grouped_keywords_counts.
+        This is the filtered citations list based on min_limit of grouped_keywords_counts. Missing counts are taken as
+        0 count, so such citations are not in it when min_limit is more than 0. Earlier missing counts passed the
+        filter.
 
     """
-    filtered_list_of_dict = []
-    keyword_group_name_list = get_pd_df_columns_names_with_prefix_suffix(citations_grouped_keywords_counts_df,
-                                                                         common_word, method)
-    citations_grouped_keywords_count_list = converter.dataframe_to_records_list(citations_grouped_keywords_counts_df)
+    return converter.dataframe_to_records_list(filter_dataframe_on_keywords_group_name_count_to_dataframe(
+        citations_grouped_keywords_counts_df, min_limit, common_word, method))
+
+
+def filter_dataframe_on_keywords_group_name_count_to_dataframe(citations_grouped_keywords_counts_df: pd.DataFrame,
+                                                               min_limit: int, common_word: str = "_count",
+                                                               method: str = "suffix") -> pd.DataFrame:
+    """Same as filter_dataframe_on_keywords_group_name_count but it returns filtered dataframe without converting it
+    to records.
+
+    Parameters
+    ----------
+    citations_grouped_keywords_counts_df : pd.DataFrame
+        This is input dataframe which contains some columns which have prefix or suffix in names.
+    min_limit : int
+        This is the least value we want in all search_words_object group names.
+    common_word : str
+        This is the similar word string in many column names.
+    method : str
+        This is to specify if we are looking for prefix or suffix in column names.
+
+    Returns
+    -------
+    pd.DataFrame
+        This is the filtered citations dataframe based on min_limit of grouped_keywords_counts.
+
+    """
+    return citations_grouped_keywords_counts_df[get_keywords_group_name_count_mask(
+        citations_grouped_keywords_counts_df, min_limit, common_word, method)]
+
+
+def get_min_limit_articles_counts(keywords_group_name_min_counts: np.ndarray) -> np.ndarray:
+    """Count rows which pass the filter for every min_limit at once using histogram of rows minimum group counts.
+    Number of rows passing min_limit t is number of rows whose minimum group count is at least t.
+
+    Parameters
+    ----------
+    keywords_group_name_min_counts : np.ndarray
+        This is output of get_keywords_group_name_min_counts.
+
+    Returns
+    -------
+    np.ndarray
+        This contains number of rows passing min_limit at position min_limit, for min_limit 0 to one more than largest
+        minimum. Last value is 0 and larger min_limit are passed by no rows, check count_articles_for_min_limit.
+
+    """
+    # minimum is nan only if there are no group columns and such rows pass no min_limit.
+    finite_min_counts = keywords_group_name_min_counts[np.isfinite(keywords_group_name_min_counts)]
+    histogram = np.bincount(np.floor(np.clip(finite_min_counts, 0, None)).astype(np.int64))
+    # reversed cumulative sum gives number of rows with minimum at least each value, last value is for max + 1.
+    return np.append(histogram[::-1].cumsum()[::-1], 0)
+
+
+def add_min_limit_articles_counts(first_min_limit_articles_counts: np.ndarray,
+                                  second_min_limit_articles_counts: np.ndarray) -> np.ndarray:
+    """Combine outputs of get_min_limit_articles_counts of two parts of data. Shorter one is extended with its last
+    value as that is the number of rows passing every larger min_limit.
+
+    Parameters
+    ----------
+    first_min_limit_articles_counts : np.ndarray
+        This is output of get_min_limit_articles_counts of first part of data.
+    second_min_limit_articles_counts : np.ndarray
+        This is output of get_min_limit_articles_counts of second part of data.
+
+    Returns
+    -------
+    np.ndarray
+        This is number of rows of both parts passing min_limit at position min_limit.
+
+    """
+    length = max(len(first_min_limit_articles_counts), len(second_min_limit_articles_counts))
+    return sum(np.pad(min_limit_articles_counts, (0, length - len(min_limit_articles_counts)), mode="edge")
+               for min_limit_articles_counts in (first_min_limit_articles_counts, second_min_limit_articles_counts))
+
+
+def count_articles_for_min_limit(min_limit_articles_counts: np.ndarray, min_limit: int) -> int:
+    """Number of rows passing min_limit, looked up from output of get_min_limit_articles_counts.
+
+    Parameters
+    ----------
+    min_limit_articles_counts : np.ndarray
+        This is output of get_min_limit_articles_counts.
+    min_limit : int
+        This is the least value we want in all search_words_object group names.
+
+    Returns
+    -------
+    int
+        This is the number of rows passing min_limit.
+
+    """
+    min_limit = max(int(np.ceil(min_limit)), 0)
+    return int(min_limit_articles_counts[min(min_limit, len(min_limit_articles_counts) - 1)])
+
+
+def get_min_limit_for_required_number(min_limit_articles_counts: np.ndarray, required_number_of_articles: int) -> int:
+    """Largest min_limit which leaves at least required_number_of_articles, this is the exact match when some
+    min_limit gives exactly required_number_of_articles. As number of rows passing min_limit only decreases with
+    min_limit, it is found by binary search on reversed min_limit_articles_counts. 0 is given if there are fewer
+    articles than required_number_of_articles.
+
+    Parameters
+    ----------
+    min_limit_articles_counts : np.ndarray
+        This is output of get_min_limit_articles_counts.
+    required_number_of_articles : int
+        This is the number of articles you want after filtration process.
 
-    for citation_dict in citations_grouped_keywords_count_list:
-        more = True
-        for keyword_group_name in keyword_group_name_list:
-            if more:
-                if citation_dict[keyword_group_name] < min_limit:
-                    more = False
+    Returns
+    -------
+    int
+        This is the least value we want in all search_words_object group names.
 
-                if more is True and (keyword_group_name == keyword_group_name_list[-1]):
-                    filtered_list_of_dict.append(citation_dict)
-    return filtered_list_of_dict
+    """
+    min_limits_giving_required_number = len(min_limit_articles_counts) - np.searchsorted(
+        min_limit_articles_counts[::-1], required_number_of_articles, side="left")
+    return max(int(min_limits_giving_required_number) - 1, 0)
 
 
 def finding_required_article_by_changing_min_limit_recursively(citations_grouped_keywords_counts_df: pd.DataFrame,
                                                                required_number_of_articles: int,
                                                                addition: int = 0, search: bool = True,
-                                                               prev_lower_total_articles_rows: int = 0):
+                                                               prev_lower_total_articles_rows: int = 0,
+                                                               min_limit_articles_counts: np.ndarray = None):
     """This function increases the min_limit value to reach up to required_number_of_articles. this function return the
     min_limit value of exact required_number_of_articles can be extracted from dataframe else it provide the lower and
     upper limit of min_limit
@@ -124,6 +313,8 @@ def finding_required_article_by_changing_min_limit_recursively(citations_grouped
         This signify the status of searching for best value of min_limit
     prev_lower_total_articles_rows : int
         This is the previous lower total articles rows
+    min_limit_articles_counts : np.ndarray
+        This is output of get_min_limit_articles_counts. It is calculated once in first call if not given.
 
     Returns
     -------
@@ -133,6 +324,9 @@ def finding_required_article_by_changing_min_limit_recursively(citations_grouped
     """
     if search is False:
         return search
+    if min_limit_articles_counts is None:
+        min_limit_articles_counts = get_min_limit_articles_counts(get_keywords_group_name_min_counts(
+            citations_grouped_keywords_counts_df))
     iteration = 0
     min_limit = addition + iteration
 
@@ -140,10 +334,7 @@ def finding_required_article_by_changing_min_limit_recursively(citations_grouped
         prev_min_limit = min_limit
         min_limit += 2 ** iteration
 
-        filtered_list_of_dict = filter_dataframe_on_keywords_group_name_count(citations_grouped_keywords_counts_df,
-                                                                              min_limit, "_count", "suffix")
-
-        total_articles_rows = len(filtered_list_of_dict)
+        total_articles_rows = count_articles_for_min_limit(min_limit_articles_counts, min_limit)
         print("min_limit: ", min_limit, "total_articles_rows: ", total_articles_rows)
         iteration += 1
         if total_articles_rows == required_number_of_articles:
@@ -164,12 +355,13 @@ def finding_required_article_by_changing_min_limit_recursively(citations_grouped
                 return search
             return finding_required_article_by_changing_min_limit_recursively(citations_grouped_keywords_counts_df,
                                                                               required_number_of_articles, addition,
-                                                                              search, lower_total_articles_rows)
+                                                                              search, lower_total_articles_rows,
+                                                                              min_limit_articles_counts)
 
 
 def return_finding_near_required_article_by_changing_min_limit_while_loop(
         citations_grouped_keywords_counts_df: pd.DataFrame,
-        required_number_of_articles: int):
+        required_number_of_articles: int, min_limit_articles_counts: np.ndarray = None):
     """This function increases the min_limit value to reach unto required_number_of_articles. this function return the
     min_limit value of exact required_number_of_articles can be extracted from dataframe else it provide the lower and
     upper limit of min_limit
@@ -180,6 +372,9 @@ def return_finding_near_required_article_by_changing_min_limit_while_loop(
         This is input dataframe which contains some columns which have prefix or suffix in names.
     required_number_of_articles : int
         This is the number of articles you want after filtration process.
+    min_limit_articles_counts : np.ndarray
+        This is output of get_min_limit_articles_counts. It is calculated once if not given, so each tried min_limit
+        is a lookup instead of filtering the dataframe again.
 
     Returns
     -------
@@ -190,32 +385,46 @@ def return_finding_near_required_article_by_changing_min_limit_while_loop(
         upper_info : min_limit, upper_total_articles_rows
 
     """
-    upper_info = [0, len(citations_grouped_keywords_counts_df.index)]
-    min_limit = iteration = prev_min_limit = 0
+    if min_limit_articles_counts is None:
+        min_limit_articles_counts = get_min_limit_articles_counts(get_keywords_group_name_min_counts(
+            citations_grouped_keywords_counts_df))
+    return find_near_required_min_limit(min_limit_articles_counts, required_number_of_articles,
+                                        len(citations_grouped_keywords_counts_df.index))
 
-    while True:
-        prev_min_limit = min_limit
-        min_limit += 2 ** iteration
-        filtered_list_of_dict = filter_dataframe_on_keywords_group_name_count(
-            citations_grouped_keywords_counts_df,
-            min_limit, "_count", "suffix")
-        total_articles_rows = len(filtered_list_of_dict)
-        print("min_limit: ", min_limit, "total_articles_rows: ", total_articles_rows)
-        iteration += 1
-        if total_articles_rows == required_number_of_articles:
-            exact_info = [min_limit, total_articles_rows]
-            return exact_info, None, None
 
-        if iteration == 1 and total_articles_rows < required_number_of_articles:
-            lower_info = [min_limit, total_articles_rows]
-            return None, lower_info, upper_info
+def find_near_required_min_limit(min_limit_articles_counts: np.ndarray, required_number_of_articles: int,
+                                 total_number_of_articles: int):
+    """Search of return_finding_near_required_article_by_changing_min_limit_while_loop using only number of rows
+    passing each min_limit, so data does not need to be in memory. upper_info is from
+    get_min_limit_for_required_number and lower_info is the next min_limit, which gives fewer articles than required.
 
-        if total_articles_rows < required_number_of_articles:
-            iteration = 0
-            min_limit = prev_min_limit
+    Parameters
+    ----------
+    min_limit_articles_counts : np.ndarray
+        This is output of get_min_limit_articles_counts.
+    required_number_of_articles : int
+        This is the number of articles you want after filtration process.
+    total_number_of_articles : int
+        This is the number of articles before filtration process.
 
-        else:
-            upper_info = [min_limit, total_articles_rows]
+    Returns
+    -------
+    tuple
+        This tuple consists of following values in same order
+        exact match values: min_limit, total_articles_rows
+        lower_info : min_limit, lower_total_articles_rows
+        upper_info : min_limit, upper_total_articles_rows
+
+    """
+    min_limit = get_min_limit_for_required_number(min_limit_articles_counts, required_number_of_articles)
+    total_articles_rows = count_articles_for_min_limit(min_limit_articles_counts, min_limit)
+    if total_articles_rows == required_number_of_articles:
+        return [min_limit, total_articles_rows], None, None
+    if total_articles_rows < required_number_of_articles:
+        # there are fewer articles than required, so all of them are kept.
+        return None, [min_limit, total_articles_rows], [0, total_number_of_articles]
+    lower_info = [min_limit + 1, count_articles_for_min_limit(min_limit_articles_counts, min_limit + 1)]
+    return None, lower_info, [min_limit, total_articles_rows]
 
 
 def return_finding_required_article_by_changing_min_limit_recursively(
@@ -223,7 +432,7 @@ def return_finding_required_article_by_changing_min_limit_recursively(
         required_number_of_articles: int,
         addition: int = 0, search: bool = True,
         prev_lower_total_articles_rows: int = 0,
-        upper_info=(None, None)):
+        upper_info=(None, None), min_limit_articles_counts: np.ndarray = None):
     """This function increases the min_limit value to reach unto required_number_of_articles. this function return the
     min_limit value of exact required_number_of_articles can be extracted from dataframe else it provide the lower and
     upper limit of min_limit
@@ -242,6 +451,8 @@ def return_finding_required_article_by_changing_min_limit_recursively(
         This is the previous lower total articles rows
     upper_info : list
         This is list consists of [min_limit, upper_total_articles_rows]
+    min_limit_articles_counts : np.ndarray
+        This is output of get_min_limit_articles_counts. It is calculated once in first call if not given.
 
     Returns
     -------
@@ -255,15 +466,16 @@ def return_finding_required_article_by_changing_min_limit_recursively(
     """
     if search is False:
         return search, None, None, None
+    if min_limit_articles_counts is None:
+        min_limit_articles_counts = get_min_limit_articles_counts(get_keywords_group_name_min_counts(
+            citations_grouped_keywords_counts_df))
     iteration = 0
     min_limit = addition + iteration
 
     while search:
         prev_min_limit = min_limit
         min_limit += 2 ** iteration
-        filtered_list_of_dict = filter_dataframe_on_keywords_group_name_count(citations_grouped_keywords_counts_df,
-                                                                              min_limit, "_count", "suffix")
-        total_articles_rows = len(filtered_list_of_dict)
+        total_articles_rows = count_articles_for_min_limit(min_limit_articles_counts, min_limit)
         print("min_limit: ", min_limit, "total_articles_rows: ", total_articles_rows)
         iteration += 1
         if total_articles_rows == required_number_of_articles:
@@ -288,7 +500,7 @@ def return_finding_required_article_by_changing_min_limit_recursively(
                 required_number_of_articles,
                 addition, search,
                 lower_total_articles_rows,
-                upper_info)
+                upper_info, min_limit_articles_counts)
 
 
 def manually_check_filter_by_min_limit_changes(citations_grouped_keywords_counts_df: pd.DataFrame,
@@ -315,10 +527,10 @@ def manually_check_filter_by_min_limit_changes(citations_grouped_keywords_counts
         This prints the values rather than returning the values.
 
     """
+    min_limit_articles_counts = get_min_limit_articles_counts(get_keywords_group_name_min_counts(
+        citations_grouped_keywords_counts_df))
     for _ in range(iterations):
-        filtered_list_of_dict = filter_dataframe_on_keywords_group_name_count(citations_grouped_keywords_counts_df,
-                                                                              min_limit, "_count", "suffix")
-        total_articles_rows = len(filtered_list_of_dict)
+        total_articles_rows = count_articles_for_min_limit(min_limit_articles_counts, min_limit)
         print("min_limit: ", min_limit, "total_articles_rows: ", total_articles_rows)
         if total_articles_rows <= required_number_of_articles:
             break
@@ -394,8 +606,49 @@ def dataframe_sorting_criterion_list(citations_grouped_keywords_counts_df: pd.Da
     return sorting_criterion_list
 
 
+def get_top_rows_positions(citations_grouped_keywords_counts_df: pd.DataFrame, sorting_keywords_criterion_list: list,
+                           top_k: int) -> np.ndarray:
+    """Positions of top_k rows of descending sort on sorting criterion list, found without sorting whole dataframe.
+    For each criterion column the k-th largest value is found with np.partition, rows above it are selected and only
+    rows equal to it are checked on next criterion column. Rows still tied after last column are taken in their order.
+
+    Parameters
+    ----------
+    citations_grouped_keywords_counts_df : pd.DataFrame
+        This dataframe contains all columns with counts of search_words_object.
+    sorting_keywords_criterion_list : list
+        This is the sorting criterion list which contains numeric columns in logical manner we desire.
+    top_k : int
+        This is the number of top rows we want.
+
+    Returns
+    -------
+    np.ndarray
+        This contains positions of top_k rows in increasing order, these are not sorted on criterion list.
+
+    """
+    selected_positions = []
+    candidates_positions = np.arange(len(citations_grouped_keywords_counts_df.index))
+    remaining_number = top_k
+    for column_name in sorting_keywords_criterion_list:
+        if remaining_number <= 0 or len(candidates_positions) <= remaining_number:
+            break
+        # missing count is 0 count, same as sort_citations_grouped_keywords_counts_df.
+        values = get_count_values(citations_grouped_keywords_counts_df[column_name])[candidates_positions]
+        kth_position = len(values) - remaining_number
+        kth_value = np.partition(values, kth_position)[kth_position]
+        above_kth_mask = values > kth_value
+        selected_positions.append(candidates_positions[above_kth_mask])
+        remaining_number -= int(np.count_nonzero(above_kth_mask))
+        candidates_positions = candidates_positions[values == kth_value]
+    selected_positions.append(candidates_positions[:max(remaining_number, 0)])
+
+    return np.sort(np.concatenate(selected_positions))
+
+
 def sort_citations_grouped_keywords_counts_df(citations_grouped_keywords_counts_df: pd.DataFrame,
-                                              sorting_keywords_criterion_list: list) -> pd.DataFrame:
+                                              sorting_keywords_criterion_list: list,
+                                              top_k: int = None) -> pd.DataFrame:
     """This function sort the dataframe based on the sorting criterion list.
 
     Parameters
@@ -405,6 +658,9 @@ def sort_citations_grouped_keywords_counts_df(citations_grouped_keywords_counts_
     sorting_keywords_criterion_list : list
         This is the sorting criterion list which contains column in logical manner we desire.It contains
         total_keywords, group_keywords_counts, and keywords_counts in the last.
+    top_k : int
+        If given, only top_k rows of sorted dataframe are returned. These are selected before sorting using
+        get_top_rows_positions so only top_k rows are sorted. Missing counts are sorted as 0 count, same as FilterSort.
 
     Returns
     -------
@@ -415,7 +671,15 @@ def sort_citations_grouped_keywords_counts_df(citations_grouped_keywords_counts_
     """
     available_sorting_criterion_list = dataframe_sorting_criterion_list(citations_grouped_keywords_counts_df,
                                                                         sorting_keywords_criterion_list)
-    sorted_df = citations_grouped_keywords_counts_df.sort_values(by=sorting_keywords_criterion_list, ascending=False)
+    if top_k is not None and top_k < len(citations_grouped_keywords_counts_df.index) and all(
+            pd.api.types.is_numeric_dtype(citations_grouped_keywords_counts_df[column_name])
+            for column_name in sorting_keywords_criterion_list):
+        citations_grouped_keywords_counts_df = citations_grouped_keywords_counts_df.iloc[get_top_rows_positions(
+            citations_grouped_keywords_counts_df, sorting_keywords_criterion_list, top_k)]
+    sorted_df = citations_grouped_keywords_counts_df.sort_values(by=sorting_keywords_criterion_list, ascending=False,
+                                                                 key=lambda column: column.fillna(0))
+    if top_k is not None:
+        sorted_df = sorted_df.head(top_k)
     # print(available_sorting_criterion_list)
     arranged_df = sorted_df[available_sorting_criterion_list]
 
@@ -446,23 +710,113 @@ def filter_and_sort(citations_grouped_keywords_counts_df: pd.DataFrame,
          total_keywords, group_keywords_counts, and keywords_counts in the last.
 
     """
-    min_limit_tuple = return_finding_near_required_article_by_changing_min_limit_while_loop(
-        citations_grouped_keywords_counts_df, required_number)
-    min_limit = min_limit_tuple[0][0] if min_limit_tuple[0] else min_limit_tuple[2][0]
-    filtered_list = filter_dataframe_on_keywords_group_name_count(citations_grouped_keywords_counts_df, min_limit)
+    keywords_group_name_min_counts = get_keywords_group_name_min_counts(citations_grouped_keywords_counts_df)
+    min_limit = get_min_limit_for_required_number(get_min_limit_articles_counts(keywords_group_name_min_counts),
+                                                  required_number)
     criteria_list = search_words_object.get_sorting_keywords_criterion_list()
-    filtered_df = converter.records_list_to_dataframe(filtered_list)
+    filtered_df = citations_grouped_keywords_counts_df[keywords_group_name_min_counts >= min_limit].reset_index(
+        drop=True)
     filtered_sorted_df = sort_citations_grouped_keywords_counts_df(filtered_df, criteria_list)
 
     return filtered_sorted_df
 
 
-class FilterSort:
-    """This contains functionality to filter and sort the data.
+def get_keywords_counts_matrix(citations_grouped_keywords_counts_df: pd.DataFrame, keywords: list) -> np.ndarray:
+    """Stack keywords count columns into matrix with a row for each article and column for each keyword. Integer
+    columns stay integer, so counts are converted to float only by get_keywords_relevance_matrix. Missing counts are
+    taken as 0.
+
+    Parameters
+    ----------
+    citations_grouped_keywords_counts_df : pd.DataFrame
+        This dataframe contains all columns with counts of search_words_object.
+    keywords : list
+        This is list of keywords columns names.
+
+    Returns
+    -------
+    np.ndarray
+        This is the counts matrix.
+
+    """
+    if not keywords:
+        return np.zeros((len(citations_grouped_keywords_counts_df.index), 0), dtype=np.uint8)
+    return np.column_stack([get_count_values(citations_grouped_keywords_counts_df[keyword]) for keyword in keywords])
+
+
+def get_keywords_idf(keywords_counts_matrix: np.ndarray) -> np.ndarray:
+    """Inverse document frequency of each keyword using BM25 formula log(1 + (N - n + 0.5) / (n + 0.5)), where N is
+    number of articles and n is number of articles containing the keyword.
+
+    Parameters
+    ----------
+    keywords_counts_matrix : np.ndarray
+        This is output of get_keywords_counts_matrix.
+
+    Returns
+    -------
+    np.ndarray
+        This contains idf value of each keyword column.
+
+    """
+    number_of_articles = keywords_counts_matrix.shape[0]
+    articles_with_keyword = np.count_nonzero(keywords_counts_matrix > 0, axis=0)
+    return np.log1p((number_of_articles - articles_with_keyword + 0.5) / (articles_with_keyword + 0.5)).astype(
+        np.float32)
+
+
+def get_keywords_relevance_matrix(keywords_counts_matrix: np.ndarray, document_lengths: np.ndarray,
+                                  scoring_method: str = "bm25", k1: float = 1.2, b: float = 0.75) -> np.ndarray:
+    """Transform keywords counts matrix so relevance score of articles is product of this matrix with keywords weights.
+    'counts' keeps raw counts, 'tf_idf' divides counts by document length and multiply with idf, 'bm25' saturates
+    counts using k1 and b on document length compared to average document length and multiply with idf.
+
+    Parameters
+    ----------
+    keywords_counts_matrix : np.ndarray
+        This is output of get_keywords_counts_matrix.
+    document_lengths : np.ndarray
+        This contains length of each article.
+    scoring_method : str
+        This is one of 'counts', 'tf_idf', or 'bm25'.
+    k1 : float
+        This is bm25 term frequency saturation parameter.
+    b : float
+        This is bm25 document length normalization parameter.
+
+    Returns
+    -------
+    np.ndarray
+        This is the float32 relevance matrix.
+
+    """
+    if scoring_method == "counts":
+        return keywords_counts_matrix.astype(np.float32)
+    document_lengths = np.nan_to_num(np.asarray(document_lengths, dtype=np.float32), nan=0.0)[:, None]
+    idf = get_keywords_idf(keywords_counts_matrix)
+    keywords_counts_matrix = keywords_counts_matrix.astype(np.float32)
+    if scoring_method == "tf_idf":
+        term_frequency = np.divide(keywords_counts_matrix, document_lengths, out=np.zeros_like(keywords_counts_matrix),
+                                   where=document_lengths > 0)
+        return term_frequency * idf
+    if scoring_method == "bm25":
+        average_document_length = float(document_lengths.mean()) if len(document_lengths) else 0.0
+        length_normalization = k1 * (1 - b + b * document_lengths / average_document_length) \
+            if average_document_length > 0 else np.float32(k1)
+        return keywords_counts_matrix * (k1 + 1) / (keywords_counts_matrix + length_normalization) * idf
+    raise ValueError(f"scoring_method {scoring_method} is incorrect, It must be 'counts', 'tf_idf', or 'bm25'.")
+
+
+class RelevanceScore:
+    """This contains functionality to rank articles on weighted relevance score of keywords counts. Keywords counts are
+    transformed once so that changing weights only needs one matrix vector product.
 
     """
+    scoring_methods = ("counts", "tf_idf", "bm25")
+
     def __init__(self, data: Union[List[dict], pd.DataFrame], search_words_object: search_count.SearchWords,
-                 required_number: int):
+                 scoring_method: str = "bm25", document_length_column_name: str = None, k1: float = 1.2,
+                 b: float = 0.75):
         """
 
         Parameters
@@ -471,89 +825,1135 @@ class FilterSort:
             This dataframe contains all columns with counts of search_words_object.
         search_words_object : search_count.SearchWords
             search_words_object should contain dictionary comprised of unique search_words_object in each keyword
-            groups. It means keyword from first keyword group can not be found in any other keyword group.
-            Example - {'keyword_group_1': ["management", "investing", "risk", "pre", "process"], 'keyword_group_2':
-            ["corporate", "pricing"],...}
-        required_number : int
-            This is the least number of documents we want.
+            groups.
+        scoring_method : str
+            This is one of 'counts', 'tf_idf', or 'bm25'.
+        document_length_column_name : str
+            This is name of column containing length of each article, like number of words of its text, used by
+            'tf_idf' and 'bm25'. Searched data has only counts of keywords and not length of articles, so by default
+            sum of keywords counts of each article, same as total_keywords, is used in its place. Then bm25 length
+            normalization compares number of keywords hits of article with average hits, not length of its text.
+        k1 : float
+            This is bm25 term frequency saturation parameter.
+        b : float
+            This is bm25 document length normalization parameter.
 
         """
-        self.required_number = required_number
+        if scoring_method not in self.scoring_methods:
+            raise ValueError(f"scoring_method {scoring_method} is incorrect, It must be one of {self.scoring_methods}.")
         self.search_words_object = search_words_object
+        self.scoring_method = scoring_method
         self.data = data if type(data) == pd.DataFrame else converter.records_list_to_dataframe(data)
+        self.keywords_groups = {keyword: group_name for group_name, keywords_list in search_words_object.value.items()
+                                for keyword in keywords_list if keyword in self.data.columns}
+        self.keywords = list(self.keywords_groups)
+        keywords_counts_matrix = get_keywords_counts_matrix(self.data, self.keywords)
+        if document_length_column_name is None:
+            document_lengths = keywords_counts_matrix.sum(axis=1)
+        elif document_length_column_name in self.data.columns:
+            document_lengths = get_count_values(self.data[document_length_column_name])
+        else:
+            raise ValueError(f"document length column {document_length_column_name} is not in data.")
+        self.relevance_matrix = np.ascontiguousarray(get_keywords_relevance_matrix(
+            keywords_counts_matrix, document_lengths, scoring_method, k1, b), dtype=np.float32)
 
-    def filter_and_sort(self) -> pd.DataFrame:
-        """Execute filter and sort step.
-        creates sorting criterion list, sort the dataframe based on the sorting criterion list.
+    def get_weights_vector(self, group_weights: dict = None, keywords_weights: dict = None) -> np.ndarray:
+        """Weight of each keyword is product of its group weight and its own weight, missing weights are 1.
+
+        Parameters
+        ----------
+        group_weights : dict
+            This contains keywords group name as key and weight as value.
+        keywords_weights : dict
+            This contains keyword as key and weight as value.
 
         Returns
         -------
-        pd.DataFrame
-            This is the sorted dataframe which contains columns in this sequential manner. It contains citation df,
-             total_keywords, group_keywords_counts, and keywords_counts in the last.
+        np.ndarray
+            This contains weight of each keyword column.
 
         """
+        group_weights = group_weights or {}
+        keywords_weights = keywords_weights or {}
+        return np.array([group_weights.get(self.keywords_groups[keyword], 1) * keywords_weights.get(keyword, 1)
+                         for keyword in self.keywords], dtype=np.float32)
 
-        min_limit_tuple = return_finding_near_required_article_by_changing_min_limit_while_loop(
-            self.data, self.required_number)
-        min_limit = min_limit_tuple[0][0] if min_limit_tuple[0] else min_limit_tuple[2][0]
-        filtered_list = filter_dataframe_on_keywords_group_name_count(self.data, min_limit)
-        criteria_list = self.search_words_object.get_sorting_keywords_criterion_list()
-        filtered_df = converter.records_list_to_dataframe(filtered_list)
-        filtered_sorted_df = sort_citations_grouped_keywords_counts_df(filtered_df, criteria_list)
-
-        return filtered_sorted_df
+    def score(self, group_weights: dict = None, keywords_weights: dict = None) -> np.ndarray:
+        """Relevance score of each article for given weights.
 
-    def get_records_list(self):
-        """executes the filter and sort function and outputs the records list file
+        Parameters
+        ----------
+        group_weights : dict
+            This contains keywords group name as key and weight as value.
+        keywords_weights : dict
+            This contains keyword as key and weight as value.
 
         Returns
         -------
-        List[dict]
-            outputs the filter and sorted data.
+        np.ndarray
+            This contains relevance score of each article.
 
         """
-        return converter.dataframe_to_records_list(self.filter_and_sort())
+        return self.relevance_matrix @ self.get_weights_vector(group_weights, keywords_weights)
 
-    def get_dataframe(self):
-        """executes the filter and sort function and outputs the pd.DataFrame
+    def ranked_positions(self, group_weights: dict = None, keywords_weights: dict = None, top_k: int = None) -> tuple:
+        """Positions of articles sorted on decreasing relevance score, articles with same score keep their order.
+
+        Parameters
+        ----------
+        group_weights : dict
+            This contains keywords group name as key and weight as value.
+        keywords_weights : dict
+            This contains keyword as key and weight as value.
+        top_k : int
+            If given, only top_k articles are selected using np.argpartition and sorted.
 
         Returns
         -------
-        pd.DataFrame
-            outputs the filter and sorted data.
+        tuple
+            This tuple consists of positions of ranked articles and their relevance scores.
 
         """
-        return self.filter_and_sort()
-
-    def to_csv(self, output_filename: Union[str, None] = "output.csv", index: bool = True):
-        """This function saves pandas.DataFrame to csv file.
+        scores = self.score(group_weights, keywords_weights)
+        positions = np.arange(len(scores))
+        if top_k is not None and top_k < len(scores):
+            # keep every article tied with k-th score so stable sort can choose between them.
+            kth_score = np.partition(scores, len(scores) - top_k)[len(scores) - top_k] if top_k > 0 else np.inf
+            positions = positions[scores >= kth_score]
+        positions = positions[np.argsort(-scores[positions], kind="stable")][:top_k]
+        return positions, scores[positions]
+
+    def ranked_dataframe(self, group_weights: dict = None, keywords_weights: dict = None, top_k: int = None,
+                         score_column_name: str = "relevance_score") -> pd.DataFrame:
+        """Articles sorted on decreasing relevance score, articles with same score keep their order.
 
         Parameters
         ----------
-        output_filename : str
-            This is the name of output file which should contains .csv extension
-        index : bool
-            Define if index is needed in output csv file or not.
+        group_weights : dict
+            This contains keywords group name as key and weight as value.
+        keywords_weights : dict
+            This contains keyword as key and weight as value.
+        top_k : int
+            If given, only top_k articles are selected using np.argpartition and sorted.
+        score_column_name : str
+            This is name of column added to contain relevance score.
 
         Returns
         -------
+        pd.DataFrame
+            This is the ranked dataframe with relevance score column.
 
         """
-        converter.dataframe_to_csv_file(self.get_dataframe(), output_filename, index)
+        positions, scores = self.ranked_positions(group_weights, keywords_weights, top_k)
+        ranked_df = self.data.iloc[positions].copy()
+        ranked_df[score_column_name] = scores
+        return ranked_df
 
-    def to_excel(self, output_filename: Union[str, None] = "output.csv", index: bool = True):
-        """This function saves pandas.DataFrame to excel file.
+
+def tokenize_boolean_query(query: str) -> List[str]:
+    """Split boolean search string into parentheses, operators AND, OR, NOT, NEAR/n, quoted phrases and terms.
+
+    Parameters
+    ----------
+    query : str
+        This is boolean search string. Example - '(finance OR investing) AND (neural NEAR/5 network) NOT survey'
+
+    Returns
+    -------
+    List[str]
+        This is list of tokens.
+
+    """
+    return boolean_query_token_pattern.findall(query)
+
+
+class BooleanQuery:
+    """This compiles boolean search string over search words groups and keywords into a tree which is evaluated as
+    numpy boolean masks on count columns. A term is true for an article when its count is more than 0.
+
+    Terms can be count columns names, keywords group names, which use '<group name>_count' column, or keywords, which
+    are preprocessed same as search words if not found as column. NOT binds tightest, then NEAR/n, then AND (also
+    implicit between terms and 'a NOT b' meaning 'a AND NOT b'), then OR. Only counts of keywords are available and not
+    their positions, so NEAR/n is evaluated same as AND.
+
+    """
+    operators = ("AND", "OR", "NOT")
+
+    def __init__(self, query: str, search_words_object: search_count.SearchWords = None, columns: list = None):
+        """
 
         Parameters
         ----------
-        output_filename : str
-            This is the name of output file which should contains .xlsx extension
-        index : bool
-            Define if index is needed in output excel file or not.
+        query : str
+            This is boolean search string. Example - '(finance OR investing) AND (neural NEAR/5 network) NOT survey'
+        search_words_object : search_count.SearchWords
+            This is used to find keywords group names and to preprocess terms which are not columns.
+        columns : list
+            This is list of available count columns names. If given, unknown terms raise ValueError while compiling.
+
+        """
+        self.query = query
+        self.search_words_object = search_words_object
+        self.columns = None if columns is None else set(columns)
+        self.tokens = tokenize_boolean_query(query)
+        self.position = 0
+        if not self.tokens:
+            raise ValueError("boolean query is empty.")
+        self.tree = self.parse_or()
+        if self.position != len(self.tokens):
+            raise ValueError(f"unexpected '{self.tokens[self.position]}' in boolean query: {query}")
+        self.columns_names = sorted(self.get_tree_columns_names(self.tree))
+
+    def peek(self) -> Union[str, None]:
+        """Current token or None at end of query."""
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def parse_or(self) -> tuple:
+        """Parse terms joined with OR."""
+        children = [self.parse_and()]
+        while self.peek() == "OR":
+            self.position += 1
+            children.append(self.parse_and())
+        return children[0] if len(children) == 1 else ("or", children)
+
+    def parse_and(self) -> tuple:
+        """Parse terms joined with AND, binary NOT, or nothing."""
+        children = [self.parse_near()]
+        while self.peek() is not None and self.peek() not in ("OR", ")"):
+            if self.peek() == "AND":
+                self.position += 1
+            children.append(self.parse_near())
+        return children[0] if len(children) == 1 else ("and", children)
+
+    def parse_near(self) -> tuple:
+        """Parse terms joined with NEAR/n. These are evaluated as AND as positions of keywords are not available."""
+        children = [self.parse_not()]
+        while self.peek() is not None and self.peek().startswith("NEAR/"):
+            self.position += 1
+            children.append(self.parse_not())
+        return children[0] if len(children) == 1 else ("and", children)
+
+    def parse_not(self) -> tuple:
+        """Parse NOT and its operand."""
+        if self.peek() == "NOT":
+            self.position += 1
+            return "not", self.parse_not()
+        return self.parse_operand()
+
+    def parse_operand(self) -> tuple:
+        """Parse term, quoted phrase or query in parentheses."""
+        token = self.peek()
+        if token is None:
+            raise ValueError(f"boolean query ends unexpectedly: {self.query}")
+        self.position += 1
+        if token == "(":
+            tree = self.parse_or()
+            if self.peek() != ")":
+                raise ValueError(f"missing ')' in boolean query: {self.query}")
+            self.position += 1
+            return tree
+        if token == ")" or token in self.operators or token.startswith("NEAR/"):
+            raise ValueError(f"unexpected '{token}' in boolean query: {self.query}")
+        columns_names = self.get_term_columns_names(token.strip('"'))
+        if len(columns_names) == 1:
+            return "term", columns_names[0]
+        return "and", [("term", column_name) for column_name in columns_names]
+
+    def get_term_columns_names(self, term: str) -> List[str]:
+        """Find count columns of term. Phrase or term which is preprocessed into many keywords gives many columns.
+
+        Parameters
+        ----------
+        term : str
+            This is keywords group name, keyword, or phrase.
 
         Returns
         -------
+        List[str]
+            This is list of count columns names.
 
         """
-        converter.dataframe_to_excel_file(self.get_dataframe(), output_filename, index)
+        groups_names = self.search_words_object.value.keys() if self.search_words_object is not None else ()
+        if self.columns is not None and term in self.columns:
+            return [term]
+        if term in groups_names:
+            return [str(term) + "_count"]
+        if self.search_words_object is not None:
+            words = string_manipulation.text_manipulation_methods(
+                term, self.search_words_object.text_manipulation_method_name,
+                self.search_words_object.custom_text_manipulation_function, self.search_words_object.args,
+                self.search_words_object.kwargs).split()
+        else:
+            words = term.split()
+        if not words:
+            raise ValueError(f"term '{term}' is empty after preprocessing in boolean query: {self.query}")
+        if self.columns is not None:
+            missing_words = [word for word in words if word not in self.columns]
+            if missing_words:
+                raise ValueError(f"term '{term}' has no count column for {missing_words} in boolean query: "
+                                 f"{self.query}")
+        return words
+
+    def get_tree_columns_names(self, tree: tuple) -> set:
+        """Count columns names used in compiled tree."""
+        if tree[0] == "term":
+            return {tree[1]}
+        if tree[0] == "not":
+            return self.get_tree_columns_names(tree[1])
+        return set().union(*(self.get_tree_columns_names(child) for child in tree[1]))
+
+    def evaluate(self, tree: tuple, keywords_presences: dict) -> np.ndarray:
+        """Evaluate compiled tree. AND stops when no article is left and OR stops when all articles are selected.
+
+        Parameters
+        ----------
+        tree : tuple
+            This is compiled tree or its part.
+        keywords_presences : dict
+            This contains column name as key and boolean array of count more than 0 as value.
+
+        Returns
+        -------
+        np.ndarray
+            This is boolean mask of articles.
+
+        """
+        if tree[0] == "term":
+            return keywords_presences[tree[1]]
+        if tree[0] == "not":
+            return ~self.evaluate(tree[1], keywords_presences)
+        mask = self.evaluate(tree[1][0], keywords_presences).copy()
+        for child in tree[1][1:]:
+            if tree[0] == "and":
+                if not mask.any():
+                    break
+                mask &= self.evaluate(child, keywords_presences)
+            else:
+                if mask.all():
+                    break
+                mask |= self.evaluate(child, keywords_presences)
+        return mask
+
+    def mask(self, citations_grouped_keywords_counts_df: pd.DataFrame, keywords_presences: dict = None) -> np.ndarray:
+        """Boolean mask of articles matching the query.
+
+        Parameters
+        ----------
+        citations_grouped_keywords_counts_df : pd.DataFrame
+            This dataframe contains all columns with counts of search_words_object.
+        keywords_presences : dict
+            This is cache of column name and boolean array of count more than 0. Missing columns are added to it, so
+            passing same dict again avoid converting columns.
+
+        Returns
+        -------
+        np.ndarray
+            This is boolean mask of articles.
+
+        """
+        keywords_presences = {} if keywords_presences is None else keywords_presences
+        for column_name in self.columns_names:
+            if column_name not in keywords_presences:
+                if column_name not in citations_grouped_keywords_counts_df.columns:
+                    raise ValueError(f"column '{column_name}' of boolean query is not in dataframe.")
+                keywords_presences[column_name] = get_count_values(citations_grouped_keywords_counts_df[
+                    column_name]) > 0
+        return self.evaluate(self.tree, keywords_presences)
+
+
+def filter_dataframe_on_boolean_query(citations_grouped_keywords_counts_df: pd.DataFrame, query: str,
+                                      search_words_object: search_count.SearchWords = None) -> pd.DataFrame:
+    """Filter articles matching boolean search string, check BooleanQuery for query syntax.
+
+    Parameters
+    ----------
+    citations_grouped_keywords_counts_df : pd.DataFrame
+        This dataframe contains all columns with counts of search_words_object.
+    query : str
+        This is boolean search string. Example - '(finance OR investing) AND (neural NEAR/5 network) NOT survey'
+    search_words_object : search_count.SearchWords
+        This is used to find keywords group names and to preprocess terms.
+
+    Returns
+    -------
+    pd.DataFrame
+        This is the dataframe of articles matching the query.
+
+    """
+    boolean_query = BooleanQuery(query, search_words_object, list(citations_grouped_keywords_counts_df.columns))
+    return citations_grouped_keywords_counts_df[boolean_query.mask(citations_grouped_keywords_counts_df)]
+
+
+def get_count_columns_names(columns: list, sorting_keywords_criterion_list: list) -> list:
+    """Names of columns containing counts of search words, these are in sorting criterion list or end with '_count'.
+
+    Parameters
+    ----------
+    columns : list
+        This is list of all columns names.
+    sorting_keywords_criterion_list : list
+        This is the sorting criterion list which contains total_keywords, group_keywords_counts, and keywords_counts.
+
+    Returns
+    -------
+    list
+        This is list of count columns names in same order as columns.
+
+    """
+    sorting_keywords_criterion_set = set(sorting_keywords_criterion_list)
+    return [column_name for column_name in columns
+            if column_name in sorting_keywords_criterion_set or str(column_name).endswith("_count")]
+
+
+def records_list_to_counts_dataframe(records_list: List[dict], sorting_keywords_criterion_list: list) -> pd.DataFrame:
+    """Convert only count columns of records list to dataframe, other citation details are left in records.
+
+    Parameters
+    ----------
+    records_list : List[dict]
+        This is list of records containing citation details and counts of search words.
+    sorting_keywords_criterion_list : list
+        This is the sorting criterion list which contains total_keywords, group_keywords_counts, and keywords_counts.
+
+    Returns
+    -------
+    pd.DataFrame
+        This is the dataframe of count columns with row position as index. '_count' columns of any record are kept and
+        they are missing values in records without them.
+
+    """
+    columns = list(sorting_keywords_criterion_list)
+    criteria_set = set(columns)
+    # union of keys of all records in order of first appearance, as a '_count' column can be missing in some records.
+    records_columns = dict.fromkeys(itertools.chain.from_iterable(records_list))
+    columns += get_count_columns_names([column_name for column_name in records_columns
+                                        if column_name not in criteria_set], [])
+    return pd.DataFrame(records_list, columns=columns)
+
+
+def downcast_count_columns(counts_df: pd.DataFrame) -> pd.DataFrame:
+    """Convert count columns to smallest unsigned integer dtype which can hold their largest value. Missing values are
+    taken as 0 count. Columns with negative or fractional values are left as float.
+
+    Parameters
+    ----------
+    counts_df : pd.DataFrame
+        This dataframe contains only count columns, it may have int64, float, or object dtype columns.
+
+    Returns
+    -------
+    pd.DataFrame
+        This is the dataframe with downcasted count columns.
+
+    """
+    downcasted_columns = {}
+    for column_name in counts_df.columns:
+        values = pd.to_numeric(counts_df[column_name], errors="coerce").to_numpy(dtype=float)
+        values = np.nan_to_num(values, nan=0.0)
+        if len(values) and (values.min() < 0 or not np.array_equal(values, np.floor(values))):
+            downcasted_columns[column_name] = values
+        else:
+            downcasted_columns[column_name] = values.astype(np.min_scalar_type(int(values.max()) if len(values) else 0))
+    return pd.DataFrame(downcasted_columns, index=counts_df.index, columns=counts_df.columns)
+
+
+class FilterSort:
+    """This contains functionality to filter and sort the data.
+
+    """
+    def __init__(self, data: Union[List[dict], pd.DataFrame], search_words_object: search_count.SearchWords,
+                 required_number: int):
+        """
+
+        Parameters
+        ----------
+        data : Union[List[dict], pd.DataFrame]
+            This dataframe contains all columns with counts of search_words_object.
+        search_words_object : search_count.SearchWords
+            search_words_object should contain dictionary comprised of unique search_words_object in each keyword
+            groups. It means keyword from first keyword group can not be found in any other keyword group.
+            Example - {'keyword_group_1': ["management", "investing", "risk", "pre", "process"], 'keyword_group_2':
+            ["corporate", "pricing"],...}
+        required_number : int
+            This is the least number of documents we want.
+
+        """
+        self.required_number = required_number
+        self.search_words_object = search_words_object
+        # data is kept as it is and only count columns are copied, other columns are taken for selected rows at end.
+        self.data = data
+        self.sorting_keywords_criterion_list = search_words_object.get_sorting_keywords_criterion_list()
+        if type(data) == pd.DataFrame:
+            counts_data = data[get_count_columns_names(data.columns, self.sorting_keywords_criterion_list)]
+        else:
+            counts_data = records_list_to_counts_dataframe(data, self.sorting_keywords_criterion_list)
+        self.counts_data = downcast_count_columns(counts_data.reset_index(drop=True))
+        self.keywords_group_name_min_counts = None
+        self.min_limit_articles_counts = None
+        self.relevance_scores = {}
+        self.keywords_presences = {}
+
+    def get_keywords_group_name_min_counts(self) -> np.ndarray:
+        """Provides minimum of grouped keywords counts of each row. It is calculated once and reused.
+
+        Returns
+        -------
+        np.ndarray
+            This contains minimum of '_count' columns of each row.
+
+        """
+        if self.keywords_group_name_min_counts is None:
+            self.keywords_group_name_min_counts = get_keywords_group_name_min_counts(self.counts_data)
+        return self.keywords_group_name_min_counts
+
+    def get_min_limit_articles_counts(self) -> np.ndarray:
+        """Provides number of rows passing each min_limit, check get_min_limit_articles_counts for more info.
+
+        Returns
+        -------
+        np.ndarray
+            This contains number of rows passing min_limit at position min_limit.
+
+        """
+        if self.min_limit_articles_counts is None:
+            self.min_limit_articles_counts = get_min_limit_articles_counts(self.get_keywords_group_name_min_counts())
+        return self.min_limit_articles_counts
+
+    def get_min_limit(self) -> int:
+        """Find min_limit which gives required_number of articles, or nearest larger number of articles if exact
+        number is not possible. It is same as select of required_number.
+
+        Returns
+        -------
+        int
+            This is the least value we want in all search_words_object group names.
+
+        """
+        return self.select(self.required_number)[0]
+
+    def threshold_curve(self) -> pd.Series:
+        """Number of articles left after filtering for every possible min_limit. min_limit larger than the last one
+        gives same number of articles as the last one.
+
+        Returns
+        -------
+        pd.Series
+            This contains total_articles_rows with min_limit as index.
+
+        """
+        min_limit_articles_counts = self.get_min_limit_articles_counts()
+        return pd.Series(min_limit_articles_counts, name="total_articles_rows",
+                         index=pd.RangeIndex(len(min_limit_articles_counts), name="min_limit"))
+
+    def select(self, required_number: int) -> tuple:
+        """Find min_limit for any required number of articles without filtering again. It gives largest min_limit which
+        leaves at least required_number of articles, check get_min_limit_for_required_number.
+
+        Parameters
+        ----------
+        required_number : int
+            This is the number of articles you want after filtration process.
+
+        Returns
+        -------
+        tuple
+            This tuple consists of min_limit, total_articles_rows
+
+        """
+        min_limit_articles_counts = self.get_min_limit_articles_counts()
+        min_limit = get_min_limit_for_required_number(min_limit_articles_counts, required_number)
+        return min_limit, count_articles_for_min_limit(min_limit_articles_counts, min_limit)
+
+    def filter_and_sort(self) -> pd.DataFrame:
+        """Execute filter and sort step.
+        creates sorting criterion list, sort the dataframe based on the sorting criterion list.
+
+        Returns
+        -------
+        pd.DataFrame
+            This is the sorted dataframe which contains columns in this sequential manner. It contains citation df,
+             total_keywords, group_keywords_counts, and keywords_counts in the last.
+
+        """
+
+        min_limit = self.get_min_limit()
+        filtered_sorted_df = self.get_sorted_dataframe(np.flatnonzero(self.get_keywords_group_name_min_counts() >=
+                                                                      min_limit))
+
+        return filtered_sorted_df
+
+    def get_rows_dataframe(self, positions: np.ndarray) -> pd.DataFrame:
+        """Provides all columns of rows at given positions of data. Only these rows are converted if data is records.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            This contains positions of rows in data.
+
+        Returns
+        -------
+        pd.DataFrame
+            This is the dataframe of selected rows. Index is index of data or position of records.
+
+        """
+        if type(self.data) == pd.DataFrame:
+            return self.data.iloc[positions]
+        if len(positions) == 0:
+            columns_names = list(dict.fromkeys([*(self.data[0] if self.data else {}), *self.counts_data.columns]))
+            return pd.DataFrame(columns=columns_names, index=pd.Index(positions))
+        return converter.records_list_to_dataframe([self.data[position] for position in positions]).set_index(
+            pd.Index(positions))
+
+    def get_column_values(self, column_name: str) -> np.ndarray:
+        """Provides values of one column of data for all rows, without converting other columns of records.
+
+        Parameters
+        ----------
+        column_name : str
+            This is name of column of data.
+
+        Returns
+        -------
+        np.ndarray
+            This contains values of column in order of rows.
+
+        """
+        if type(self.data) == pd.DataFrame:
+            if column_name not in self.data.columns:
+                raise ValueError(f"column {column_name} is not in data.")
+            return self.data[column_name].to_numpy()
+        if not any(column_name in record for record in self.data):
+            raise ValueError(f"column {column_name} is not in data.")
+        return pd.to_numeric(pd.Series([record.get(column_name) for record in self.data]), errors="coerce").to_numpy()
+
+    def get_sorted_dataframe(self, positions: np.ndarray, top_k: int = None) -> pd.DataFrame:
+        """Sort rows at given positions using only count columns, and take all columns of sorted rows at the end.
+        Output is same as sorting all columns of these rows with sort_citations_grouped_keywords_counts_df.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            This contains positions of filtered rows in data in increasing order.
+        top_k : int
+            If given, only top_k rows of sorted dataframe are returned.
+
+        Returns
+        -------
+        pd.DataFrame
+            This is the sorted dataframe which contains columns in this sequential manner. It contains citation df,
+             total_keywords, group_keywords_counts, and keywords_counts in the last.
+
+        """
+        criteria_list = self.sorting_keywords_criterion_list
+        filtered_counts_df = self.counts_data.iloc[positions].reset_index(drop=True)
+        sorted_order = sort_citations_grouped_keywords_counts_df(filtered_counts_df, criteria_list,
+                                                                 top_k).index.to_numpy()
+        sorted_df = self.get_rows_dataframe(positions[sorted_order])
+        sorted_df.index = pd.RangeIndex(len(positions))[sorted_order]
+        # count keys missing in all selected records are added as 0 counts.
+        for column_name in self.counts_data.columns.difference(sorted_df.columns, sort=False):
+            sorted_df[column_name] = filtered_counts_df[column_name].to_numpy()[sorted_order]
+        return sorted_df[dataframe_sorting_criterion_list(sorted_df, criteria_list)]
+
+    def get_top_k_dataframe(self, top_k: int = None) -> pd.DataFrame:
+        """Provides only top articles of filter and sort step. Rows are filtered on min_limit found by select and only
+        top_k rows are sorted, check sort_citations_grouped_keywords_counts_df for more info.
+
+        Parameters
+        ----------
+        top_k : int
+            This is the number of top articles we want. default is required_number.
+
+        Returns
+        -------
+        pd.DataFrame
+            This is the sorted dataframe of top_k articles.
+
+        """
+        top_k = self.required_number if top_k is None else top_k
+        min_limit = self.select(top_k)[0]
+        return self.get_sorted_dataframe(np.flatnonzero(self.get_keywords_group_name_min_counts() >= min_limit), top_k)
+
+    def get_relevance_ranked_dataframe(self, group_weights: dict = None, keywords_weights: dict = None,
+                                       scoring_method: str = "bm25", top_k: int = None,
+                                       document_length_column_name: str = None) -> pd.DataFrame:
+        """Rank articles on weighted relevance score instead of min_limit filter and sort. RelevanceScore of each
+        scoring method is created once so changing weights is fast.
+
+        Parameters
+        ----------
+        group_weights : dict
+            This contains keywords group name as key and weight as value.
+        keywords_weights : dict
+            This contains keyword as key and weight as value.
+        scoring_method : str
+            This is one of 'counts', 'tf_idf', or 'bm25'.
+        top_k : int
+            This is the number of top articles we want. default is required_number.
+        document_length_column_name : str
+            This is name of column of data containing length of each article, check RelevanceScore.
+
+        Returns
+        -------
+        pd.DataFrame
+            This is the ranked dataframe with relevance_score column.
+
+        """
+        relevance_score_key = (scoring_method, document_length_column_name)
+        if relevance_score_key not in self.relevance_scores:
+            counts_data = self.counts_data
+            if document_length_column_name is not None:
+                counts_data = counts_data.assign(**{document_length_column_name: self.get_column_values(
+                    document_length_column_name)})
+            self.relevance_scores[relevance_score_key] = RelevanceScore(counts_data, self.search_words_object,
+                                                                        scoring_method, document_length_column_name)
+        top_k = self.required_number if top_k is None else top_k
+        positions, scores = self.relevance_scores[relevance_score_key].ranked_positions(group_weights,
+                                                                                        keywords_weights, top_k)
+        ranked_df = self.get_rows_dataframe(positions).copy()
+        ranked_df["relevance_score"] = scores
+        return ranked_df
+
+    def query(self, query: str, sort: bool = True) -> pd.DataFrame:
+        """Filter articles matching boolean search string instead of min_limit, check BooleanQuery for query syntax.
+        Presence of keywords in count columns is cached so running more queries only combines boolean arrays.
+
+        Parameters
+        ----------
+        query : str
+            This is boolean search string. Example - '(finance OR investing) AND (neural NEAR/5 network) NOT survey'
+        sort : bool
+            If True, matching articles are sorted same as filter and sort step.
+
+        Returns
+        -------
+        pd.DataFrame
+            This is the dataframe of articles matching the query.
+
+        """
+        boolean_query = BooleanQuery(query, self.search_words_object, list(self.counts_data.columns))
+        positions = np.flatnonzero(boolean_query.mask(self.counts_data, self.keywords_presences))
+        if sort:
+            return self.get_sorted_dataframe(positions)
+        return self.get_rows_dataframe(positions).reset_index(drop=True)
+
+    def get_records_list(self):
+        """executes the filter and sort function and outputs the records list file
+
+        Returns
+        -------
+        List[dict]
+            outputs the filter and sorted data.
+
+        """
+        return converter.dataframe_to_records_list(self.filter_and_sort())
+
+    def get_dataframe(self):
+        """executes the filter and sort function and outputs the pd.DataFrame
+
+        Returns
+        -------
+        pd.DataFrame
+            outputs the filter and sorted data.
+
+        """
+        return self.filter_and_sort()
+
+    def to_csv(self, output_filename: Union[str, None] = "output.csv", index: bool = True):
+        """This function saves pandas.DataFrame to csv file.
+
+        Parameters
+        ----------
+        output_filename : str
+            This is the name of output file which should contains .csv extension
+        index : bool
+            Define if index is needed in output csv file or not.
+
+        Returns
+        -------
+
+        """
+        converter.dataframe_to_csv_file(self.get_dataframe(), output_filename, index)
+
+    def to_excel(self, output_filename: Union[str, None] = "output.csv", index: bool = True):
+        """This function saves pandas.DataFrame to excel file.
+
+        Parameters
+        ----------
+        output_filename : str
+            This is the name of output file which should contains .xlsx extension
+        index : bool
+            Define if index is needed in output excel file or not.
+
+        Returns
+        -------
+
+        """
+        converter.dataframe_to_excel_file(self.get_dataframe(), output_filename, index)
+
+    def to_ris(self, output_filename: str = "output.ris", ris_tags_columns_mapping: Dict[str, str] = None):
+        """This function saves citations to ris file using converter.RisFileWriter.
+
+        Parameters
+        ----------
+        output_filename : str
+            This is the name of output file which should contains .ris extension
+        ris_tags_columns_mapping : Dict[str, str]
+            This contains ris tag as key and column name as value. Default matches citations loaded by rispy.
+
+        Returns
+        -------
+
+        """
+        converter.dataframe_to_ris_file(self.get_dataframe(), output_filename, ris_tags_columns_mapping)
+
+
+class PartitionedFilterSort:
+    """This contains functionality to filter and sort data which is larger than memory and saved as many csv or parquet
+    files in a directory, like parts of search count output. First pass reads only count columns chunk by chunk to
+    find min_limit and second pass keeps only top required_number rows passing min_limit, merging each chunk with top
+    rows of earlier chunks, so memory is bounded by chunksize and required_number.
+
+    """
+    files_types = {"csv": "read_csv", "parquet": "read_parquet"}
+
+    def __init__(self, directory_path: str, search_words_object: search_count.SearchWords, required_number: int,
+                 chunksize: int = 100000):
+        """
+
+        Parameters
+        ----------
+        directory_path : str
+            This is the directory containing csv or parquet files of counts of search_words_object. Files are read in
+            sorted order of their paths, other files are ignored.
+        search_words_object : search_count.SearchWords
+            search_words_object should contain dictionary comprised of unique search_words_object in each keyword
+            groups.
+        required_number : int
+            This is the least number of documents we want.
+        chunksize : int
+            number of rows read at once from a file.
+
+        """
+        self.directory_path = directory_path
+        self.search_words_object = search_words_object
+        self.required_number = required_number
+        self.chunksize = chunksize
+        self.sorting_keywords_criterion_list = search_words_object.get_sorting_keywords_criterion_list()
+        self.files_paths = sorted(
+            file_path for file_path in os_utils.extract_files_path_from_directories_or_subdirectories(directory_path)
+            if os.path.splitext(file_path)[1][1:].lower() in self.files_types)
+        self.number_of_articles = 0
+        self.min_limit_articles_counts = None
+
+    def iter_chunks(self, count_columns_only: bool = True) -> Iterator[pd.DataFrame]:
+        """Read all files chunk by chunk.
+
+        Parameters
+        ----------
+        count_columns_only : bool
+            If True, only count columns are read from files.
+
+        Returns
+        -------
+        Iterator[pd.DataFrame]
+            This yields dataframe of at most chunksize rows.
+
+        """
+        for file_path in self.files_paths:
+            input_file_type = self.files_types[os.path.splitext(file_path)[1][1:].lower()]
+            usecols = get_count_columns_names(converter.get_tabular_file_columns(file_path, input_file_type),
+                                              self.sorting_keywords_criterion_list) if count_columns_only else None
+            yield from converter.iter_tabular_file_chunks(file_path, input_file_type, self.chunksize, usecols)
+
+    def get_chunk_min_counts(self, chunk: pd.DataFrame) -> np.ndarray:
+        """Minimum of grouped keywords counts of each row of chunk, counts are normalized same as FilterSort."""
+        counts_chunk = downcast_count_columns(chunk[get_count_columns_names(chunk.columns,
+                                                                            self.sorting_keywords_criterion_list)])
+        return get_keywords_group_name_min_counts(counts_chunk)
+
+    def get_min_limit_articles_counts(self) -> np.ndarray:
+        """First pass over files, provides number of rows passing each min_limit. It is calculated once and reused.
+
+        Returns
+        -------
+        np.ndarray
+            This contains number of rows passing min_limit at position min_limit.
+
+        """
+        if self.min_limit_articles_counts is None:
+            min_limit_articles_counts = np.zeros(1, dtype=np.int64)
+            number_of_articles = 0
+            for chunk in self.iter_chunks():
+                number_of_articles += len(chunk.index)
+                min_limit_articles_counts = add_min_limit_articles_counts(
+                    min_limit_articles_counts, get_min_limit_articles_counts(self.get_chunk_min_counts(chunk)))
+            self.number_of_articles = number_of_articles
+            self.min_limit_articles_counts = min_limit_articles_counts
+        return self.min_limit_articles_counts
+
+    def threshold_curve(self) -> pd.Series:
+        """Number of articles left after filtering for every possible min_limit, check FilterSort.threshold_curve.
+
+        Returns
+        -------
+        pd.Series
+            This contains total_articles_rows with min_limit as index.
+
+        """
+        min_limit_articles_counts = self.get_min_limit_articles_counts()
+        return pd.Series(min_limit_articles_counts, name="total_articles_rows",
+                         index=pd.RangeIndex(len(min_limit_articles_counts), name="min_limit"))
+
+    def get_min_limit(self) -> int:
+        """Find min_limit which gives required_number of articles, or nearest larger number of articles if exact
+        number is not possible.
+
+        Returns
+        -------
+        int
+            This is the least value we want in all search_words_object group names.
+
+        """
+        return get_min_limit_for_required_number(self.get_min_limit_articles_counts(), self.required_number)
+
+    def get_top_rows(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        """Keep top required_number rows of dataframe on sorting criterion list, check get_top_rows_positions. Tied
+        rows are kept in their order, so merging top rows of chunks in file order gives top rows of all files.
+
+        Parameters
+        ----------
+        dataframe : pd.DataFrame
+            This dataframe contains all columns of rows passing min_limit.
+
+        Returns
+        -------
+        pd.DataFrame
+            This is the dataframe of at most required_number rows in their order.
+
+        """
+        if len(dataframe.index) <= self.required_number:
+            return dataframe
+        counts_df = downcast_count_columns(dataframe[get_count_columns_names(dataframe.columns,
+                                                                             self.sorting_keywords_criterion_list)])
+        criteria_list = [column_name for column_name in self.sorting_keywords_criterion_list
+                         if column_name in counts_df.columns]
+        return dataframe.iloc[get_top_rows_positions(counts_df, criteria_list, self.required_number)].reset_index(
+            drop=True)
+
+    def filter_and_sort(self) -> pd.DataFrame:
+        """Execute filter and sort step. Second pass over files keeps top required_number rows passing min_limit which
+        are then sorted. Output is same as FilterSort.get_top_k_dataframe on all files joined.
+
+        Returns
+        -------
+        pd.DataFrame
+            This is the sorted dataframe which contains columns in this sequential manner. It contains citation df,
+             total_keywords, group_keywords_counts, and keywords_counts in the last.
+
+        """
+        min_limit = self.get_min_limit()
+        selected_df = None
+        for chunk in self.iter_chunks(count_columns_only=False):
+            chunk = chunk[self.get_chunk_min_counts(chunk) >= min_limit]
+            if selected_df is None:
+                selected_df = self.get_top_rows(chunk.reset_index(drop=True))
+            elif len(chunk.index):
+                selected_df = self.get_top_rows(pd.concat([selected_df, chunk], ignore_index=True))
+        if selected_df is None:
+            selected_df = pd.DataFrame(columns=self.sorting_keywords_criterion_list)
+        filter_sort = FilterSort(selected_df, self.search_words_object, self.required_number)
+        return filter_sort.get_sorted_dataframe(np.arange(len(selected_df.index)))
+
+    def get_records_list(self):
+        """executes the filter and sort function and outputs the records list file
+
+        Returns
+        -------
+        List[dict]
+            outputs the filter and sorted data.
+
+        """
+        return converter.dataframe_to_records_list(self.filter_and_sort())
+
+    def get_dataframe(self):
+        """executes the filter and sort function and outputs the pd.DataFrame
+
+        Returns
+        -------
+        pd.DataFrame
+            outputs the filter and sorted data.
+
+        """
+        return self.filter_and_sort()
+
+    def to_csv(self, output_filename: Union[str, None] = "output.csv", index: bool = True):
+        """This function saves pandas.DataFrame to csv file.
+
+        Parameters
+        ----------
+        output_filename : str
+            This is the name of output file which should contains .csv extension
+        index : bool
+            Define if index is needed in output csv file or not.
+
+        Returns
+        -------
+
+        """
+        converter.dataframe_to_csv_file(self.get_dataframe(), output_filename, index)
+
+
+class ScreeningSession:
+    """This contains functionality to run many screening variants on same data, like different required_number,
+    keywords groups subsets and include or exclude keywords lists. Group counts, rows minimum counts of groups subsets,
+    keywords masks, histograms and results are cached, so a new variant only combines cached arrays.
+
+    """
+    def __init__(self, data: Union[List[dict], pd.DataFrame], search_words_object: search_count.SearchWords):
+        """
+
+        Parameters
+        ----------
+        data : Union[List[dict], pd.DataFrame]
+            This dataframe contains all columns with counts of search_words_object.
+        search_words_object : search_count.SearchWords
+            search_words_object should contain dictionary comprised of unique search_words_object in each keyword
+            groups.
+
+        """
+        self.search_words_object = search_words_object
+        self.filter_sort = FilterSort(data, search_words_object, 0)
+        self.counts_data = self.filter_sort.counts_data
+        self.groups_counts = {}
+        self.groups_min_counts = {}
+        self.keywords_masks = {}
+        self.min_limit_articles_counts = {}
+        self.results = {}
+
+    def get_groups_columns_names(self, groups_names: list = None) -> tuple:
+        """Sorted '_count' columns names of keywords groups, all '_count' columns if groups_names is None.
+
+        Parameters
+        ----------
+        groups_names : list
+            This is list of keywords groups names.
+
+        Returns
+        -------
+        tuple
+            This is tuple of group count columns names which is used as cache key.
+
+        """
+        if groups_names is None:
+            return tuple(sorted(column_name for column_name in self.counts_data.columns
+                                if str(column_name).endswith("_count")))
+        columns_names = tuple(sorted({str(group_name) + "_count" for group_name in groups_names}))
+        missing_columns_names = [column_name for column_name in columns_names
+                                 if column_name not in self.counts_data.columns]
+        if missing_columns_names:
+            raise ValueError(f"keywords groups count columns {missing_columns_names} are not in data.")
+        return columns_names
+
+    def get_group_counts(self, column_name: str) -> np.ndarray:
+        """Counts of one keywords group as downcasted integer array of counts_data, without copy."""
+        if column_name not in self.groups_counts:
+            self.groups_counts[column_name] = get_count_values(self.counts_data[column_name])
+        return self.groups_counts[column_name]
+
+    def get_groups_min_counts(self, columns_names: tuple) -> np.ndarray:
+        """Minimum of groups counts of each row. Minimum of all columns but last is cached too, so adding a group to
+        a used subset needs only one np.minimum.
+
+        Parameters
+        ----------
+        columns_names : tuple
+            This is output of get_groups_columns_names.
+
+        Returns
+        -------
+        np.ndarray
+            This contains minimum of groups counts of each row, 0 if there are no groups as then every row passes.
+
+        """
+        if columns_names not in self.groups_min_counts:
+            if not columns_names:
+                self.groups_min_counts[columns_names] = np.zeros(len(self.counts_data.index), dtype=np.uint8)
+            elif len(columns_names) == 1:
+                self.groups_min_counts[columns_names] = self.get_group_counts(columns_names[0])
+            else:
+                self.groups_min_counts[columns_names] = np.minimum(self.get_groups_min_counts(columns_names[:-1]),
+                                                                   self.get_group_counts(columns_names[-1]))
+        return self.groups_min_counts[columns_names]
+
+    def get_keywords_mask(self, keywords: tuple) -> np.ndarray:
+        """Rows containing any of keywords, keywords can be anything allowed as term in BooleanQuery.
+
+        Parameters
+        ----------
+        keywords : tuple
+            This is sorted tuple of keywords which is used as cache key.
+
+        Returns
+        -------
+        np.ndarray
+            This is boolean mask of rows.
+
+        """
+        if keywords not in self.keywords_masks:
+            boolean_query = BooleanQuery(" OR ".join(f'"{keyword}"' for keyword in keywords), self.search_words_object,
+                                         list(self.counts_data.columns))
+            self.keywords_masks[keywords] = boolean_query.mask(self.counts_data, self.filter_sort.keywords_presences)
+        return self.keywords_masks[keywords]
+
+    def get_rows_mask(self, include_keywords: tuple, exclude_keywords: tuple) -> Union[np.ndarray, None]:
+        """Rows containing any of include_keywords and none of exclude_keywords, None if both are empty."""
+        mask = self.get_keywords_mask(include_keywords) if include_keywords else None
+        if exclude_keywords:
+            exclude_mask = ~self.get_keywords_mask(exclude_keywords)
+            mask = exclude_mask if mask is None else mask & exclude_mask
+        return mask
+
+    def screen(self, required_number: int, groups_names: list = None, include_keywords: list = None,
+               exclude_keywords: list = None) -> pd.DataFrame:
+        """Filter and sort step on a screening variant. Rows are first limited to include and exclude keywords, then
+        min_limit is found on minimum counts of given keywords groups. Results are cached with variant as key and a copy
+        of cached result is returned.
+
+        Parameters
+        ----------
+        required_number : int
+            This is the least number of documents we want.
+        groups_names : list
+            This is list of keywords groups names used for min_limit. default is all groups, same as FilterSort.
+        include_keywords : list
+            Only rows containing any of these keywords or groups are kept.
+        exclude_keywords : list
+            Rows containing any of these keywords or groups are removed.
+
+        Returns
+        -------
+        pd.DataFrame
+            This is the sorted dataframe which contains columns in this sequential manner. It contains citation df,
+             total_keywords, group_keywords_counts, and keywords_counts in the last.
+
+        """
+        columns_names = self.get_groups_columns_names(groups_names)
+        include_keywords = tuple(sorted(set(include_keywords or ())))
+        exclude_keywords = tuple(sorted(set(exclude_keywords or ())))
+        result_key = (required_number, columns_names, include_keywords, exclude_keywords)
+        if result_key not in self.results:
+            min_counts = self.get_groups_min_counts(columns_names)
+            rows_mask = self.get_rows_mask(include_keywords, exclude_keywords)
+            histogram_key = result_key[1:]
+            if histogram_key not in self.min_limit_articles_counts:
+                self.min_limit_articles_counts[histogram_key] = get_min_limit_articles_counts(
+                    min_counts if rows_mask is None else min_counts[rows_mask])
+            min_limit = get_min_limit_for_required_number(self.min_limit_articles_counts[histogram_key],
+                                                          required_number)
+            selected_mask = min_counts >= min_limit
+            if rows_mask is not None:
+                selected_mask &= rows_mask
+            self.results[result_key] = self.filter_sort.get_sorted_dataframe(np.flatnonzero(selected_mask))
+        # copy is returned so changing a result does not change the cached one.
+        return self.results[result_key].copy()
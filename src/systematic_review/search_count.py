@@ -277,7 +277,8 @@ class SearchCount:
 
     def __init__(self, data: Union[List[dict], pd.DataFrame], search_words_object: SearchWords,
                  text_manipulation_method_name: str = "preprocess_string",
-                 custom_text_manipulation_function=None, *args, **kwargs):
+                 custom_text_manipulation_function=None, *args, pdf_text_cache_directory_path: str = None,
+                 pdf_extraction_pool: converter.PdfExtractionPool = None, **kwargs):
         """Set up all necessary data for start counting.
 
         Parameters
@@ -300,6 +301,13 @@ class SearchCount:
             This is optional custom_text_manipulation_function function if you want to implement this yourself. pass as
             custom_text_manipulation_function = function_name. it will take text as parameter with no default
             preprocess_string operation.
+        pdf_text_cache_directory_path : str
+            This is optional directory path of pdf text cache. If given, research papers pdf files are extracted only
+            once and later runs read the text from cache.
+        pdf_extraction_pool : converter.PdfExtractionPool
+            This is optional pool of worker processes. If given, research papers pdf files are extracted in worker
+            processes with time and memory limits before counting, its cache is used and failed pdf files are counted
+            as empty text.
         kwargs : Dict[str, Any]
             These key = word or {key: word} arguments are for custom_text_manipulation_function
         args : Tuple[Any, Any]
@@ -310,6 +318,12 @@ class SearchCount:
         self.args = args
         self.kwargs = kwargs
         self.custom_text_manipulation_function = custom_text_manipulation_function
+        self.pdf_extraction_pool = pdf_extraction_pool
+        if pdf_extraction_pool is not None:
+            self.pdf_text_cache = pdf_extraction_pool.pdf_text_cache
+        else:
+            self.pdf_text_cache = converter.PdfTextCache(pdf_text_cache_directory_path) if \
+                pdf_text_cache_directory_path else None
         self.data = converter.dataframe_to_records_list(data) if type(data) == pd.DataFrame else data
         self.text_manipulation_method_name = text_manipulation_method_name
         self.search_words_object = search_words_object
@@ -367,6 +381,30 @@ class SearchCount:
 
         return final_list_of_full_search_words_counts_citations_dict
 
+    def extract_pdfs_in_pool(self, research_papers_records_list: List[Dict[str, Any]]) -> set:
+        """Extract text of downloaded research papers pdf files in pdf_extraction_pool worker processes.
+
+        Parameters
+        ----------
+        research_papers_records_list : List[Dict[str, Any]]
+            This list contains data of all the research papers files contained in directory_path.
+
+        Returns
+        -------
+        set
+            This set contains paths of pdf files which failed, timed out or have no text. It is empty if
+            pdf_extraction_pool is not given.
+
+        """
+        if self.pdf_extraction_pool is None:
+            return set()
+
+        pdf_files_path_list = [record[self.research_paper_file_location_column_name]
+                               for record in research_papers_records_list
+                               if record[self.download_flag_column_name] == "yes" and
+                               record[self.research_paper_file_location_column_name].lower().endswith(".pdf")]
+        return self.pdf_extraction_pool.get_failed_files_path(pdf_files_path_list)
+
     def count_search_words_in_research_paper_text(self, research_papers_records_list: List[Dict[str, Any]]
                                                   ) -> List[Dict[str, Any]]:
         """Loop over validated research paper to count search words (SearchWords instance) in research papers data.
@@ -387,6 +425,7 @@ class SearchCount:
         """
 
         final_list_of_full_search_words_counts_citations_dict = []
+        unreadable_files_path_set = self.extract_pdfs_in_pool(research_papers_records_list)
 
         # iterating through each citation details one by one.
         for research_papers_record in research_papers_records_list:
@@ -394,8 +433,11 @@ class SearchCount:
 
             if research_papers_record[self.download_flag_column_name] != "yes":
                 continue
-            research_paper_text = converter.Reader(
-                research_papers_record[self.research_paper_file_location_column_name]).get_text()
+            research_paper_file_path = research_papers_record[self.research_paper_file_location_column_name]
+            if research_paper_file_path in unreadable_files_path_set:
+                research_paper_text = ""
+            else:
+                research_paper_text = converter.Reader(research_paper_file_path, self.pdf_text_cache).get_text()
 
             text = string_manipulation.text_manipulation_methods(research_paper_text,
                                                                  self.text_manipulation_method_name,
@@ -254,6 +254,41 @@ def strip_string_from_right_side(string: str, value_to_be_stripped: str = ".pdf"
     return stripped_string
 
 
+def normalize_author_name(author_name: str, initials_only: bool = False) -> str:
+    """Normalize author name to lowercase surname followed by given names, so different forms of same name are equal.
+    Example - 'Smith, John' -> 'smith john', 'John Smith' -> 'smith john', 'Smith, J.' -> 'smith j',
+    'Müller, A' -> 'muller a'. Earlier only first initial was kept by default, which made 'John Smith' and 'Jane Smith'
+    same author, use initials_only for that output.
+
+    Parameters
+    ----------
+    author_name : str
+        This is author name in 'surname, given names' or 'given names surname' format.
+    initials_only : bool
+        If True, only first initial of given names is kept, so 'Smith, John' and 'Smith, J.' are equal -> 'smith j'.
+        Different authors with same surname and initial are equal too.
+
+    Returns
+    -------
+    str
+        This is normalized author name, empty string if name has no letters.
+
+    """
+    author_name = unicodedata.normalize("NFKD", author_name).encode("ascii", "ignore").decode("ascii").lower()
+    if "," in author_name:
+        surname, given_names = author_name.split(",", 1)
+    else:
+        name_parts = author_name.rsplit(None, 1)
+        given_names, surname = name_parts if len(name_parts) == 2 else ("", author_name)
+    surname = " ".join("".join(character if character.isalpha() else " " for character in surname).split())
+    given_names = "".join(character if character.isalpha() else " " for character in given_names).split()
+    if not surname:
+        return ""
+    if not given_names:
+        return surname
+    return f"{surname} {given_names[0][0]}" if initials_only else f"{surname} {' '.join(given_names)}"
+
+
 def text_manipulation_methods(text: str, text_manipulation_method_name: str = "preprocess_string",
                               custom_text_manipulation_function: Callable[[str, Any, Any], str] = None,
                               *args, **kwargs) -> str:
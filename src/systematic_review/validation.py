@@ -897,8 +897,54 @@ def get_missed_original_articles_list(original_article_list: list, downloaded_ar
     return missed_articles_list
 
 
+def finding_missed_articles_using_title_index(articles_path_list: list, original_articles_list: list,
+                                             title_index: converter.TitleIndex) -> tuple:
+    """Checks how many articles are not downloaded yet from original list of articles. Files names and original titles
+    are looked up in title_index and matched on record ids of citations, and only articles or files not found in index
+    are searched in names of rest of files.
+
+    Parameters
+    ----------
+    articles_path_list : list
+        Contains path of validated downloaded articles files.
+    original_articles_list : list
+        This is original list of normalized titles from where we started downloading the articles.
+    title_index : converter.TitleIndex
+        This is the title index of citations, output of citation.Citations.create_title_index.
+
+    Returns
+    -------
+    tuple
+        Missing_articles - these are the articles which are missed from downloading.
+        Validated_articles - This is list of validated downloaded articles list.
+
+    """
+    downloaded_names = [title_index.normalize_title(os_utils.get_filename_from_path(path))
+                        for path in articles_path_list]
+    downloaded_record_ids = title_index.get_many(downloaded_names, normalized=True)
+    original_record_ids = title_index.get_many(original_articles_list, normalized=True)
+    downloaded_record_ids_set = set(downloaded_record_ids[downloaded_record_ids >= 0].tolist())
+    original_record_ids_set = set(original_record_ids[original_record_ids >= 0].tolist())
+
+    downloaded_articles = []
+    unmatched_articles = []
+    for article, record_id in zip(original_articles_list, original_record_ids.tolist()):
+        if record_id in downloaded_record_ids_set:
+            downloaded_articles.append(article)
+        else:
+            unmatched_articles.append(article)
+    unmatched_downloaded_names = [name for name, record_id in zip(downloaded_names, downloaded_record_ids.tolist())
+                                  if record_id not in original_record_ids_set]
+    if not unmatched_articles or not unmatched_downloaded_names:
+        return unmatched_articles, downloaded_articles
+    missing_articles, fuzzy_downloaded_articles = finding_missed_articles_from_downloading(
+        unmatched_downloaded_names, unmatched_articles)
+    return missing_articles, downloaded_articles + fuzzy_downloaded_articles
+
+
 def get_missed_articles_dataframe(filter_sorted_citations_df: pd.DataFrame, downloaded_articles_path: str,
-                                  title_column_name: str = "cleaned_title") -> list:
+                                  title_column_name: str = "cleaned_title",
+                                  title_index: converter.TitleIndex = None) -> list:
     """return list of missed articles from downloading by checking original list of articles from
     filter_sorted_citations_df using downloaded articles path.
 
@@ -910,6 +956,8 @@ def get_missed_articles_dataframe(filter_sorted_citations_df: pd.DataFrame, down
         This dataframe contains records of selected articles including name of articles.
     downloaded_articles_path : str
         contains parent folder of all the downloaded articles files.
+    title_index : converter.TitleIndex
+        This is optional title index of citations. If given, files names are matched to titles by exact lookup first.
 
     Returns
     -------
@@ -921,6 +969,8 @@ def get_missed_articles_dataframe(filter_sorted_citations_df: pd.DataFrame, down
     validated_articles_list, invalidated_list, manual_list = validating_pdfs_using_multiple_pdf_reader(
         downloaded_articles_path)
     articles_list = getting_article_paths_from_validation_detail(validated_articles_list)
+    if title_index is not None:
+        return finding_missed_articles_using_title_index(articles_list, original_list, title_index)[0]
     downloaded_list = [
         string_manipulation.preprocess_string(os_utils.get_filename_from_path(k))
         for k in articles_list]
@@ -1054,7 +1104,10 @@ class Validation:
                  text_manipulation_method_name: str = "preprocess_string_to_space_separated_words",
                  words_percentage_checker_in_text_validation_limit: float = 70,
                  jumbled_words_percentage_checker_in_text_validation_limit: float = 70,
-                 jumbled_words_percentage_checker_in_text_wrong_word_limit: int = 2
+                 jumbled_words_percentage_checker_in_text_wrong_word_limit: int = 2,
+                 pdf_text_cache_directory_path: str = None,
+                 pdf_extraction_pool: converter.PdfExtractionPool = None,
+                 title_index: converter.TitleIndex = None
                  ):
         """
 
@@ -1079,6 +1132,16 @@ class Validation:
             This is the limit unto which algorithm ignore the wrong word in sequence.
         words_percentage_checker_in_text_validation_limit : float
             This is the limit on similarity of checked substring. Example - 0.5 will return true if half of word found same.
+        pdf_text_cache_directory_path : str
+            This is optional directory path of pdf text cache. If given, pdf files are extracted only once by each pdf
+            reader and later runs read the text from cache.
+        pdf_extraction_pool : converter.PdfExtractionPool
+            This is optional pool of worker processes. If given, pdf files are extracted in worker processes with time
+            and memory limits before validation, its cache is used and failed pdf files are flagged unreadable.
+        title_index : converter.TitleIndex
+            This is optional title index of citations, output of citation.Citations.create_title_index. If given,
+            files names are normalized with its text manipulation method and matched to citations on record ids of
+            index, check file_name_and_path_dict. Files not matching any title are printed.
 
         """
 
@@ -1087,7 +1150,15 @@ class Validation:
         self.jumbled_words_percentage_checker_in_text_validation_limit = \
             jumbled_words_percentage_checker_in_text_validation_limit
         self.words_percentage_checker_in_text_validation_limit = words_percentage_checker_in_text_validation_limit
-        self.text_manipulation_method_name = text_manipulation_method_name
+        self.title_index = title_index
+        self.text_manipulation_method_name = title_index.text_manipulation_method_name if title_index is not None \
+            else text_manipulation_method_name
+        self.pdf_extraction_pool = pdf_extraction_pool
+        if pdf_extraction_pool is not None:
+            self.pdf_text_cache = pdf_extraction_pool.pdf_text_cache
+        else:
+            self.pdf_text_cache = converter.PdfTextCache(pdf_text_cache_directory_path) if \
+                pdf_text_cache_directory_path else None
         self.text_file_path_of_inaccessible_research_papers = text_file_path_of_inaccessible_research_papers
         self.parents_directory_of_research_papers_files = parents_directory_of_research_papers_files
         self.citations_records_list = converter.dataframe_to_records_list(citations_data) \
@@ -1123,12 +1194,14 @@ class Validation:
         return complete_citations_records_list
 
     def file_name_and_path_dict(self):
-        """contains mapping of filename to file paths
+        """contains mapping of filename to file paths. If title_index is given, files names and citations titles are
+        looked up in it and file is also mapped to cleaned title of citation having same record id, so file named with
+        other form of title of same citation is found.
 
         Returns
         -------
         dict
-            key is filename and value is file paths.
+            key is filename or cleaned title of citation and value is file paths.
 
         """
         file_name_and_path = {}
@@ -1143,8 +1216,75 @@ class Validation:
 
             file_name_and_path[clean_article_name] = path
 
+        if self.title_index is not None:
+            files_path = list(file_name_and_path.values())
+            files_record_ids = self.title_index.get_many(file_name_and_path, normalized=True).tolist()
+            record_id_and_path = dict(zip(files_record_ids, files_path))
+            cleaned_titles = [citation[self.cleaned_article_column_name] for citation in self.research_papers_list]
+            for cleaned_title, record_id in zip(cleaned_titles,
+                                                self.title_index.get_many(cleaned_titles, normalized=True).tolist()):
+                if record_id >= 0 and record_id in record_id_and_path and cleaned_title not in file_name_and_path:
+                    file_name_and_path[cleaned_title] = record_id_and_path[record_id]
+            unmatched_files_path = [path for path, record_id in zip(files_path, files_record_ids) if record_id < 0]
+            if unmatched_files_path:
+                print(f"{len(unmatched_files_path)} files names do not match any citation title: "
+                      f"{unmatched_files_path}")
         return file_name_and_path
 
+    def research_paper_title_checker(self, cleaned_article_name: str):
+        """Provides function which checks if article name words are in text read so far, as exact sequence of words.
+        Pdf readers stop reading pages after the page where article name is found. Only new page is preprocessed with
+        last words of previous pages, so title split across pages is found too. Fuzzy validation methods run once on
+        read text after reading stops.
+
+        Parameters
+        ----------
+        cleaned_article_name : str
+            This is the preprocessed name of article.
+
+        Returns
+        -------
+        function
+            This takes text of next page and returns True if article name is found. It keeps state of pages read, so
+            new one is needed for each reading.
+
+        """
+        title_words = string_manipulation.split_preprocess_string(cleaned_article_name)
+        title_words_string = f" {' '.join(title_words)} "
+        previous_words = []
+
+        def title_checker(page_text: str) -> bool:
+            if not title_words:
+                return False
+            words = previous_words + string_manipulation.split_preprocess_string(page_text)
+            previous_words[:] = words[len(words) - len(title_words) + 1:]
+            return title_words_string in f" {' '.join(words)} "
+
+        return title_checker
+
+    def extract_pdfs_in_pool(self) -> set:
+        """Extract text of pdf files needed by validation in pdf_extraction_pool worker processes.
+
+        Returns
+        -------
+        set
+            This set contains paths of pdf files which failed, timed out or have no text. It is empty if
+            pdf_extraction_pool is not given.
+
+        """
+        if self.pdf_extraction_pool is None:
+            return set()
+
+        pdf_files_path_list = []
+        for citation in self.research_papers_list:
+            if (citation[self.download_flag_column_name].lower() == "no") and (
+                    citation[self.cleaned_article_column_name] in self.file_name_and_path_mapping):
+                file_path = self.file_name_and_path_mapping[citation[self.cleaned_article_column_name]]
+                if os_utils.get_file_extension_from_path(file_path) == "pdf":
+                    pdf_files_path_list.append(file_path)
+
+        return self.pdf_extraction_pool.get_failed_files_path(pdf_files_path_list)
+
     def check(self):
         """Executes the validation of research articles in citation data by checking the research paper files and
         validating if the research articles are correct.
@@ -1156,17 +1296,25 @@ class Validation:
 
         """
 
+        unreadable_files_path_set = self.extract_pdfs_in_pool()
+        pymupdf_pending_citations = []
+
         for citation in self.research_papers_list:
 
             if (citation[self.download_flag_column_name].lower() == "no") and (
                     citation[self.cleaned_article_column_name] in self.file_name_and_path_mapping):
 
                 research_paper = converter.Reader(
-                    self.file_name_and_path_mapping[citation[self.cleaned_article_column_name]])
+                    self.file_name_and_path_mapping[citation[self.cleaned_article_column_name]], self.pdf_text_cache)
                 file_extension = research_paper.file_extension
 
+                if research_paper.file_path in unreadable_files_path_set:
+                    citation[self.download_flag_column_name] = self.file_manual_check_flag_name
+                    continue
+
                 if file_extension == 'pdf':
-                    text = research_paper.pdf_pdftotext_reader()
+                    title_checker = self.research_paper_title_checker(citation[self.cleaned_article_column_name])
+                    text = research_paper.pdf_pdftotext_reader(stop_when=title_checker)
                     if text:
                         validation_result = ValidateWordsInText(
                             citation[self.cleaned_article_column_name], text,
@@ -1180,27 +1328,11 @@ class Validation:
                             citation[self.validation_method_column_name] = validation_result[2]
                             continue
 
-                    text = research_paper.pdf_pymupdf_reader()
-                    if not text:
-                        citation[self.download_flag_column_name] = self.file_manual_check_flag_name
+                    if self.pdf_extraction_pool is not None:
+                        # pymupdf text is extracted for all such files together in worker processes after this loop.
+                        pymupdf_pending_citations.append((citation, research_paper))
                         continue
-
-                    validation_result = ValidateWordsInText(
-                        citation[self.cleaned_article_column_name], text,
-                        self.words_percentage_checker_in_text_validation_limit,
-                        self.jumbled_words_percentage_checker_in_text_validation_limit,
-                        self.jumbled_words_percentage_checker_in_text_wrong_word_limit).multiple_methods()
-
-                    if validation_result[0]:
-                        citation[self.download_flag_column_name] = self.file_validated_flag_name
-                        citation[self.research_paper_file_location_column_name] = self.file_name_and_path_mapping[
-                            citation[self.cleaned_article_column_name]]
-                        citation[self.validation_method_column_name] = validation_result[2]
-                    else:
-                        citation[self.download_flag_column_name] = self.file_invalidated_flag_name
-                        citation[self.research_paper_file_location_column_name] = self.file_name_and_path_mapping[
-                            citation[self.cleaned_article_column_name]]
-                        citation[self.validation_method_column_name] = validation_result[2]
+                    self.validate_pymupdf_text(citation, research_paper)
                 else:
                     text = research_paper.get_text()
                     if not text:
@@ -1224,8 +1356,53 @@ class Validation:
                             citation[self.cleaned_article_column_name]]
                         citation[self.validation_method_column_name] = validation_result[2]
 
+        if pymupdf_pending_citations:
+            unreadable_files_path_set = self.pdf_extraction_pool.get_failed_files_path(
+                [research_paper.file_path for _, research_paper in pymupdf_pending_citations], ["pymupdf"])
+            for citation, research_paper in pymupdf_pending_citations:
+                if research_paper.file_path in unreadable_files_path_set:
+                    citation[self.download_flag_column_name] = self.file_manual_check_flag_name
+                else:
+                    self.validate_pymupdf_text(citation, research_paper)
+
         return self.research_papers_list
 
+    def validate_pymupdf_text(self, citation: dict, research_paper: converter.Reader) -> None:
+        """Validate research paper using text from pymupdf, used when pdftotext text does not validate. When
+        pdf_extraction_pool is given, text is already cached by its worker processes.
+
+        Parameters
+        ----------
+        citation : dict
+            This is the citation record, its validation columns are updated.
+        research_paper : converter.Reader
+            This is the reader of research paper pdf file.
+
+        Returns
+        -------
+        None
+
+        """
+        text = research_paper.pdf_pymupdf_reader(stop_when=self.research_paper_title_checker(
+            citation[self.cleaned_article_column_name]))
+        if not text:
+            citation[self.download_flag_column_name] = self.file_manual_check_flag_name
+            return
+
+        validation_result = ValidateWordsInText(
+            citation[self.cleaned_article_column_name], text,
+            self.words_percentage_checker_in_text_validation_limit,
+            self.jumbled_words_percentage_checker_in_text_validation_limit,
+            self.jumbled_words_percentage_checker_in_text_wrong_word_limit).multiple_methods()
+
+        if validation_result[0]:
+            citation[self.download_flag_column_name] = self.file_validated_flag_name
+        else:
+            citation[self.download_flag_column_name] = self.file_invalidated_flag_name
+        citation[self.research_paper_file_location_column_name] = self.file_name_and_path_mapping[
+            citation[self.cleaned_article_column_name]]
+        citation[self.validation_method_column_name] = validation_result[2]
+
     def get_records_list(self) -> List[Dict[str, Any]]:
         """Outputs the records list containing validation results of input data.
 
@@ -1293,3 +1470,19 @@ class Validation:
         """
         converter.dataframe_to_excel_file(self.get_dataframe(), output_filename, index)
 
+    def to_ris(self, output_filename: str = "output.ris", ris_tags_columns_mapping: Dict[str, str] = None):
+        """This function saves citations to ris file using converter.RisFileWriter.
+
+        Parameters
+        ----------
+        output_filename : str
+            This is the name of output file which should contains .ris extension
+        ris_tags_columns_mapping : Dict[str, str]
+            This contains ris tag as key and column name as value. Default matches citations loaded by rispy.
+
+        Returns
+        -------
+
+        """
+        converter.dataframe_to_ris_file(self.get_dataframe(), output_filename, ris_tags_columns_mapping)
+
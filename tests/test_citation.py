@@ -0,0 +1,277 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from systematic_review import citation, string_manipulation
+
+
+class TestNormalizedTitleYearKeys(unittest.TestCase):
+
+    def test_numbered_titles_get_different_keys(self):
+        citations_df = pd.DataFrame({"title": ["Web 2.0 in finance", "Web 3.0 in finance", "Study 1", "Study 2"],
+                                     "year": ["2020", "2020", "2019", "2019"]})
+        keys = citation.get_normalized_title_year_keys(citations_df)
+        self.assertEqual(list(keys), ["web 2 0 in finance|2020", "web 3 0 in finance|2020", "study 1|2019",
+                                      "study 2|2019"])
+
+    def test_non_latin_title_has_key(self):
+        keys = citation.get_normalized_title_year_keys(pd.DataFrame({"title": ["深度学习"], "year": ["2021"]}))
+        self.assertEqual(list(keys), ["深度学习|2021"])
+
+    def test_numbered_titles_are_not_dropped_as_duplicates(self):
+        citations_df = pd.DataFrame({"title": ["Study 1", "Study 2", "study 1!"], "year": ["2019", "2019", "2019"]})
+        deduplicated_df = citation.drop_duplicates_citations_on_identifiers(citations_df)
+        self.assertEqual(list(deduplicated_df["title"]), ["Study 1", "Study 2"])
+
+
+class TestInternAuthors(unittest.TestCase):
+
+    def test_missing_names_inside_authors_list_are_removed(self):
+        authors_series = pd.Series([["Smith, John", None, "Doe, Jane", float("nan")], ["Doe, Jane"], None])
+        author_ids, authors_counts, author_names = citation.intern_authors(authors_series)
+        self.assertEqual(list(authors_counts), [2, 1, 0])
+        self.assertEqual([author_names[author_id] for author_id in author_ids], ["smith john", "doe jane", "doe jane"])
+
+    def test_same_author_written_differently_gets_same_id(self):
+        author_ids, authors_counts, author_names = citation.intern_authors(pd.Series([["Smith, John"], ["John Smith"],
+                                                                                      ["!!"]]))
+        self.assertEqual(list(author_ids), [0, 0])
+        self.assertEqual(list(authors_counts), [1, 1, 0])
+        self.assertEqual(author_names, ["smith john"])
+
+    def test_authors_with_same_surname_and_initial_are_different(self):
+        authors_series = pd.Series([["Smith, John"], ["Jane Smith"], ["Smith, J."]])
+        author_ids, authors_counts, author_names = citation.intern_authors(authors_series)
+        self.assertEqual(author_names, ["smith john", "smith jane", "smith j"])
+        author_ids, authors_counts, author_names = citation.intern_authors(authors_series, initials_only=True)
+        self.assertEqual(list(author_ids), [0, 0, 0])
+        self.assertEqual(author_names, ["smith j"])
+
+    def test_normalize_author_name(self):
+        for author_name, normalized_name, initials_name in [("Smith, John A.", "smith john a", "smith j"),
+                                                            ("J. A. Smith", "smith j a", "smith j"),
+                                                            ("Müller, Anna", "muller anna", "muller a"),
+                                                            ("Plato", "plato", "plato"), ("!!", "", "")]:
+            self.assertEqual(string_manipulation.normalize_author_name(author_name), normalized_name)
+            self.assertEqual(string_manipulation.normalize_author_name(author_name, initials_only=True), initials_name)
+
+
+class TestCitationsToRisConverter(unittest.TestCase):
+
+    def test_json_file_is_previewed_and_converted(self):
+        with tempfile.TemporaryDirectory() as temporary_directory_path:
+            json_file_path = os.path.join(temporary_directory_path, "citations.json")
+            pd.DataFrame({"title": ["Deep learning for finance"], "year": ["2021"]}).to_json(json_file_path)
+            ris_file_path = os.path.join(temporary_directory_path, "citations.ris")
+            answers = ["JOUR", "", "year", "title", "", "", "", "", ""]
+            with mock.patch("builtins.input", side_effect=answers), mock.patch("builtins.print"):
+                citation.citations_to_ris_converter(json_file_path, ris_file_path, "read_json")
+            with open(ris_file_path) as ris_file:
+                ris_text = ris_file.read()
+        self.assertIn("TI  - Deep learning for finance", ris_text)
+        self.assertIn("PY  - 2021", ris_text)
+
+
+class TestDropDuplicatesCitationsAddSourcesColumn(unittest.TestCase):
+
+    def setUp(self):
+        self.citations = pd.DataFrame({"title": ["graph networks", "deep learning", "deep learning", "deep learning"],
+                                       "year": [2020, 2021, 2021, 2021],
+                                       "source": ["wos", "scopus", "scopus", "wos"]})
+
+    def test_sources_are_listed_once_per_citation(self):
+        clean_df = citation.drop_duplicates_citations_add_sources_column(self.citations)
+        self.assertEqual(clean_df["title"].tolist(), ["graph networks", "deep learning"])
+        self.assertEqual(clean_df["multiple_sources"].tolist(), [["wos"], ["wos", "scopus"]])
+
+    def test_add_multiple_sources_column_repeats_sources_of_duplicates(self):
+        sources_df = citation.add_multiple_sources_column(self.citations)
+        self.assertEqual(sources_df["multiple_sources"].iloc[1], ["scopus", "scopus", "wos"])
+
+
+class TestIncrementalCitations(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.ris_directory_path = os.path.join(self.temporary_directory.name, "citations")
+        self.state_directory_path = os.path.join(self.temporary_directory.name, "state")
+        os.makedirs(self.ris_directory_path)
+        self.write_ris_file("a_scopus.ris", [
+            {"type_of_reference": "JOUR", "title": "Deep learning for finance", "year": "2021", "doi": "10.1/a"},
+            {"type_of_reference": "JOUR", "title": "Graph networks for credit risk", "year": "2020"}])
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def write_ris_file(self, file_name, entries):
+        import rispy
+        with open(os.path.join(self.ris_directory_path, file_name), "w") as ris_file:
+            rispy.dump(entries, ris_file)
+
+    def test_incremental_run_is_same_as_full_run_and_saves_only_new_part(self):
+        citation.Citations(self.ris_directory_path, state_directory_path=self.state_directory_path
+                           ).create_citations_dataframe()
+        first_part_file_path = os.path.join(self.state_directory_path, "part_00000.pkl")
+        first_part_modification_time = os.stat(first_part_file_path).st_mtime_ns
+        self.write_ris_file("b_wos.ris", [
+            {"type_of_reference": "JOUR", "title": "Deep Learning for Finance", "year": "2021", "doi": "10.1/A"},
+            {"type_of_reference": "JOUR", "title": "Survey of neural markets", "year": "2019"}])
+
+        with mock.patch("builtins.print"):
+            incremental_df = citation.Citations(self.ris_directory_path,
+                                                state_directory_path=self.state_directory_path
+                                                ).create_citations_dataframe()
+        loaded_df = citation.Citations(self.ris_directory_path, state_directory_path=self.state_directory_path
+                                       ).create_citations_dataframe()
+        full_df = citation.Citations(self.ris_directory_path).create_citations_dataframe()
+
+        def get_title_sources(citations_df):
+            return sorted((title, sorted(sources)) for title, sources in
+                          zip(citations_df["cleaned_title"], citations_df["multiple_sources"]))
+
+        # files are loaded in directory order by full run, so only rows and their sources are compared.
+        for citations_df in (incremental_df, loaded_df):
+            self.assertEqual(get_title_sources(citations_df), get_title_sources(full_df))
+        self.assertEqual(incremental_df["multiple_sources"].tolist()[0], ["a_scopus", "b_wos"])
+        self.assertEqual(os.stat(first_part_file_path).st_mtime_ns, first_part_modification_time)
+        self.assertTrue(os.path.isfile(os.path.join(self.state_directory_path, "part_00001.pkl")))
+
+
+class TestCitationsToRis(unittest.TestCase):
+
+    def test_deduplicated_citations_round_trip_through_rispy(self):
+        import rispy
+        entries = [{"type_of_reference": "JOUR", "title": "Deep learning for finance", "year": "2021",
+                    "authors": ["Smith, John"], "doi": "10.1/a"},
+                   {"type_of_reference": "CONF", "title": "Graph networks for credit risk", "year": "2020"}]
+        with tempfile.TemporaryDirectory() as temporary_directory_path:
+            ris_directory_path = os.path.join(temporary_directory_path, "citations")
+            os.makedirs(ris_directory_path)
+            for file_name in ("scopus.ris", "wos.ris"):
+                with open(os.path.join(ris_directory_path, file_name), "w") as ris_file:
+                    rispy.dump(entries, ris_file)
+            output_file_path = os.path.join(temporary_directory_path, "output.ris")
+            citation.Citations(ris_directory_path).to_ris(output_file_path)
+            with open(output_file_path, encoding="utf-8") as ris_file:
+                written_entries = rispy.load(ris_file)
+        self.assertEqual(written_entries, entries)
+
+
+class TestNearDuplicates(unittest.TestCase):
+
+    def setUp(self):
+        self.citations = pd.DataFrame({
+            "title": ["Deep learning for finance: a survey", "Graph networks for credit risk",
+                      "Deep learning for finance - a survey", "Deep Learning for Finance; A Survey"],
+            "abstract": [None, "credit risk with graphs", "we survey deep learning", None]})
+
+    def test_pairs_similar_to_each_other_but_not_to_first_member_are_clustered(self):
+        signatures = np.array([[0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+                               [0, 1, 2, 3, 4, 5, 6, 100, 101, 102],
+                               [0, 1, 2, 200, 4, 5, 300, 100, 101, 102]], dtype=np.uint32)
+        np.testing.assert_array_equal(citation.lsh_near_duplicate_clusters(signatures, threshold=0.6), [0, 0, 0])
+
+    def test_title_punctuation_variants_are_clustered(self):
+        clusters = citation.get_near_duplicate_clusters(self.citations, columns=["title"])
+        self.assertEqual(clusters, [[0, 2, 3]])
+
+    def test_most_complete_citation_of_cluster_is_kept(self):
+        clean_df = citation.drop_near_duplicates_citations(self.citations, columns=["title"])
+        self.assertEqual(clean_df["title"].tolist(), ["Graph networks for credit risk",
+                                                      "Deep learning for finance - a survey"])
+        self.assertEqual(clean_df["duplicate_cluster"].tolist(), [1, 0])
+
+
+class TestCitationsIdentifierColumns(unittest.TestCase):
+
+    def test_identifier_columns_names_choose_duplicate_keys(self):
+        import rispy
+        entries = [{"type_of_reference": "JOUR", "title": "Deep learning for finance", "year": "2021", "doi": "10.1/a"},
+                   {"type_of_reference": "JOUR", "title": "Deep learning in finance", "year": "2021", "doi": "10.1/A"},
+                   {"type_of_reference": "JOUR", "title": "Deep Learning for Finance!", "year": "2021"}]
+        with tempfile.TemporaryDirectory() as ris_directory_path:
+            with open(os.path.join(ris_directory_path, "scopus.ris"), "w") as ris_file:
+                rispy.dump(entries, ris_file)
+            identifiers_df = citation.Citations(ris_directory_path).create_citations_dataframe()
+            title_year_df = citation.Citations(ris_directory_path, identifier_columns_names=[]
+                                               ).create_citations_dataframe()
+            with self.assertRaises(ValueError):
+                citation.Citations(ris_directory_path, identifier_columns_names=["isbn"])
+        self.assertEqual(list(identifiers_df["title"]), ["Deep learning for finance"])
+        self.assertEqual(list(title_year_df["title"]), ["Deep learning for finance", "Deep learning in finance"])
+
+
+class TestGetCitationTexts(unittest.TestCase):
+
+    def test_missing_values_are_empty_instead_of_nan(self):
+        citations_df = pd.DataFrame({"title": ["Deep learning", None, float("nan"), "Graph networks"],
+                                     "abstract": [float("nan"), "Neural markets", None, ""],
+                                     "keywords": [["finance", "review"], None, float("nan"), ["credit", None]]},
+                                    index=[3, 5, 7, 9])
+        citation_texts = citation.get_citation_texts(citations_df)
+        self.assertEqual(list(citation_texts), ["Deep learning finance review", "Neural markets", "",
+                                                "Graph networks credit"])
+        self.assertEqual(list(citation_texts.index), [3, 5, 7, 9])
+        self.assertFalse(citation_texts.str.split().map(lambda words: "nan" in words).any())
+
+    def test_columns_are_joined_in_order_and_missing_columns_are_ignored(self):
+        citations_df = pd.DataFrame({"title": ["Deep learning"], "abstract": ["Neural markets"], "year": [2021]})
+        self.assertEqual(list(citation.get_citation_texts(citations_df, ["abstract", "keywords", "title", "year"])),
+                         ["Neural markets Deep learning 2021"])
+        self.assertEqual(list(citation.get_citation_texts(citations_df, ["keywords"])), [""])
+
+    def test_add_citation_text_column(self):
+        citations_df = citation.add_citation_text_column(pd.DataFrame({"title": ["Deep learning"],
+                                                                       "abstract": [None], "keywords": [["ai"]]}))
+        self.assertEqual(list(citations_df["citation_text"]), ["Deep learning ai"])
+
+
+class TestArticleNameIndexFromCitations(unittest.TestCase):
+
+    def setUp(self):
+        self.sources_name_citations = [
+            ["scopus", [{"title": "Deep Learning for Finance", "doi": "10.1/a", "url": "https://a"},
+                        {"abstract": "citation without title"},
+                        {"title": "Graph networks", "doi": "10.1/b"}]],
+            ["wos", [{"title": "deep learning for FINANCE", "doi": "10.2/a", "url": "https://wos/a"},
+                     {"title": "Neural markets", "url": "https://c"}]]]
+        self.article_name_index = citation.create_article_name_index_from_citations(self.sources_name_citations)
+        self.deep_learning_name = string_manipulation.preprocess_string("Deep Learning for Finance")
+
+    def test_first_source_wins_for_same_title(self):
+        self.assertEqual(self.article_name_index[self.deep_learning_name],
+                         {"source_name": "scopus", "doi": "10.1/a", "url": "https://a"})
+
+    def test_index_keeps_only_available_doi_and_url(self):
+        self.assertEqual(len(self.article_name_index), 3)
+        self.assertEqual(self.article_name_index[string_manipulation.preprocess_string("Graph networks")],
+                         {"source_name": "scopus", "doi": "10.1/b"})
+        self.assertEqual(self.article_name_index[string_manipulation.preprocess_string("Neural markets")],
+                         {"source_name": "wos", "url": "https://c"})
+
+    def test_index_lookup_is_same_as_iterating_citations(self):
+        for doi_url in (False, True):
+            indexed_details = citation.get_details_via_article_name_from_citations(
+                self.deep_learning_name, self.sources_name_citations[0], doi_url,
+                article_name_index=self.article_name_index)
+            iterated_details = citation.get_details_via_article_name_from_citations(
+                self.deep_learning_name, self.sources_name_citations[0], doi_url)
+            self.assertEqual(indexed_details, iterated_details)
+        self.assertIsNone(citation.get_details_via_article_name_from_citations(
+            "unknown article", self.sources_name_citations[0], article_name_index=self.article_name_index))
+
+    def test_details_of_all_article_names(self):
+        filtered_list_of_dict = [{"title": self.deep_learning_name},
+                                 {"title": string_manipulation.preprocess_string("Neural markets")}]
+        with mock.patch("builtins.print"):
+            all_details = citation.get_details_of_all_article_name_from_citations(filtered_list_of_dict,
+                                                                                  self.sources_name_citations)
+        self.assertEqual([details["source_name"] for details in all_details], ["scopus", "wos"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,316 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+from systematic_review import converter
+
+
+def create_pdf_file(pdf_file_path, pages_text):
+    import fitz
+    document = fitz.open()
+    for page_text in pages_text:
+        page = document.new_page()
+        if page_text:
+            page.insert_text((72, 72), page_text)
+    document.save(pdf_file_path)
+    document.close()
+
+
+class TestPdfExtractionPool(unittest.TestCase):
+
+    def setUp(self):
+        try:
+            import fitz
+        except ImportError:
+            self.skipTest("pymupdf is not installed")
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.pdf_file_path = os.path.join(self.temporary_directory.name, "article.pdf")
+        create_pdf_file(self.pdf_file_path, ["deep learning for finance"])
+        self.cache_directory_path = os.path.join(self.temporary_directory.name, "cache")
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def test_only_requested_pdf_readers_are_run(self):
+        outcomes = converter.extract_pdf_pages_with_multiple_pdf_reader(self.pdf_file_path, ["pymupdf"])
+        self.assertEqual(list(outcomes), ["pymupdf"])
+        self.assertIn("deep learning", outcomes["pymupdf"]["pages"][0])
+
+    def test_pymupdf_fallback_is_extracted_in_worker_and_cached(self):
+        pool = converter.PdfExtractionPool(self.cache_directory_path, processes=1, timeout=60)
+        result = pool.extract(self.pdf_file_path, ["pymupdf"])
+        self.assertEqual(result["status"], pool.status_ok)
+        self.assertEqual(result["pdf_reader"], "pymupdf")
+        self.assertIsNotNone(pool.pdf_text_cache.get_pages(self.pdf_file_path, "pymupdf"))
+        self.assertIsNotNone(pool.get_cached_result(self.pdf_file_path, ["pymupdf"]))
+
+    def test_pdf_reader_error_in_worker_is_not_cached(self):
+        broken_pdf_file_path = os.path.join(self.temporary_directory.name, "broken.pdf")
+        with open(broken_pdf_file_path, "wb") as broken_pdf_file:
+            broken_pdf_file.write(b"this is not a pdf file")
+        pool = converter.PdfExtractionPool(self.cache_directory_path, processes=1, timeout=60)
+        for _ in range(2):
+            result = pool.extract(broken_pdf_file_path, ["pymupdf"])
+            self.assertEqual(result["status"], pool.status_error)
+            self.assertIn("pymupdf", result["errors"])
+            self.assertIsNone(pool.pdf_text_cache.get_pages(broken_pdf_file_path, "pymupdf"))
+            self.assertIsNone(pool.get_cached_result(broken_pdf_file_path, ["pymupdf"]))
+
+    def test_workers_are_spawned(self):
+        self.assertEqual(converter.PdfExtractionWorker.multiprocessing_context.get_start_method(), "spawn")
+
+
+class TestIterTabularFileChunks(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.dataframe = pd.DataFrame({"title": ["a", "b", "c"], "year": [2019, 2020, 2021]})
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def test_excel_file_applies_pandas_arguments(self):
+        try:
+            import openpyxl
+        except ImportError:
+            self.skipTest("openpyxl is not installed")
+        excel_file_path = os.path.join(self.temporary_directory.name, "citations.xlsx")
+        self.dataframe.to_excel(excel_file_path, index=False)
+        chunks = list(converter.iter_tabular_file_chunks(excel_file_path, "read_excel", chunksize=2,
+                                                         skiprows=[1]))
+        self.assertEqual(pd.concat(chunks)["title"].tolist(), ["b", "c"])
+
+    def test_json_file_is_read_in_chunks(self):
+        json_file_path = os.path.join(self.temporary_directory.name, "citations.json")
+        self.dataframe.to_json(json_file_path)
+        chunks = list(converter.iter_tabular_file_chunks(json_file_path, "read_json", chunksize=2))
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 1])
+
+
+class TestPdfTextCache(unittest.TestCase):
+
+    def setUp(self):
+        try:
+            import fitz
+        except ImportError:
+            self.skipTest("pymupdf is not installed")
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.pdf_text_cache = converter.PdfTextCache(os.path.join(self.temporary_directory.name, "cache"))
+        self.scanned_pdf_file_path = os.path.join(self.temporary_directory.name, "scanned.pdf")
+        create_pdf_file(self.scanned_pdf_file_path, [""])
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def test_pdf_without_text_is_extracted_once(self):
+        pages_list = self.pdf_text_cache.get_or_extract_pages(self.scanned_pdf_file_path, "pymupdf")
+        self.assertEqual("".join(pages_list), "")
+        self.assertIsNotNone(self.pdf_text_cache.get_pages(self.scanned_pdf_file_path, "pymupdf"))
+        with mock.patch.dict(converter.PdfTextCache.pdf_readers_functions, {"pymupdf": mock.Mock()}) as functions:
+            self.pdf_text_cache.get_or_extract_pages(self.scanned_pdf_file_path, "pymupdf")
+            functions["pymupdf"].assert_not_called()
+
+    def test_empty_pages_list_of_available_pdf_reader_is_cached(self):
+        with mock.patch.dict(converter.PdfTextCache.pdf_readers_functions, {"pymupdf": mock.Mock(return_value=[])}):
+            self.pdf_text_cache.get_or_extract_pages(self.scanned_pdf_file_path, "pymupdf")
+        self.assertEqual(self.pdf_text_cache.get_pages(self.scanned_pdf_file_path, "pymupdf"), [])
+
+    def test_empty_pages_of_missing_pdf_reader_are_not_cached(self):
+        with mock.patch.dict(converter.PdfTextCache.pdf_readers_functions, {"pymupdf": mock.Mock(return_value=[])}), \
+                mock.patch.object(self.pdf_text_cache, "is_pdf_reader_available", return_value=False):
+            self.assertEqual(self.pdf_text_cache.get_or_extract_pages(self.scanned_pdf_file_path, "pymupdf"), [])
+        self.assertIsNone(self.pdf_text_cache.get_pages(self.scanned_pdf_file_path, "pymupdf"))
+
+    def test_empty_pages_are_not_cached_if_disabled(self):
+        self.pdf_text_cache.get_or_extract_pages(self.scanned_pdf_file_path, "pymupdf", cache_empty_pages=False)
+        self.assertIsNone(self.pdf_text_cache.get_pages(self.scanned_pdf_file_path, "pymupdf"))
+
+
+class TestRisFileWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.ris_file_path = os.path.join(self.temporary_directory.name, "citations.ris")
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def load_ris_file(self):
+        import rispy
+        with open(self.ris_file_path, encoding="utf-8") as ris_file:
+            return rispy.load(ris_file)
+
+    def test_nullable_dtypes_missing_values_are_skipped(self):
+        dataframe = pd.DataFrame({"title": pd.array(["Deep learning for finance", None], dtype="string"),
+                                  "year": pd.array([2021, None], dtype="Int64"),
+                                  "authors": [["Smith, John", "Doe, Jane"], []]})
+        self.assertEqual(converter.dataframe_to_ris_file(dataframe, self.ris_file_path), 2)
+        self.assertEqual(self.load_ris_file(), [
+            {"type_of_reference": "JOUR", "authors": ["Smith, John", "Doe, Jane"], "year": "2021",
+             "title": "Deep learning for finance"},
+            {"type_of_reference": "JOUR"}])
+
+    def test_records_round_trip_through_rispy(self):
+        records_list = [{"type_of_reference": "BOOK", "title": "Graph networks", "year": "2020", "doi": "10.1/a"},
+                        {"title": "Neural markets", "year": "2019", "doi": "10.1/b"},
+                        {"title": "Survey of finance", "notes_abstract": "first line\nsecond line"}]
+        with converter.RisFileWriter(self.ris_file_path) as ris_writer:
+            self.assertEqual(ris_writer.write_records(records_list, block_size=2), 3)
+        self.assertEqual(self.load_ris_file(), [
+            records_list[0], dict(records_list[1], type_of_reference="JOUR"),
+            {"type_of_reference": "JOUR", "title": "Survey of finance", "notes_abstract": "first line second line"}])
+
+    def test_tag_map_is_compiled_once_for_same_keys(self):
+        records_list = [{"title": f"title {number}", "year": "2020"} for number in range(5)]
+        with converter.RisFileWriter(self.ris_file_path) as ris_writer, \
+                mock.patch.object(ris_writer, "compile_tag_map", wraps=ris_writer.compile_tag_map) as compile_tag_map:
+            ris_writer.write_records(records_list, block_size=2)
+        self.assertEqual(compile_tag_map.call_count, 1)
+        self.assertEqual(len(self.load_ris_file()), 5)
+
+
+class TestLazyPagesWithPdfTextCache(unittest.TestCase):
+
+    def setUp(self):
+        try:
+            import fitz
+        except ImportError:
+            self.skipTest("pymupdf is not installed")
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.pdf_text_cache = converter.PdfTextCache(os.path.join(self.temporary_directory.name, "cache"))
+        self.pdf_file_path = os.path.join(self.temporary_directory.name, "article.pdf")
+        create_pdf_file(self.pdf_file_path, ["deep learning", "for finance", "references"])
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def test_pages_after_stop_are_not_extracted_or_cached(self):
+        reader = converter.Reader(self.pdf_file_path, self.pdf_text_cache)
+        self.assertEqual(reader.pdf_pymupdf_reader(stop_when=lambda page_text: "learning" in page_text).strip(),
+                         "deep learning")
+        self.assertIsNone(self.pdf_text_cache.get_pages(self.pdf_file_path, "pymupdf"))
+        self.assertIn("references", reader.pdf_pymupdf_reader(stop_when=lambda page_text: False))
+        self.assertEqual(len(self.pdf_text_cache.get_pages(self.pdf_file_path, "pymupdf")), 3)
+        with mock.patch.dict(converter.PdfTextCache.pdf_readers_iter_functions, {"pymupdf": mock.Mock()}) as functions:
+            self.assertIn("for finance", reader.pdf_pymupdf_reader(stop_when=lambda page_text: "finance" in page_text))
+            functions["pymupdf"].assert_not_called()
+
+    def test_out_of_range_page_gives_no_text(self):
+        self.assertEqual(converter.get_text_from_pages_list(["first page", "second page"], 1), "second page")
+        self.assertEqual(converter.get_text_from_pages_list(["first page", "second page"], 5), "")
+        self.assertEqual(converter.get_text_from_pdf(self.pdf_file_path, 5, "pymupdf", self.pdf_text_cache), "")
+
+
+class TestAsyncReader(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.pdf_text_cache = converter.PdfTextCache(os.path.join(self.temporary_directory.name, "cache"))
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def test_text_file_is_decoded_as_utf8_with_replacement(self):
+        text_file_path = os.path.join(self.temporary_directory.name, "article.txt")
+        with open(text_file_path, "wb") as text_file:
+            text_file.write("café".encode("utf-8") + b"\xff")
+        self.assertEqual(asyncio.run(converter.read_many([text_file_path])), ["café�"])
+
+    def test_pdf_text_comes_from_cache(self):
+        try:
+            import fitz
+        except ImportError:
+            self.skipTest("pymupdf is not installed")
+        pdf_file_path = os.path.join(self.temporary_directory.name, "article.pdf")
+        create_pdf_file(pdf_file_path, ["deep learning for finance"])
+        texts = asyncio.run(converter.read_many([pdf_file_path], pdf_text_cache=self.pdf_text_cache))
+        self.assertIn("deep learning for finance", texts[0])
+        self.assertEqual(self.pdf_text_cache.get_pages(pdf_file_path, "pymupdf"), [texts[0]])
+        with mock.patch.object(converter, "get_pages_from_pdf_bytes") as get_pages_from_pdf_bytes, \
+                mock.patch.object(converter, "read_file_bytes") as read_file_bytes:
+            get_pages_from_pdf_bytes.return_value = []
+            self.assertEqual(asyncio.run(converter.read_many([pdf_file_path], pdf_text_cache=self.pdf_text_cache)),
+                             texts)
+        get_pages_from_pdf_bytes.assert_not_called()
+        read_file_bytes.assert_not_called()
+
+
+class TestTitleIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.titles = ["Deep learning for finance", None, "Graph networks: credit risk", "deep learning for FINANCE",
+                       "Survey"]
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def build_title_index(self, titles, **kwargs):
+        return converter.TitleIndex.build(titles, os.path.join(self.temporary_directory.name, "title_index"), **kwargs)
+
+    def test_first_record_id_of_normalized_title_is_kept(self):
+        title_index = self.build_title_index(iter(self.titles), record_ids=iter([10, 11, 12, 13, 14]))
+        self.assertEqual(len(title_index), 3)
+        self.assertEqual(title_index.get("DEEP learning for finance"), 10)
+        self.assertEqual(title_index.get("graph networks credit risk"), 12)
+        self.assertEqual(self.build_title_index(pd.Series(self.titles, index=[5, 4, 3, 2, 1])).get("survey"), 4)
+
+    def test_get_many_is_same_as_get(self):
+        title_index = self.build_title_index(self.titles)
+        queries = ["deep learning for finance", "Survey!", None, "unknown title", "graph networks credit risk", 5]
+        self.assertEqual(title_index.get_many(queries).tolist(), [title_index.get(query, -1) for query in queries])
+        self.assertEqual(title_index.get_many(queries).tolist(), [0, 4, -1, -1, 2, -1])
+        self.assertEqual(title_index.get_many(["survey", "Survey"], normalized=True).tolist(), [4, -1])
+
+    def test_hash_collisions_are_compared_on_titles(self):
+        with mock.patch.object(converter, "get_title_hash", return_value=7):
+            title_index = self.build_title_index(self.titles)
+            self.assertEqual(title_index.get_many(["survey", "graph networks credit risk", "unknown"]).tolist(),
+                             [4, 2, -1])
+
+
+class TestRepairRisFile(unittest.TestCase):
+
+    def repair(self, ris_text, **kwargs):
+        with tempfile.TemporaryDirectory() as temporary_directory_path:
+            input_file_path = os.path.join(temporary_directory_path, "input.ris")
+            output_file_path = os.path.join(temporary_directory_path, "output.ris")
+            with open(input_file_path, "wb") as input_file:
+                input_file.write(ris_text.encode())
+            changes_count = converter.repair_ris_file(input_file_path, output_file_path, **kwargs)
+            with open(output_file_path, "rb") as output_file:
+                return output_file.read().decode(), changes_count
+
+    def test_loose_known_tags_are_normalized(self):
+        repaired_text, changes_count = self.repair("TY - JOUR\nTI-  Deep learning\n  AU -Smith, John\nER -\n",
+                                                   fixes=["normalize_tag_spacing"])
+        self.assertEqual(repaired_text, "TY  - JOUR\nTI  - Deep learning\nAU  - Smith, John\nER  - \n")
+        self.assertEqual(changes_count, {"normalize_tag_spacing": 4})
+
+    def test_continuation_lines_are_not_promoted_to_tags(self):
+        ris_text = "TY  - JOUR\nAB  - This study is\nUS - based and\nCO - authored work\nER  - \n"
+        repaired_text, changes_count = self.repair(ris_text, fixes=["normalize_tag_spacing"])
+        self.assertEqual(repaired_text, ris_text)
+        self.assertEqual(changes_count, {"normalize_tag_spacing": 0})
+
+    def test_all_fixes_repair_loadable_file(self):
+        import rispy
+        repaired_text, changes_count = self.repair(
+            "TY - JOUR\n\nTI - Deep learning\nUS - based\n   \nTY - CONF\nTI - Graph networks\n", block_size=16)
+        self.assertEqual(repaired_text, "TY  - JOUR\nTI  - Deep learning\nUS - based\nER  - \nTY  - CONF\n"
+                                        "TI  - Graph networks\nER  - \n")
+        self.assertEqual(changes_count, {"normalize_tag_spacing": 4, "drop_blank_lines": 2, "insert_missing_er": 2})
+        entries = rispy.loads(repaired_text)
+        self.assertEqual([entry["title"] for entry in entries], ["Deep learning US - based", "Graph networks"])
+
+    def test_unknown_fix_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            self.repair("TY  - JOUR\nER  - \n", fixes=["unknown_fix"])
+
+
+if __name__ == '__main__':
+    unittest.main()
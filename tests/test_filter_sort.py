@@ -0,0 +1,352 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from systematic_review import filter_sort, search_count
+
+
+def create_counts_records():
+    return [{"title": "neural finance", "year": 2021, "total_keywords": 5, "ai_count": 3, "fin_count": 2, "neural": 3,
+             "finance": 2},
+            {"title": "neural networks", "year": 2020, "total_keywords": 4, "ai_count": 4, "fin_count": 0,
+             "neural": 4, "finance": 0},
+            {"title": "finance survey", "year": 2019, "total_keywords": 1, "ai_count": 0, "fin_count": 1,
+             "neural": 0, "finance": 1},
+            {"title": "neural markets", "year": 2018, "total_keywords": 2, "ai_count": 1, "fin_count": 1,
+             "neural": 1, "finance": 1}]
+
+
+class TestFilterSortRecordsAndDataFrame(unittest.TestCase):
+
+    def setUp(self):
+        self.search_words = search_count.SearchWords({"ai": ["neural"], "fin": ["finance"]})
+        self.records = create_counts_records()
+        self.records_filter_sort = filter_sort.FilterSort(self.records, self.search_words, 2)
+        self.dataframe_filter_sort = filter_sort.FilterSort(pd.DataFrame(self.records), self.search_words, 2)
+
+    def test_top_k_dataframe_is_same_for_records_and_dataframe(self):
+        records_top_k_df = self.records_filter_sort.get_top_k_dataframe()
+        dataframe_top_k_df = self.dataframe_filter_sort.get_top_k_dataframe()
+        self.assertEqual(records_top_k_df["title"].tolist(), ["neural finance", "neural markets"])
+        pd.testing.assert_frame_equal(records_top_k_df.reset_index(drop=True),
+                                      dataframe_top_k_df.reset_index(drop=True), check_dtype=False)
+
+    def test_query_is_same_for_records_and_dataframe(self):
+        records_query_df = self.records_filter_sort.query("neural NOT fin", sort=False)
+        dataframe_query_df = self.dataframe_filter_sort.query("neural NOT fin", sort=False)
+        self.assertEqual(records_query_df["title"].tolist(), ["neural networks"])
+        self.assertEqual(dataframe_query_df["title"].tolist(), ["neural networks"])
+
+    def test_empty_selection_of_records_keeps_all_columns(self):
+        records_query_df = self.records_filter_sort.query("neural AND NOT neural", sort=False)
+        dataframe_query_df = self.dataframe_filter_sort.query("neural AND NOT neural", sort=False)
+        self.assertTrue(records_query_df.empty)
+        self.assertEqual(list(records_query_df.columns), list(self.records[0]))
+        self.assertEqual(list(records_query_df.columns), list(dataframe_query_df.columns))
+
+
+class TestPartitionedFilterSort(unittest.TestCase):
+
+    def setUp(self):
+        self.search_words = search_count.SearchWords({"ai": ["neural"], "fin": ["finance"]})
+        self.records = create_counts_records()
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        for part_number, start in enumerate(range(0, len(self.records), 2)):
+            pd.DataFrame(self.records[start:start + 2]).to_csv(
+                os.path.join(self.temporary_directory.name, f"part_{part_number}.csv"), index=False)
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def test_output_is_same_as_filter_sort_on_joined_files(self):
+        partitioned_filter_sort = filter_sort.PartitionedFilterSort(self.temporary_directory.name, self.search_words,
+                                                                    2, chunksize=1)
+        filter_sort_df = filter_sort.FilterSort(pd.DataFrame(self.records), self.search_words, 2).filter_and_sort()
+        partitioned_df = partitioned_filter_sort.filter_and_sort()
+        self.assertEqual(partitioned_filter_sort.number_of_articles, 4)
+        self.assertEqual(partitioned_df["title"].tolist(), filter_sort_df["title"].tolist())
+
+    def test_only_top_required_number_rows_are_kept(self):
+        for required_number in range(1, 5):
+            partitioned_filter_sort = filter_sort.PartitionedFilterSort(self.temporary_directory.name,
+                                                                        self.search_words, required_number, chunksize=1)
+            with mock.patch.object(partitioned_filter_sort, "get_top_rows",
+                                   wraps=partitioned_filter_sort.get_top_rows) as get_top_rows:
+                partitioned_df = partitioned_filter_sort.filter_and_sort()
+            top_k_df = filter_sort.FilterSort(self.records, self.search_words, required_number).get_top_k_dataframe()
+            self.assertEqual(partitioned_df["title"].tolist(), top_k_df["title"].tolist())
+            self.assertLessEqual(max(len(call.args[0].index) for call in get_top_rows.call_args_list),
+                                 required_number + 1)
+        self.assertEqual(partitioned_filter_sort.threshold_curve().tolist(),
+                         filter_sort.FilterSort(self.records, self.search_words, 2).threshold_curve().tolist())
+
+    def test_parquet_file_without_pyarrow_raises_import_error(self):
+        parquet_file_path = os.path.join(self.temporary_directory.name, "part_2.parquet")
+        open(parquet_file_path, "wb").close()
+        partitioned_filter_sort = filter_sort.PartitionedFilterSort(self.temporary_directory.name, self.search_words,
+                                                                    2)
+        with mock.patch.dict("sys.modules", {"pyarrow": None, "pyarrow.parquet": None}):
+            with self.assertRaises(ImportError):
+                partitioned_filter_sort.threshold_curve()
+
+
+class TestMissingCountsNormalization(unittest.TestCase):
+
+    def setUp(self):
+        self.search_words = search_count.SearchWords({"ai": ["neural"], "fin": ["finance"]})
+        self.counts_df = pd.DataFrame(create_counts_records())
+        self.counts_df.loc[1, ["fin_count", "finance"]] = np.nan
+        self.counts_df.loc[2, ["ai_count", "neural"]] = np.nan
+
+    def test_missing_group_count_is_zero_count(self):
+        np.testing.assert_array_equal(filter_sort.get_keywords_group_name_min_counts(self.counts_df), [2, 0, 0, 1])
+        self.assertEqual(filter_sort.filter_dataframe_on_keywords_group_name_count_to_dataframe(
+            self.counts_df, 1)["title"].tolist(), ["neural finance", "neural markets"])
+
+    def test_module_filter_and_sort_is_same_as_filter_sort(self):
+        for required_number in range(1, 5):
+            module_df = filter_sort.filter_and_sort(self.counts_df, self.search_words, required_number)
+            class_df = filter_sort.FilterSort(self.counts_df, self.search_words, required_number).filter_and_sort()
+            self.assertEqual(module_df["title"].tolist(), class_df["title"].tolist())
+
+
+class TestBooleanQuery(unittest.TestCase):
+
+    def setUp(self):
+        self.search_words = search_count.SearchWords({"ai": ["neural"], "fin": ["finance"]})
+        self.columns = ["total_keywords", "ai_count", "fin_count", "neural", "finance"]
+
+    def test_operators_precedence(self):
+        boolean_query = filter_sort.BooleanQuery("neural OR finance AND NOT ai", self.search_words, self.columns)
+        self.assertEqual(boolean_query.tree, ("or", [("term", "neural"), ("and", [
+            ("term", "finance"), ("not", ("term", "ai_count"))])]))
+        self.assertEqual(boolean_query.columns_names, ["ai_count", "finance", "neural"])
+
+    def test_parentheses_near_and_implicit_and(self):
+        boolean_query = filter_sort.BooleanQuery("(neural OR fin) NEAR/5 finance neural", self.search_words,
+                                                 self.columns)
+        self.assertEqual(boolean_query.tree, ("and", [
+            ("and", [("or", [("term", "neural"), ("term", "fin_count")]), ("term", "finance")]), ("term", "neural")]))
+
+    def test_invalid_queries_raise_value_error(self):
+        for query in ["", "neural AND", "(neural OR finance", "neural)", "OR finance", "survey"]:
+            with self.assertRaises(ValueError, msg=query):
+                filter_sort.BooleanQuery(query, self.search_words, self.columns)
+
+    def test_mask_treats_missing_count_as_absent(self):
+        counts_df = pd.DataFrame(create_counts_records()).astype({"finance": float})
+        counts_df.loc[0, "finance"] = np.nan
+        np.testing.assert_array_equal(filter_sort.BooleanQuery("neural NOT finance", self.search_words,
+                                                               self.columns).mask(counts_df),
+                                      [True, True, False, False])
+
+
+class TestIntegerCountsKernels(unittest.TestCase):
+
+    def setUp(self):
+        self.search_words = search_count.SearchWords({"ai": ["neural"], "fin": ["finance"]})
+        self.counts_df = pd.DataFrame(create_counts_records())
+        self.downcasted_counts_df = filter_sort.downcast_count_columns(self.counts_df[
+            filter_sort.get_count_columns_names(self.counts_df.columns,
+                                                self.search_words.get_sorting_keywords_criterion_list())])
+
+    def test_downcasted_counts_are_used_without_copy(self):
+        counts = self.downcasted_counts_df["ai_count"]
+        self.assertTrue(np.shares_memory(filter_sort.get_count_values(counts), counts.to_numpy()))
+        min_counts = filter_sort.get_keywords_group_name_min_counts(self.downcasted_counts_df)
+        self.assertEqual(min_counts.dtype.kind, "u")
+        np.testing.assert_array_equal(min_counts, [2, 0, 0, 1])
+
+    def test_missing_values_of_nullable_and_float_columns_are_zero(self):
+        np.testing.assert_array_equal(filter_sort.get_count_values(pd.Series([1, None], dtype="Int64")), [1, 0])
+        np.testing.assert_array_equal(filter_sort.get_count_values(pd.Series([2.0, np.nan])), [2, 0])
+
+    def test_relevance_scores_are_same_for_downcasted_counts(self):
+        for scoring_method in filter_sort.RelevanceScore.scoring_methods:
+            np.testing.assert_allclose(
+                filter_sort.RelevanceScore(self.downcasted_counts_df, self.search_words, scoring_method).score(),
+                filter_sort.RelevanceScore(self.counts_df.astype({"neural": float, "finance": float}),
+                                           self.search_words, scoring_method).score(), rtol=1e-6)
+
+
+class TestSelectMinLimit(unittest.TestCase):
+
+    def setUp(self):
+        self.search_words = search_count.SearchWords({"ai": ["neural"], "fin": ["finance"]})
+        self.records = create_counts_records()
+        self.filter_sort = filter_sort.FilterSort(self.records, self.search_words, 2)
+
+    def test_select_is_same_as_get_min_limit(self):
+        for required_number in range(0, 6):
+            self.assertEqual(self.filter_sort.select(required_number)[0], filter_sort.FilterSort(
+                self.records, self.search_words, required_number).get_min_limit(), msg=required_number)
+        self.assertEqual([self.filter_sort.select(required_number) for required_number in range(0, 6)],
+                         [(3, 0), (2, 1), (1, 2), (0, 4), (0, 4), (0, 4)])
+
+    def test_threshold_curve(self):
+        threshold_curve = self.filter_sort.threshold_curve()
+        self.assertEqual(threshold_curve.tolist(), [4, 2, 1, 0])
+        self.assertEqual(threshold_curve.index.name, "min_limit")
+        self.assertEqual(threshold_curve.name, "total_articles_rows")
+        for min_limit, total_articles_rows in threshold_curve.items():
+            self.assertEqual(len(filter_sort.filter_dataframe_on_keywords_group_name_count_to_dataframe(
+                pd.DataFrame(self.records), min_limit).index), total_articles_rows)
+
+
+class TestMinLimitForRequiredNumber(unittest.TestCase):
+
+    def test_largest_min_limit_leaving_required_number(self):
+        min_counts = np.random.default_rng(0).integers(0, 8, 50).astype(np.uint8)
+        min_limit_articles_counts = filter_sort.get_min_limit_articles_counts(min_counts)
+        for required_number in range(0, 53):
+            passing_min_limits = [min_limit for min_limit in range(len(min_limit_articles_counts))
+                                  if np.count_nonzero(min_counts >= min_limit) >= required_number]
+            self.assertEqual(filter_sort.get_min_limit_for_required_number(min_limit_articles_counts, required_number),
+                             max(passing_min_limits, default=0), msg=required_number)
+
+    def test_find_near_required_min_limit_does_not_print(self):
+        min_limit_articles_counts = filter_sort.get_min_limit_articles_counts(np.array([2, 0, 0, 1]))
+        with mock.patch("builtins.print") as print_mock:
+            self.assertEqual(filter_sort.find_near_required_min_limit(min_limit_articles_counts, 2, 4),
+                             ([1, 2], None, None))
+            self.assertEqual(filter_sort.find_near_required_min_limit(min_limit_articles_counts, 3, 4),
+                             (None, [1, 2], [0, 4]))
+            self.assertEqual(filter_sort.find_near_required_min_limit(min_limit_articles_counts, 5, 4),
+                             (None, [0, 4], [0, 4]))
+        print_mock.assert_not_called()
+
+    def test_min_limit_articles_counts_end_with_zero(self):
+        np.testing.assert_array_equal(filter_sort.get_min_limit_articles_counts(np.array([2, 0, 0, 1])),
+                                      [4, 2, 1, 0])
+        np.testing.assert_array_equal(filter_sort.get_min_limit_articles_counts(np.full(3, np.nan)), [0])
+
+    def test_screening_without_groups_keeps_all_rows(self):
+        screening_session = filter_sort.ScreeningSession(create_counts_records(), search_count.SearchWords(
+            {"ai": ["neural"], "fin": ["finance"]}))
+        self.assertEqual(sorted(screening_session.screen(1, groups_names=[], include_keywords=["neural"])["title"]),
+                         ["neural finance", "neural markets", "neural networks"])
+
+
+class TestScreeningSession(unittest.TestCase):
+
+    def setUp(self):
+        self.search_words = search_count.SearchWords({"ai": ["neural"], "fin": ["finance"]})
+        self.records = create_counts_records()
+        self.screening_session = filter_sort.ScreeningSession(self.records, self.search_words)
+
+    def test_repeated_variant_is_from_cache_and_same_as_filter_sort(self):
+        for required_number in range(1, 5):
+            with mock.patch.object(self.screening_session.filter_sort, "get_sorted_dataframe",
+                                   wraps=self.screening_session.filter_sort.get_sorted_dataframe) as sorted_dataframe:
+                first_df = self.screening_session.screen(required_number)
+                second_df = self.screening_session.screen(required_number)
+            self.assertEqual(sorted_dataframe.call_count, 1)
+            pd.testing.assert_frame_equal(first_df, second_df)
+            pd.testing.assert_frame_equal(
+                first_df.reset_index(drop=True),
+                filter_sort.FilterSort(self.records, self.search_words, required_number).filter_and_sort().reset_index(
+                    drop=True), check_dtype=False)
+
+    def test_changing_result_does_not_change_cache(self):
+        screened_df = self.screening_session.screen(2)
+        screened_df.loc[:, "title"] = "changed"
+        screened_df.drop(index=screened_df.index, inplace=True)
+        self.assertEqual(self.screening_session.screen(2)["title"].tolist(), ["neural finance", "neural markets"])
+
+
+class TestRecordsListToCountsDataFrame(unittest.TestCase):
+
+    def test_count_columns_of_any_record_are_kept(self):
+        records = create_counts_records()
+        records[0] = {key: value for key, value in records[0].items() if key != "fin_count"}
+        records[2]["extra_count"] = 7
+        counts_df = filter_sort.records_list_to_counts_dataframe(records, ["total_keywords", "neural", "finance"])
+        self.assertEqual(list(counts_df.columns), ["total_keywords", "neural", "finance", "ai_count", "fin_count",
+                                                   "extra_count"])
+        self.assertTrue(np.isnan(counts_df.loc[0, "fin_count"]))
+        self.assertEqual(counts_df["extra_count"].tolist()[2], 7)
+        self.assertEqual(filter_sort.get_keywords_group_name_min_counts(counts_df[["ai_count", "fin_count"]]).tolist(),
+                         [0, 0, 0, 1])
+
+
+class TestFilterOnKeywordsGroupNameCount(unittest.TestCase):
+
+    def setUp(self):
+        self.counts_df = pd.DataFrame(create_counts_records())
+
+    def test_records_are_rows_passing_min_counts(self):
+        for min_limit in range(0, 4):
+            filtered_records = filter_sort.filter_dataframe_on_keywords_group_name_count(self.counts_df, min_limit)
+            self.assertEqual(filtered_records, self.counts_df[filter_sort.get_keywords_group_name_min_counts(
+                self.counts_df) >= min_limit].to_dict("records"), msg=min_limit)
+        self.assertEqual([record["title"] for record in filter_sort.filter_dataframe_on_keywords_group_name_count(
+            self.counts_df, 2)], ["neural finance"])
+
+    def test_missing_count_fails_filter(self):
+        self.counts_df.loc[0, "fin_count"] = np.nan
+        self.assertEqual([record["title"] for record in filter_sort.filter_dataframe_on_keywords_group_name_count(
+            self.counts_df, 1)], ["neural markets"])
+        self.assertEqual(len(filter_sort.filter_dataframe_on_keywords_group_name_count(self.counts_df, 0)), 4)
+
+    def test_min_counts_kernel_is_used(self):
+        with mock.patch.object(filter_sort, "get_keywords_group_name_min_counts",
+                               wraps=filter_sort.get_keywords_group_name_min_counts) as min_counts:
+            filter_sort.filter_dataframe_on_keywords_group_name_count(self.counts_df, 1)
+        min_counts.assert_called_once()
+
+
+class TestRelevanceScore(unittest.TestCase):
+
+    def setUp(self):
+        self.search_words = search_count.SearchWords({"ai": ["neural"], "fin": ["finance"]})
+        self.records = [{"title": "a", "neural": 2, "finance": 1, "words": 6},
+                        {"title": "b", "neural": 0, "finance": 1, "words": 2},
+                        {"title": "c", "neural": 1, "finance": 0, "words": 4}]
+        # both keywords are in 2 of 3 articles, so idf is log(1 + (3 - 2 + 0.5) / (2 + 0.5)).
+        self.idf = np.log(1.6)
+
+    def test_bm25_with_document_length_column(self):
+        # average length is 4, k1 is 1.2 and b is 0.75.
+        first_normalization = 1.2 * (0.25 + 0.75 * 6 / 4)
+        expected_scores = [self.idf * (2 * 2.2 / (2 + first_normalization) + 2.2 / (1 + first_normalization)),
+                           self.idf * 2.2 / (1 + 1.2 * (0.25 + 0.75 * 2 / 4)),
+                           self.idf * 2.2 / (1 + 1.2 * (0.25 + 0.75 * 4 / 4))]
+        np.testing.assert_allclose(filter_sort.RelevanceScore(self.records, self.search_words, "bm25", "words").score(),
+                                   expected_scores, rtol=1e-6)
+
+    def test_tf_idf_with_document_length_column(self):
+        np.testing.assert_allclose(filter_sort.RelevanceScore(self.records, self.search_words, "tf_idf",
+                                                              "words").score(),
+                                   [self.idf * (2 / 6 + 1 / 6), self.idf / 2, self.idf / 4], rtol=1e-6)
+
+    def test_default_document_length_is_keywords_hits(self):
+        # keywords hits are 3, 1 and 1, so average is 5 / 3.
+        first_normalization = 1.2 * (0.25 + 0.75 * 9 / 5)
+        expected_scores = [self.idf * (2 * 2.2 / (2 + first_normalization) + 2.2 / (1 + first_normalization)),
+                           self.idf * 2.2 / (1 + 1.2 * (0.25 + 0.75 * 3 / 5)),
+                           self.idf * 2.2 / (1 + 1.2 * (0.25 + 0.75 * 3 / 5))]
+        np.testing.assert_allclose(filter_sort.RelevanceScore(self.records, self.search_words).score(),
+                                   expected_scores, rtol=1e-6)
+
+    def test_missing_document_length_column_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            filter_sort.RelevanceScore(self.records, self.search_words, "bm25", "length")
+        with self.assertRaises(ValueError):
+            filter_sort.FilterSort(self.records, self.search_words, 2).get_relevance_ranked_dataframe(
+                document_length_column_name="length")
+
+    def test_filter_sort_uses_document_length_column_of_data(self):
+        relevance_scores = filter_sort.RelevanceScore(self.records, self.search_words, "bm25", "words").score()
+        for data in (self.records, pd.DataFrame(self.records)):
+            ranked_df = filter_sort.FilterSort(data, self.search_words, 3).get_relevance_ranked_dataframe(
+                document_length_column_name="words")
+            np.testing.assert_allclose(ranked_df["relevance_score"].to_numpy(), np.sort(relevance_scores)[::-1],
+                                       rtol=1e-6)
+
+
+if __name__ == '__main__':
+    unittest.main()
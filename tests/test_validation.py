@@ -0,0 +1,117 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from systematic_review import converter, validation
+from tests.test_converter import create_pdf_file
+
+
+class TestValidationWithPdfExtractionPool(unittest.TestCase):
+
+    def setUp(self):
+        try:
+            import fitz
+        except ImportError:
+            self.skipTest("pymupdf is not installed")
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.papers_directory_path = os.path.join(self.temporary_directory.name, "papers")
+        os.makedirs(self.papers_directory_path)
+        create_pdf_file(os.path.join(self.papers_directory_path, "deep learning for finance.pdf"),
+                        ["Deep learning for finance"])
+        self.inaccessible_file_path = os.path.join(self.temporary_directory.name, "inaccessible.txt")
+        open(self.inaccessible_file_path, "w").close()
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def test_pymupdf_fallback_is_extracted_in_pool(self):
+        pool = converter.PdfExtractionPool(os.path.join(self.temporary_directory.name, "cache"), processes=1,
+                                           timeout=60)
+        citations = [{"title": "Deep learning for finance", "cleaned_title": "deep learning for finance"}]
+        records = validation.Validation(citations, self.papers_directory_path, self.inaccessible_file_path,
+                                        pdf_extraction_pool=pool).check()
+        self.assertEqual(records[0]["downloaded"], "yes")
+        self.assertIsNotNone(pool.pdf_text_cache.get_pages(records[0]["file location"], "pymupdf"))
+
+
+class TestFindingMissedArticlesUsingTitleIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.title_index = converter.TitleIndex.build(
+            ["Deep learning for finance", "Deep learning in finance", "Graph networks for credit risk"],
+            os.path.join(self.temporary_directory.name, "title_index"), record_ids=[0, 0, 1])
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def test_file_names_are_matched_on_record_ids(self):
+        missing_articles, downloaded_articles = validation.finding_missed_articles_using_title_index(
+            ["papers/Deep learning in finance.pdf"],
+            ["deep learning for finance", "graph networks for credit risk"], self.title_index)
+        self.assertEqual(downloaded_articles, ["deep learning for finance"])
+        self.assertEqual(missing_articles, ["graph networks for credit risk"])
+
+
+class TestResearchPaperTitleChecker(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        inaccessible_file_path = os.path.join(self.temporary_directory.name, "inaccessible.txt")
+        open(inaccessible_file_path, "w").close()
+        self.validation = validation.Validation([{"title": "Deep learning for finance",
+                                                  "cleaned_title": "deep learning for finance"}],
+                                                self.temporary_directory.name, inaccessible_file_path)
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def test_title_split_across_pages_is_found_without_fuzzy_methods(self):
+        title_checker = self.validation.research_paper_title_checker("deep learning for finance")
+        with mock.patch.object(validation.ValidateWordsInText, "multiple_methods") as multiple_methods:
+            self.assertFalse(title_checker("Abstract. This paper is on Deep"))
+            self.assertFalse(title_checker("Learning"))
+            self.assertTrue(title_checker("for Finance and markets."))
+        multiple_methods.assert_not_called()
+
+    def test_title_words_out_of_sequence_are_not_found(self):
+        title_checker = self.validation.research_paper_title_checker("deep learning for finance")
+        self.assertFalse(title_checker("finance for deep learning"))
+        self.assertFalse(self.validation.research_paper_title_checker("")("any text"))
+
+
+class TestValidationWithTitleIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.papers_directory_path = os.path.join(self.temporary_directory.name, "papers")
+        os.makedirs(self.papers_directory_path)
+        for file_name in ["Deep learning in finance.txt", "Unrelated notes.txt"]:
+            with open(os.path.join(self.papers_directory_path, file_name), "w") as file:
+                file.write("Deep learning for finance")
+        self.title_index = converter.TitleIndex.build(
+            ["deep learning for finance", "deep learning in finance", "graph networks for credit risk"],
+            os.path.join(self.temporary_directory.name, "title_index"), record_ids=[0, 0, 1], normalized=True)
+        self.citations = [{"title": "Deep learning for finance", "cleaned_title": "deep learning for finance"},
+                          {"title": "Graph networks for credit risk",
+                           "cleaned_title": "graph networks for credit risk"}]
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def test_files_are_matched_to_citations_on_record_ids(self):
+        with mock.patch("builtins.print") as print_mock:
+            validation_object = validation.Validation(self.citations, self.papers_directory_path,
+                                                      title_index=self.title_index)
+        file_path = os.path.join(self.papers_directory_path, "Deep learning in finance.txt")
+        self.assertEqual(validation_object.file_name_and_path_mapping["deep learning for finance"], file_path)
+        self.assertNotIn("graph networks for credit risk", validation_object.file_name_and_path_mapping)
+        self.assertIn("Unrelated notes.txt", print_mock.call_args.args[0])
+        records = validation_object.check()
+        self.assertEqual([record["downloaded"] for record in records], ["yes", "no"])
+        self.assertEqual(records[0]["file location"], file_path)
+
+
+if __name__ == '__main__':
+    unittest.main()